@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import asyncio
+from contextlib import asynccontextmanager
+import hmac
 from pathlib import Path
 import inspect
-from typing import Any
+from typing import Any, AsyncIterator
 
-from fastapi import FastAPI, Header, HTTPException, Response
+from fastapi import FastAPI, Header, HTTPException, Query, Response
 from pydantic import BaseModel, Field
 
+from skillos.metrics_registry import (
+    PROMETHEUS_CONTENT_TYPE,
+    metrics_endpoint_config_from_env,
+    metrics_registry,
+)
 from skillos.jwt_auth import JwtValidationError, decode_jwt, jwt_config_from_env
 from skillos.orchestrator import Orchestrator
+from skillos.profiler import ProfilerBusyError, profile_process, profiler_config_from_env
+from skillos.telemetry import close_event_logs
 from skillos.tenancy import resolve_tenant_root, tenant_id_from_path
 from skillos.connectors import resolve_skills_root
 from skillos.skills.deprecation import deprecate_skill, undeprecate_skill
@@ -42,7 +51,14 @@ def _ensure_httpx_testclient_compat() -> None:
 _ensure_httpx_testclient_compat()
 
 
-app = FastAPI(title="SkillOS API", version="0.1.0")
+@asynccontextmanager
+async def _lifespan(_: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Buffered event logs must reach disk before the worker exits.
+    close_event_logs()
+
+
+app = FastAPI(title="SkillOS API", version="0.1.0", lifespan=_lifespan)
 
 
 class RunRequest(BaseModel):
@@ -145,6 +161,62 @@ def health(response: Response) -> dict[str, object]:
     }
 
 
+@app.get("/metrics")
+def metrics(
+    x_skillos_metrics_token: str | None = Header(default=None),
+    authorization: str | None = Header(default=None),
+) -> Response:
+    # Series are labelled with every tenant's skill and connector ids, so the
+    # endpoint is off by default and, like /admin/profile, needs a token.
+    config = metrics_endpoint_config_from_env()
+    if not config.enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not config.token:
+        raise HTTPException(status_code=403, detail="metrics_token_not_configured")
+    token = x_skillos_metrics_token
+    if token is None and authorization and authorization.startswith("Bearer "):
+        # Prometheus scrape configs send the token as a bearer credential.
+        token = authorization[len("Bearer ") :].strip()
+    if not token or not hmac.compare_digest(token, config.token):
+        raise HTTPException(status_code=401, detail="invalid_metrics_token")
+    return Response(
+        content=metrics_registry().render(), media_type=PROMETHEUS_CONTENT_TYPE
+    )
+
+
+@app.post("/admin/profile")
+async def profile(
+    seconds: float = Query(default=30.0, gt=0),
+    interval_ms: float | None = Query(default=None, gt=0),
+    include_idle: bool = False,
+    x_skillos_profile_token: str | None = Header(default=None),
+) -> Response:
+    config = profiler_config_from_env()
+    if not config.enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not config.token:
+        raise HTTPException(status_code=403, detail="profile_token_not_configured")
+    if not x_skillos_profile_token or not hmac.compare_digest(
+        x_skillos_profile_token, config.token
+    ):
+        raise HTTPException(status_code=401, detail="invalid_profile_token")
+    try:
+        sampler = await asyncio.to_thread(
+            profile_process,
+            seconds,
+            interval_ms=interval_ms,
+            include_idle=include_idle,
+            config=config,
+        )
+    except ProfilerBusyError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from exc
+    return Response(
+        content=sampler.collapsed(),
+        media_type="text/plain; charset=utf-8",
+        headers={"X-Profile-Samples": str(sampler.samples)},
+    )
+
+
 @app.post("/run", response_model=RunResponse)
 async def run_query(
     request: RunRequest,
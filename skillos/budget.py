@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import atexit
 from contextlib import contextmanager
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from dataclasses import dataclass, replace
+from datetime import datetime, timedelta, timezone
 import hashlib
 import os
 from pathlib import Path
+import threading
+import time
 from typing import Callable, Iterator
 import json
 
+from skillos.state_store import default_state_db_path, state_database
 from skillos.storage import atomic_write_text, file_lock
 from skillos.tenancy import resolve_tenant_root
 from skillos.storage_backend import (
@@ -37,6 +41,16 @@ def _env_float(name: str, default: float) -> float:
         return default
 
 
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
 @dataclass(frozen=True)
 class BudgetConfig:
     per_request_limit: float = 5.0
@@ -47,6 +61,9 @@ class BudgetConfig:
     cheap_model: str = "budget"
     standard_cost: float = 1.0
     cheap_cost: float = 0.5
+    lease_fraction: float = 0.0
+    lease_ttl_seconds: float = 30.0
+    lease_max: float = 0.0
 
 
 def budget_config_from_env() -> BudgetConfig:
@@ -57,6 +74,22 @@ def budget_config_from_env() -> BudgetConfig:
         low_remaining_threshold=_env_float("SKILLOS_BUDGET_LOW_REMAINING", 10.0),
         standard_cost=_env_float("SKILLOS_MODEL_STANDARD_COST", 1.0),
         cheap_cost=_env_float("SKILLOS_MODEL_CHEAP_COST", 0.5),
+        lease_fraction=min(max(_env_float("SKILLOS_BUDGET_LEASE_FRACTION", 0.0), 0.0), 1.0),
+        lease_ttl_seconds=max(_env_float("SKILLOS_BUDGET_LEASE_TTL_SECONDS", 30.0), 0.0),
+        lease_max=max(_env_float("SKILLOS_BUDGET_LEASE_MAX", 0.0), 0.0),
+    )
+
+
+@dataclass(frozen=True)
+class BudgetRetentionConfig:
+    keep_days: int = 90
+    keep_months: int = 24
+
+
+def budget_retention_config_from_env() -> BudgetRetentionConfig:
+    return BudgetRetentionConfig(
+        keep_days=max(_env_int("SKILLOS_BUDGET_RETENTION_DAYS", 90), 1),
+        keep_months=max(_env_int("SKILLOS_BUDGET_RETENTION_MONTHS", 24), 1),
     )
 
 
@@ -101,7 +134,121 @@ class BudgetUsageStore:
         )
 
 
+class BudgetUsageStoreSqlite:
+    """Budget usage as one row per period in the runtime state database."""
+
+    def __init__(self, path: Path, *, legacy_path: Path | None = None) -> None:
+        self.path = Path(path)
+        self._db = state_database(self.path)
+        self._db.ensure_schema(
+            "budget",
+            [
+                """
+                CREATE TABLE IF NOT EXISTS budget_usage (
+                    period_kind TEXT NOT NULL,
+                    period_key TEXT NOT NULL,
+                    spent REAL NOT NULL,
+                    PRIMARY KEY (period_kind, period_key)
+                )
+                """
+            ],
+            importer=self._importer(legacy_path),
+        )
+
+    def load(self) -> BudgetUsage:
+        rows = self._db.execute(
+            "SELECT period_kind, period_key, spent FROM budget_usage"
+        ).fetchall()
+        return _usage_from_rows(rows)
+
+    def save(self, usage: BudgetUsage) -> None:
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM budget_usage")
+            _insert_usage(conn, usage)
+
+    def load_periods(self, day_key: str, month_key: str) -> BudgetUsage:
+        rows = self._db.execute(
+            """
+            SELECT period_kind, period_key, spent FROM budget_usage
+            WHERE (period_kind = 'daily' AND period_key = ?)
+            OR (period_kind = 'monthly' AND period_key = ?)
+            """,
+            (day_key, month_key),
+        ).fetchall()
+        return _usage_from_rows(rows)
+
+    def add_usage(self, day_key: str, month_key: str, amount: float) -> None:
+        with self._db.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO budget_usage (period_kind, period_key, spent)
+                VALUES (?, ?, ?)
+                ON CONFLICT (period_kind, period_key)
+                DO UPDATE SET spent = spent + excluded.spent
+                """,
+                [("daily", day_key, amount), ("monthly", month_key, amount)],
+            )
+
+    def prune(self, before_day: str, before_month: str) -> int:
+        cursor = self._db.execute(
+            """
+            DELETE FROM budget_usage
+            WHERE (period_kind = 'daily' AND period_key < ?)
+            OR (period_kind = 'monthly' AND period_key < ?)
+            """,
+            (before_day, before_month),
+        )
+        return cursor.rowcount
+
+    @contextmanager
+    def transaction(self) -> Iterator["BudgetUsageStoreSqlite"]:
+        with self._db.transaction():
+            yield self
+
+    def _importer(self, legacy_path: Path | None):
+        if legacy_path is None or not Path(legacy_path).exists():
+            return None
+
+        def _import(conn) -> None:
+            _insert_usage(conn, BudgetUsageStore(legacy_path).load())
+
+        return _import
+
+
+def _usage_from_rows(rows) -> BudgetUsage:
+    usage = BudgetUsage(daily={}, monthly={})
+    for row in rows:
+        periods = usage.daily if row["period_kind"] == "daily" else usage.monthly
+        periods[row["period_key"]] = float(row["spent"])
+    return usage
+
+
+def _insert_usage(conn, usage: BudgetUsage) -> None:
+    conn.executemany(
+        "INSERT INTO budget_usage (period_kind, period_key, spent) VALUES (?, ?, ?)",
+        [("daily", key, value) for key, value in usage.daily.items()]
+        + [("monthly", key, value) for key, value in usage.monthly.items()],
+    )
+
+
+# (dsn, schema) pairs whose ledger table and legacy import are done in this
+# process; the DDL and its advisory lock then run once, not per store.
+_LEDGER_READY: set[tuple[str, str]] = set()
+_LEDGER_READY_LOCK = threading.Lock()
+
+
+def _reset_ledger_lock_after_fork() -> None:
+    global _LEDGER_READY_LOCK
+    _LEDGER_READY_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_ledger_lock_after_fork)
+
+
 class BudgetUsageStorePostgres:
+    """Budget usage as a per-tenant ledger with one row per period."""
+
     def __init__(self, dsn: str, *, tenant_id: str, schema: str = "skillos") -> None:
         self._dsn = dsn
         self._tenant_id = tenant_id
@@ -109,52 +256,123 @@ class BudgetUsageStorePostgres:
         self._ensure_table()
 
     def load(self) -> BudgetUsage:
-        query = (
-            f"SELECT daily, monthly FROM {self._schema}.budget_usage "
-            "WHERE tenant_id = %s"
-        )
-        with pg_connect(self._dsn) as conn:
-            row = conn.execute(query, (self._tenant_id,)).fetchone()
-        if not row:
-            return BudgetUsage(daily={}, monthly={})
-        daily = row.get("daily") or {}
-        monthly = row.get("monthly") or {}
-        return BudgetUsage(
-            daily={key: float(value) for key, value in daily.items()},
-            monthly={key: float(value) for key, value in monthly.items()},
-        )
+        with self._ledger() as ledger:
+            return ledger.load()
 
     def save(self, usage: BudgetUsage) -> None:
-        query = (
-            f"INSERT INTO {self._schema}.budget_usage "
-            "(tenant_id, daily, monthly) "
-            "VALUES (%s, %s::jsonb, %s::jsonb) "
-            "ON CONFLICT (tenant_id) DO UPDATE SET "
-            "daily = EXCLUDED.daily, monthly = EXCLUDED.monthly, updated_at = now()"
-        )
-        with pg_connect(self._dsn) as conn:
-            conn.execute(
-                query,
-                (
-                    self._tenant_id,
-                    json.dumps(usage.daily, ensure_ascii=True),
-                    json.dumps(usage.monthly, ensure_ascii=True),
-                ),
+        with self._ledger() as ledger:
+            ledger.save(usage)
+
+    def load_periods(self, day_key: str, month_key: str) -> BudgetUsage:
+        with self._ledger() as ledger:
+            return ledger.load_periods(day_key, month_key)
+
+    def add_usage(self, day_key: str, month_key: str, amount: float) -> None:
+        with self._ledger() as ledger:
+            ledger.add_usage(day_key, month_key, amount)
+
+    def try_charge(
+        self,
+        day_key: str,
+        month_key: str,
+        amount: float,
+        daily_limit: float,
+        monthly_limit: float,
+    ) -> str | None:
+        with self._ledger() as ledger:
+            return ledger.try_charge(
+                day_key, month_key, amount, daily_limit, monthly_limit
             )
 
+    @contextmanager
+    def session(self) -> Iterator["_BudgetUsageStorePostgresTx"]:
+        """One connection for a read followed by ``try_charge``, unlocked."""
+        with self._ledger() as ledger:
+            yield ledger
+
+    def prune(self, before_day: str, before_month: str) -> int:
+        with self._ledger() as ledger:
+            return ledger.prune(before_day, before_month)
+
     def _ensure_table(self) -> None:
+        key = (self._dsn, self._schema)
+        if key in _LEDGER_READY:
+            return
+        with _LEDGER_READY_LOCK:
+            if key in _LEDGER_READY:
+                return
+            self._create_table()
+            _LEDGER_READY.add(key)
+
+    def _create_table(self) -> None:
         with pg_connect(self._dsn) as conn:
+            # Serialize setup so only one process imports the legacy blobs.
+            conn.execute(
+                "SELECT pg_advisory_xact_lock(%s)",
+                (_advisory_lock_key(f"{self._schema}:budget_ledger"),),
+            )
             conn.execute(f"CREATE SCHEMA IF NOT EXISTS {self._schema}")
             conn.execute(
                 f"""
-                CREATE TABLE IF NOT EXISTS {self._schema}.budget_usage (
-                    tenant_id TEXT PRIMARY KEY,
-                    daily JSONB NOT NULL,
-                    monthly JSONB NOT NULL,
-                    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+                CREATE TABLE IF NOT EXISTS {self._schema}.budget_ledger (
+                    tenant_id TEXT NOT NULL,
+                    period_kind TEXT NOT NULL,
+                    period_key TEXT NOT NULL,
+                    spent DOUBLE PRECISION NOT NULL,
+                    updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                    PRIMARY KEY (tenant_id, period_kind, period_key)
+                )
+                """
+            )
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self._schema}.state_migrations (
+                    domain TEXT PRIMARY KEY
                 )
                 """
             )
+            legacy = conn.execute(
+                "SELECT to_regclass(%s) AS name",
+                (f"{self._schema}.budget_usage",),
+            ).fetchone()
+            if not legacy or not legacy.get("name"):
+                return
+            imported = conn.execute(
+                f"SELECT 1 FROM {self._schema}.state_migrations WHERE domain = %s",
+                ("budget_ledger",),
+            ).fetchone()
+            if imported is None:
+                self._import_legacy(conn)
+
+    def _import_legacy(self, conn) -> None:
+        # Spread the old JSONB blobs into ledger rows and record the import.
+        # budget_usage stays in place: workers still on the previous release
+        # keep reading and writing it during a rolling deploy.
+        conn.execute(
+            f"""
+            INSERT INTO {self._schema}.budget_ledger
+                (tenant_id, period_kind, period_key, spent)
+            SELECT tenant_id, 'daily', entry.key, entry.value::float8
+            FROM {self._schema}.budget_usage, jsonb_each_text(daily) AS entry
+            UNION ALL
+            SELECT tenant_id, 'monthly', entry.key, entry.value::float8
+            FROM {self._schema}.budget_usage, jsonb_each_text(monthly) AS entry
+            ON CONFLICT (tenant_id, period_kind, period_key) DO NOTHING
+            """
+        )
+        conn.execute(
+            f"INSERT INTO {self._schema}.state_migrations (domain) VALUES (%s)",
+            ("budget_ledger",),
+        )
+
+    @contextmanager
+    def _ledger(self) -> Iterator["_BudgetUsageStorePostgresTx"]:
+        with pg_connect(self._dsn) as conn:
+            yield _BudgetUsageStorePostgresTx(
+                conn,
+                tenant_id=self._tenant_id,
+                schema=self._schema,
+            )
 
     @contextmanager
     def transaction(self) -> Iterator["_BudgetUsageStorePostgresTx"]:
@@ -176,44 +394,130 @@ class _BudgetUsageStorePostgresTx:
 
     def load(self) -> BudgetUsage:
         query = (
-            f"SELECT daily, monthly FROM {self._schema}.budget_usage "
+            f"SELECT period_kind, period_key, spent FROM {self._schema}.budget_ledger "
             "WHERE tenant_id = %s"
         )
-        row = self._conn.execute(query, (self._tenant_id,)).fetchone()
-        if not row:
-            return BudgetUsage(daily={}, monthly={})
-        daily = row.get("daily") or {}
-        monthly = row.get("monthly") or {}
-        return BudgetUsage(
-            daily={key: float(value) for key, value in daily.items()},
-            monthly={key: float(value) for key, value in monthly.items()},
-        )
+        rows = self._conn.execute(query, (self._tenant_id,)).fetchall()
+        return _usage_from_rows(rows)
 
     def save(self, usage: BudgetUsage) -> None:
+        self._conn.execute(
+            f"DELETE FROM {self._schema}.budget_ledger WHERE tenant_id = %s",
+            (self._tenant_id,),
+        )
+        rows = [
+            (self._tenant_id, "daily", key, value) for key, value in usage.daily.items()
+        ] + [
+            (self._tenant_id, "monthly", key, value)
+            for key, value in usage.monthly.items()
+        ]
+        with self._conn.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {self._schema}.budget_ledger "
+                "(tenant_id, period_kind, period_key, spent) VALUES (%s, %s, %s, %s)",
+                rows,
+            )
+
+    def load_periods(self, day_key: str, month_key: str) -> BudgetUsage:
+        query = (
+            f"SELECT period_kind, period_key, spent FROM {self._schema}.budget_ledger "
+            "WHERE tenant_id = %s AND ("
+            "(period_kind = 'daily' AND period_key = %s) "
+            "OR (period_kind = 'monthly' AND period_key = %s))"
+        )
+        rows = self._conn.execute(
+            query, (self._tenant_id, day_key, month_key)
+        ).fetchall()
+        return _usage_from_rows(rows)
+
+    def try_charge(
+        self,
+        day_key: str,
+        month_key: str,
+        amount: float,
+        daily_limit: float,
+        monthly_limit: float,
+    ) -> str | None:
+        """Charge ``amount`` to both periods only if neither limit is exceeded.
+
+        A single conditional upsert checks and increments both rows; row
+        locks serialize concurrent charges, so no advisory lock is needed.
+        Returns ``None`` once charged, otherwise the period kind
+        (``"daily"`` or ``"monthly"``) whose limit refused the charge.
+        """
+        query = (
+            f"INSERT INTO {self._schema}.budget_ledger AS ledger "
+            "(tenant_id, period_kind, period_key, spent) "
+            "SELECT %(tenant_id)s, period.kind, period.key, %(amount)s "
+            "FROM (VALUES ('daily', %(day_key)s, %(daily_limit)s::float8), "
+            "('monthly', %(month_key)s, %(monthly_limit)s::float8)) "
+            "AS period(kind, key, cap) "
+            "WHERE %(amount)s::float8 <= period.cap "
+            "ON CONFLICT (tenant_id, period_kind, period_key) DO UPDATE SET "
+            "spent = ledger.spent + EXCLUDED.spent, updated_at = now() "
+            "WHERE ledger.spent + EXCLUDED.spent <= CASE EXCLUDED.period_kind "
+            "WHEN 'daily' THEN %(daily_limit)s::float8 "
+            "ELSE %(monthly_limit)s::float8 END "
+            "RETURNING period_kind"
+        )
+        rows = self._conn.execute(
+            query,
+            {
+                "tenant_id": self._tenant_id,
+                "day_key": day_key,
+                "month_key": month_key,
+                "amount": amount,
+                "daily_limit": daily_limit,
+                "monthly_limit": monthly_limit,
+            },
+        ).fetchall()
+        charged = {row["period_kind"] for row in rows}
+        if len(charged) == 2:
+            return None
+        # One period fitted and was incremented; undo it with the other.
+        self._conn.rollback()
+        return "daily" if "daily" not in charged else "monthly"
+
+    def add_usage(self, day_key: str, month_key: str, amount: float) -> None:
+        # Daily before monthly, as in ``try_charge``, so row locks are always
+        # taken in the same order.
         query = (
-            f"INSERT INTO {self._schema}.budget_usage "
-            "(tenant_id, daily, monthly) "
-            "VALUES (%s, %s::jsonb, %s::jsonb) "
-            "ON CONFLICT (tenant_id) DO UPDATE SET "
-            "daily = EXCLUDED.daily, monthly = EXCLUDED.monthly, updated_at = now()"
+            f"INSERT INTO {self._schema}.budget_ledger AS ledger "
+            "(tenant_id, period_kind, period_key, spent) "
+            "VALUES (%s, 'daily', %s, %s), (%s, 'monthly', %s, %s) "
+            "ON CONFLICT (tenant_id, period_kind, period_key) DO UPDATE SET "
+            "spent = ledger.spent + EXCLUDED.spent, updated_at = now()"
         )
         self._conn.execute(
             query,
-            (
-                self._tenant_id,
-                json.dumps(usage.daily, ensure_ascii=True),
-                json.dumps(usage.monthly, ensure_ascii=True),
-            ),
+            (self._tenant_id, day_key, amount, self._tenant_id, month_key, amount),
         )
 
+    def prune(self, before_day: str, before_month: str) -> int:
+        query = (
+            f"DELETE FROM {self._schema}.budget_ledger WHERE tenant_id = %s AND ("
+            "(period_kind = 'daily' AND period_key < %s) "
+            "OR (period_kind = 'monthly' AND period_key < %s))"
+        )
+        cursor = self._conn.execute(
+            query, (self._tenant_id, before_day, before_month)
+        )
+        return cursor.rowcount
+
 
 def _advisory_lock_key(tenant_id: str) -> int:
     digest = hashlib.blake2b(tenant_id.encode("utf-8"), digest_size=8).digest()
     return int.from_bytes(digest, "big", signed=True)
 
 
-def budget_usage_store_from_env(root: Path) -> BudgetUsageStore | BudgetUsageStorePostgres:
+def budget_usage_store_from_env(
+    root: Path,
+) -> BudgetUsageStore | BudgetUsageStoreSqlite | BudgetUsageStorePostgres:
     config = storage_backend_from_env()
+    if config.backend == "sqlite":
+        return BudgetUsageStoreSqlite(
+            default_state_db_path(root), legacy_path=default_budget_path(root)
+        )
     if config.backend != "postgres":
         return BudgetUsageStore(default_budget_path(root))
     dsn = require_postgres_dsn(config, context="budget")
@@ -225,6 +529,103 @@ def budget_usage_store_from_env(root: Path) -> BudgetUsageStore | BudgetUsageSto
     )
 
 
+def prune_budget_usage(
+    store,
+    config: BudgetRetentionConfig | None = None,
+    *,
+    now: datetime | None = None,
+) -> int:
+    """Drop usage periods older than the retention window; returns the count."""
+    config = config or BudgetRetentionConfig()
+    now = now or _utc_now()
+    before_day = (now.date() - timedelta(days=config.keep_days)).isoformat()
+    months = now.year * 12 + now.month - 1 - config.keep_months
+    before_month = f"{months // 12:04d}-{months % 12 + 1:02d}"
+    if hasattr(store, "prune"):
+        return store.prune(before_day, before_month)
+    with _locked_store(store) as locked:
+        usage = locked.load()
+        daily = {key: spent for key, spent in usage.daily.items() if key >= before_day}
+        monthly = {
+            key: spent for key, spent in usage.monthly.items() if key >= before_month
+        }
+        removed = len(usage.daily) - len(daily) + len(usage.monthly) - len(monthly)
+        if removed:
+            locked.save(BudgetUsage(daily=daily, monthly=monthly))
+    return removed
+
+
+@dataclass
+class _Lease:
+    day_key: str
+    month_key: str
+    granted: float
+    # Shared budget left outside this lease when it was granted.
+    remaining_daily: float
+    remaining_monthly: float
+    renewed_at: float
+    spent: float = 0.0
+
+    @property
+    def left(self) -> float:
+        return self.granted - self.spent
+
+
+class _LeasePool:
+    """Budget leased by this process from one shared usage store."""
+
+    def __init__(self, store) -> None:
+        self.store = store
+        self.lock = threading.Lock()
+        self.lease: _Lease | None = None
+
+
+_LEASE_POOLS: dict[tuple, _LeasePool] = {}
+_LEASE_POOLS_LOCK = threading.Lock()
+
+
+def _lease_pool(store) -> _LeasePool:
+    if hasattr(store, "path"):
+        key = (type(store), os.path.abspath(os.fspath(store.path)))
+    else:
+        key = (type(store), getattr(store, "_schema", None), getattr(store, "_tenant_id", None))
+    pool = _LEASE_POOLS.get(key)
+    if pool is None:
+        with _LEASE_POOLS_LOCK:
+            pool = _LEASE_POOLS.setdefault(key, _LeasePool(store))
+    return pool
+
+
+def release_budget_leases() -> None:
+    """Return the unspent part of every lease held by this process."""
+    for pool in list(_LEASE_POOLS.values()):
+        with pool.lock:
+            lease, pool.lease = pool.lease, None
+            if lease is None or lease.left <= 0:
+                continue
+            with _locked_store(pool.store) as store:
+                _charge(store, lease.day_key, lease.month_key, -lease.left)
+
+
+def _release_at_exit() -> None:
+    try:
+        release_budget_leases()
+    except Exception:
+        pass
+
+
+def _reset_leases_after_fork() -> None:
+    global _LEASE_POOLS_LOCK
+    # The parent still owns its leases; the child starts without any.
+    _LEASE_POOLS.clear()
+    _LEASE_POOLS_LOCK = threading.Lock()
+
+
+atexit.register(_release_at_exit)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_leases_after_fork)
+
+
 class BudgetManager:
     def __init__(
         self,
@@ -235,8 +636,13 @@ class BudgetManager:
         self._store = store
         self._config = config or BudgetConfig()
         self._now = now_provider
+        self._leases = _lease_pool(store) if self._config.lease_fraction > 0 else None
 
     def authorize(self) -> BudgetCheckResult:
+        if self._leases is not None:
+            return self._authorize_leased(self._leases)
+        if hasattr(self._store, "try_charge"):
+            return self._authorize_conditional()
         with self._store_lock() as store:
             result = self._evaluate_with_store(store)
             if result.allowed:
@@ -244,7 +650,16 @@ class BudgetManager:
             return result
 
     def evaluate(self) -> BudgetCheckResult:
-        return self._evaluate_with_store(self._store)
+        if self._leases is not None:
+            day_key, month_key = _period_keys(self._now())
+            lease = self._leases.lease
+            if lease is not None and (lease.day_key, lease.month_key) == (day_key, month_key):
+                return self._decide_leased(lease)
+        if hasattr(self._store, "transaction"):
+            return self._evaluate_with_store(self._store)
+        # Readers share the lock: they only wait for an in-flight charge.
+        with file_lock(self._store.path, shared=True):
+            return self._evaluate_with_store(self._store)
 
     def record(self, result: BudgetCheckResult, *, already_locked: bool = False) -> None:
         if already_locked:
@@ -254,17 +669,26 @@ class BudgetManager:
             self._record_with_store(store, result)
 
     def _evaluate_with_store(self, store) -> BudgetCheckResult:
-        usage = store.load()
-        now = self._now()
-        day_key = now.date().isoformat()
-        month_key = f"{now.year:04d}-{now.month:02d}"
+        day_key, month_key = _period_keys(self._now())
+        usage = _load_usage(store, day_key, month_key)
 
         daily_used = usage.daily.get(day_key, 0.0)
         monthly_used = usage.monthly.get(month_key, 0.0)
 
-        remaining_daily = self._config.daily_limit - daily_used
-        remaining_monthly = self._config.monthly_limit - monthly_used
+        return self._decide(
+            self._config.daily_limit - daily_used,
+            self._config.monthly_limit - monthly_used,
+            day_key,
+            month_key,
+        )
 
+    def _decide(
+        self,
+        remaining_daily: float,
+        remaining_monthly: float,
+        day_key: str,
+        month_key: str,
+    ) -> BudgetCheckResult:
         model = self._select_model(remaining_daily, remaining_monthly)
         estimated_cost = self._cost_for(model)
 
@@ -291,23 +715,105 @@ class BudgetManager:
             month_key=month_key,
         )
 
-    def _record_with_store(self, store, result: BudgetCheckResult) -> None:
-        usage = store.load()
-        daily_used = usage.daily.get(result.day_key, 0.0)
-        monthly_used = usage.monthly.get(result.month_key, 0.0)
+    def _authorize_conditional(self) -> BudgetCheckResult:
+        """Decide on a plain read, then let the store check-and-charge atomically.
+
+        Both run on one store session (a single connection for Postgres). A
+        concurrent charge may take the budget between the read and the
+        charge; the store then refuses it and the result reports that limit.
+        """
+        with _store_session(self._store) as ledger:
+            result = self._evaluate_with_store(ledger)
+            if not result.allowed:
+                return result
+            refused = ledger.try_charge(
+                result.day_key,
+                result.month_key,
+                result.estimated_cost,
+                self._config.daily_limit,
+                self._config.monthly_limit,
+            )
+        if refused is None:
+            return result
+        return replace(result, allowed=False, reason=f"{refused}_limit_exceeded")
+
+    def _authorize_leased(self, pool: _LeasePool) -> BudgetCheckResult:
+        """Spend from the process lease; touch the shared store only to renew it.
+
+        Leased budget is charged to the store when granted, so the limits
+        hold across workers. Renewal returns the unspent part of the old
+        lease and takes a new one sized ``lease_fraction`` of what remains
+        (capped by ``lease_max``); it happens when the period changes, the
+        lease is older than ``lease_ttl_seconds`` or it cannot cover a request.
+        """
+        day_key, month_key = _period_keys(self._now())
+        with pool.lock:
+            lease = pool.lease
+            if (
+                lease is None
+                or (lease.day_key, lease.month_key) != (day_key, month_key)
+                or time.monotonic() - lease.renewed_at >= self._config.lease_ttl_seconds
+            ):
+                lease = self._renew_lease(pool, day_key, month_key, 0.0)
+            result = self._decide_leased(lease)
+            if result.allowed and result.estimated_cost > lease.left:
+                lease = self._renew_lease(pool, day_key, month_key, result.estimated_cost)
+                result = self._decide_leased(lease)
+            if result.allowed:
+                lease.spent += result.estimated_cost
+            return result
 
-        usage.daily[result.day_key] = daily_used + result.estimated_cost
-        usage.monthly[result.month_key] = monthly_used + result.estimated_cost
-        store.save(usage)
+    def _decide_leased(self, lease: _Lease) -> BudgetCheckResult:
+        return self._decide(
+            lease.remaining_daily + lease.left,
+            lease.remaining_monthly + lease.left,
+            lease.day_key,
+            lease.month_key,
+        )
 
-    @contextmanager
-    def _store_lock(self) -> Iterator[object]:
-        if hasattr(self._store, "transaction"):
-            with self._store.transaction() as store:
-                yield store
-            return
-        with file_lock(self._store.path):
-            yield self._store
+    def _renew_lease(
+        self, pool: _LeasePool, day_key: str, month_key: str, needed: float
+    ) -> _Lease:
+        old = pool.lease
+        returned = max(old.left, 0.0) if old is not None else 0.0
+        same_period = old is not None and (old.day_key, old.month_key) == (
+            day_key,
+            month_key,
+        )
+        with self._store_lock() as store:
+            if returned and not same_period:
+                _charge(store, old.day_key, old.month_key, -returned)
+                returned = 0.0
+            usage = _load_usage(store, day_key, month_key)
+            remaining_daily = (
+                self._config.daily_limit - usage.daily.get(day_key, 0.0) + returned
+            )
+            remaining_monthly = (
+                self._config.monthly_limit - usage.monthly.get(month_key, 0.0) + returned
+            )
+            available = max(min(remaining_daily, remaining_monthly), 0.0)
+            size = max(available * self._config.lease_fraction, needed)
+            if self._config.lease_max > 0:
+                size = min(size, max(self._config.lease_max, needed))
+            size = round(min(size, available), 6)
+            # One write: the new lease minus what the old one gives back.
+            if size != returned:
+                _charge(store, day_key, month_key, size - returned)
+        pool.lease = _Lease(
+            day_key=day_key,
+            month_key=month_key,
+            granted=size,
+            remaining_daily=remaining_daily - size,
+            remaining_monthly=remaining_monthly - size,
+            renewed_at=time.monotonic(),
+        )
+        return pool.lease
+
+    def _record_with_store(self, store, result: BudgetCheckResult) -> None:
+        _charge(store, result.day_key, result.month_key, result.estimated_cost)
+
+    def _store_lock(self):
+        return _locked_store(self._store)
 
     def _select_model(self, remaining_daily: float, remaining_monthly: float) -> str:
         remaining_budget = min(remaining_daily, remaining_monthly)
@@ -319,3 +825,43 @@ class BudgetManager:
         if model == self._config.cheap_model:
             return self._config.cheap_cost
         return self._config.standard_cost
+
+
+@contextmanager
+def _locked_store(store) -> Iterator[object]:
+    if hasattr(store, "transaction"):
+        with store.transaction() as locked:
+            yield locked
+        return
+    with file_lock(store.path):
+        yield store
+
+
+@contextmanager
+def _store_session(store) -> Iterator[object]:
+    if hasattr(store, "session"):
+        with store.session() as session:
+            yield session
+        return
+    yield store
+
+
+def _charge(store, day_key: str, month_key: str, amount: float) -> None:
+    if hasattr(store, "add_usage"):
+        store.add_usage(day_key, month_key, amount)
+        return
+    usage = store.load()
+    usage.daily[day_key] = usage.daily.get(day_key, 0.0) + amount
+    usage.monthly[month_key] = usage.monthly.get(month_key, 0.0) + amount
+    store.save(usage)
+
+
+def _period_keys(now: datetime) -> tuple[str, str]:
+    return now.date().isoformat(), f"{now.year:04d}-{now.month:02d}"
+
+
+def _load_usage(store, day_key: str, month_key: str) -> BudgetUsage:
+    # Row-level stores read just the two periods a check needs.
+    if hasattr(store, "load_periods"):
+        return store.load_periods(day_key, month_key)
+    return store.load()
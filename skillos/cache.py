@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import os
+import threading
 import time
 from typing import Protocol
 
@@ -64,6 +65,36 @@ class RedisCache:
         self._client.setex(key, ttl_seconds, value)
 
 
+_REDIS_CLIENTS: dict[str, object] = {}
+_REDIS_CLIENTS_LOCK = threading.Lock()
+
+
+def shared_redis_client(url: str):
+    """Return the process-wide ``redis.Redis`` client (and pool) for ``url``."""
+    client = _REDIS_CLIENTS.get(url)
+    if client is not None:
+        return client
+    import redis
+
+    with _REDIS_CLIENTS_LOCK:
+        client = _REDIS_CLIENTS.get(url)
+        if client is None:
+            client = redis.Redis.from_url(url)
+            _REDIS_CLIENTS[url] = client
+    return client
+
+
+def _reset_redis_clients_after_fork() -> None:
+    # Pooled sockets belong to the parent; the child opens its own.
+    global _REDIS_CLIENTS_LOCK
+    _REDIS_CLIENTS.clear()
+    _REDIS_CLIENTS_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_redis_clients_after_fork)
+
+
 def cache_config_from_env() -> CacheConfig:
     enabled = _env_bool("SKILLOS_CACHE_ENABLED", False)
     ttl_seconds = _env_int("SKILLOS_CACHE_TTL_SECONDS", 60)
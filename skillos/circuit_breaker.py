@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import atexit
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import json
 import os
 from pathlib import Path
+import threading
+import time
 from typing import Callable
 
+from skillos.cache import shared_redis_client
+from skillos.state_store import default_state_db_path, state_database
 from skillos.storage import atomic_write_text, file_lock
+from skillos.storage_backend import resolve_tenant_id, storage_backend_from_env
 from skillos.tenancy import resolve_tenant_root
 
 
@@ -51,6 +57,9 @@ class CircuitBreakerConfig:
     window_seconds: int = DEFAULT_WINDOW_SECONDS
     open_seconds: int = DEFAULT_OPEN_SECONDS
     half_open_max_attempts: int = DEFAULT_HALF_OPEN_MAX
+    flush_interval_ms: int = 200
+    reload_interval_ms: int = 1000
+    backend: str = "local"
 
 
 def circuit_breaker_config_from_env() -> CircuitBreakerConfig:
@@ -71,6 +80,15 @@ def circuit_breaker_config_from_env() -> CircuitBreakerConfig:
             "SKILLOS_CIRCUIT_HALF_OPEN_MAX",
             DEFAULT_HALF_OPEN_MAX,
         ),
+        flush_interval_ms=max(_env_int("SKILLOS_CIRCUIT_FLUSH_INTERVAL_MS", 200), 0),
+        reload_interval_ms=max(
+            _env_int("SKILLOS_CIRCUIT_RELOAD_INTERVAL_MS", 1000), 0
+        ),
+        backend=(
+            "redis"
+            if os.getenv("SKILLOS_CIRCUIT_BACKEND", "local").strip().lower() == "redis"
+            else "local"
+        ),
     )
 
 
@@ -147,9 +165,265 @@ class CircuitBreakerStore:
                 encoding="utf-8",
             )
 
+    def get(self, skill_id: str) -> CircuitState | None:
+        return self.load().get(skill_id)
+
+    def put(self, skill_id: str, state: CircuitState) -> None:
+        states = self.load()
+        states[skill_id] = state
+        self.save(states)
+
+    def now(self) -> datetime:
+        return _ensure_utc(self._now())
+
+
+class CircuitBreakerStoreSqlite:
+    """Circuit states as one row per skill in the runtime state database."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        legacy_path: Path | None = None,
+        now_provider: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self.path = Path(path)
+        self._db = state_database(self.path)
+        self._now = now_provider
+        self._db.ensure_schema(
+            "circuit_breaker",
+            [
+                """
+                CREATE TABLE IF NOT EXISTS circuit_states (
+                    skill_id TEXT PRIMARY KEY,
+                    state TEXT NOT NULL,
+                    failure_count INTEGER NOT NULL,
+                    last_failure_at TEXT,
+                    opened_at TEXT,
+                    half_open_attempts INTEGER NOT NULL
+                )
+                """
+            ],
+            importer=self._importer(legacy_path),
+        )
+
+    def load(self) -> dict[str, CircuitState]:
+        rows = self._db.execute("SELECT * FROM circuit_states").fetchall()
+        return {row["skill_id"]: _state_from_row(row) for row in rows}
+
+    def save(self, states: dict[str, CircuitState]) -> None:
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM circuit_states")
+            for skill_id, state in states.items():
+                _upsert_state(conn, skill_id, state)
+
+    def get(self, skill_id: str) -> CircuitState | None:
+        row = self._db.execute(
+            "SELECT * FROM circuit_states WHERE skill_id = ?", (skill_id,)
+        ).fetchone()
+        return _state_from_row(row) if row else None
+
+    def put(self, skill_id: str, state: CircuitState) -> None:
+        _upsert_state(self._db.connection(), skill_id, state)
+
     def now(self) -> datetime:
         return _ensure_utc(self._now())
 
+    def _importer(self, legacy_path: Path | None):
+        if legacy_path is None or not Path(legacy_path).exists():
+            return None
+
+        def _import(conn) -> None:
+            for skill_id, state in CircuitBreakerStore(legacy_path).load().items():
+                _upsert_state(conn, skill_id, state)
+
+        return _import
+
+
+def _upsert_state(conn, skill_id: str, state: CircuitState) -> None:
+    conn.execute(
+        """
+        INSERT INTO circuit_states (
+            skill_id, state, failure_count, last_failure_at, opened_at,
+            half_open_attempts
+        ) VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT (skill_id) DO UPDATE SET
+            state = excluded.state,
+            failure_count = excluded.failure_count,
+            last_failure_at = excluded.last_failure_at,
+            opened_at = excluded.opened_at,
+            half_open_attempts = excluded.half_open_attempts
+        """,
+        (
+            skill_id,
+            state.state,
+            state.failure_count,
+            _format_datetime(state.last_failure_at),
+            _format_datetime(state.opened_at),
+            state.half_open_attempts,
+        ),
+    )
+
+
+def _state_from_row(row) -> CircuitState:
+    return CircuitState(
+        state=row["state"],
+        failure_count=int(row["failure_count"]),
+        last_failure_at=_parse_datetime(row["last_failure_at"]),
+        opened_at=_parse_datetime(row["opened_at"]),
+        half_open_attempts=int(row["half_open_attempts"]),
+    )
+
+
+def circuit_breaker_store_from_env(
+    root: Path,
+) -> CircuitBreakerStore | CircuitBreakerStoreSqlite:
+    config = storage_backend_from_env()
+    if config.backend == "sqlite":
+        return CircuitBreakerStoreSqlite(
+            default_state_db_path(root),
+            legacy_path=default_circuit_breaker_path(root),
+        )
+    return CircuitBreakerStore(default_circuit_breaker_path(root))
+
+
+class _CircuitTable:
+    """Process-wide circuit states shared with other processes via the store.
+
+    Decisions are made in memory under one lock. Every failure, half-open
+    probe and state change (closed/open/half-open, or a reset after
+    failures) is queued for persistence and written by a background thread, coalesced
+    over ``flush_interval_ms``. The table re-reads the store once
+    ``reload_interval_ms`` has passed, so the API, workers and CLI runs on
+    one tenant root see each other's failures and open circuits; states
+    still waiting to be written keep their in-memory value. Concurrent
+    failures in two processes between reloads may count once.
+    """
+
+    def __init__(
+        self, store, flush_interval_ms: int, reload_interval_ms: int
+    ) -> None:
+        self.store = store
+        self.flush_interval = max(flush_interval_ms, 0) / 1000
+        self.reload_interval = max(reload_interval_ms, 0) / 1000
+        self.lock = threading.Lock()
+        self.states: dict[str, CircuitState] = {}
+        self._loaded_at: float | None = None
+        self._dirty: set[str] = set()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def ensure_loaded(self) -> None:
+        if not self._reload_due():
+            return
+        # Serialized with flush, so a reload never reads the store between
+        # taking dirty states and writing them.
+        with self._flush_lock:
+            if not self._reload_due():
+                return
+            states = self.store.load()
+            with self.lock:
+                for skill_id in self._dirty:
+                    if skill_id in self.states:
+                        states[skill_id] = self.states[skill_id]
+                self.states = states
+            self._loaded_at = time.monotonic()
+
+    def mark_dirty(self, skill_id: str) -> None:
+        """Queue ``skill_id`` for persistence; call with ``lock`` held."""
+        self._dirty.add(skill_id)
+
+    def schedule(self) -> None:
+        if self.flush_interval == 0:
+            self.flush()
+            return
+        if self._thread is None:
+            with self.lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name="skillos-circuit-flush", daemon=True
+                    )
+                    self._thread.start()
+        self._wake.set()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self.lock:
+                pending = {
+                    skill_id: CircuitState(**vars(self.states[skill_id]))
+                    for skill_id in self._dirty
+                    if skill_id in self.states
+                }
+                self._dirty.clear()
+            written: list[str] = []
+            try:
+                for skill_id, state in pending.items():
+                    self.store.put(skill_id, state)
+                    written.append(skill_id)
+            except Exception:
+                with self.lock:
+                    self._dirty.update(set(pending) - set(written))
+                raise
+
+    def _reload_due(self) -> bool:
+        loaded_at = self._loaded_at
+        return loaded_at is None or time.monotonic() - loaded_at >= self.reload_interval
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                # Kept dirty; the next transition or exit flush retries.
+                continue
+
+
+_TABLES: dict[tuple[type, str], _CircuitTable] = {}
+_TABLES_LOCK = threading.Lock()
+
+
+def _circuit_table(store, config: CircuitBreakerConfig) -> _CircuitTable:
+    key = (type(store), os.path.abspath(os.fspath(store.path)))
+    table = _TABLES.get(key)
+    if table is None:
+        with _TABLES_LOCK:
+            table = _TABLES.setdefault(
+                key,
+                _CircuitTable(
+                    store, config.flush_interval_ms, config.reload_interval_ms
+                ),
+            )
+    return table
+
+
+def flush_circuit_states() -> None:
+    """Write every queued circuit transition now (used at exit and in tests)."""
+    for table in list(_TABLES.values()):
+        table.flush()
+
+
+def _flush_at_exit() -> None:
+    for table in list(_TABLES.values()):
+        try:
+            table.flush()
+        except Exception:
+            pass
+
+
+def _reset_tables_after_fork() -> None:
+    global _TABLES_LOCK
+    _TABLES.clear()
+    _TABLES_LOCK = threading.Lock()
+
+
+atexit.register(_flush_at_exit)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_tables_after_fork)
+
 
 class CircuitBreaker:
     def __init__(
@@ -159,72 +433,82 @@ class CircuitBreaker:
     ) -> None:
         self._store = store
         self._config = config or CircuitBreakerConfig()
+        self._table = _circuit_table(store, self._config)
 
     def allow(self, skill_id: str) -> CircuitDecision:
-        states = self._store.load()
-        state = states.get(skill_id, CircuitState())
+        table = self._table
+        table.ensure_loaded()
         now = self._store.now()
-
-        if state.state == "open":
-            if self._open_expired(state, now):
-                state = CircuitState(state="half_open")
-                states[skill_id] = state
-                self._store.save(states)
-                return CircuitDecision(allowed=True, state=state.state)
-            return CircuitDecision(
-                allowed=False, state=state.state, reason="circuit_open"
-            )
-
-        if state.state == "half_open":
-            if state.half_open_attempts >= self._config.half_open_max_attempts:
+        with table.lock:
+            state = table.states.get(skill_id)
+            if state is None or state.state == "closed":
+                if state is not None and self._failure_window_expired(state, now):
+                    state.failure_count = 0
+                    state.last_failure_at = None
+                return CircuitDecision(allowed=True, state="closed")
+
+            if state.state == "open":
+                if not self._open_expired(state, now):
+                    return CircuitDecision(
+                        allowed=False, state=state.state, reason="circuit_open"
+                    )
+                table.states[skill_id] = CircuitState(state="half_open")
+                table.mark_dirty(skill_id)
+                decision = CircuitDecision(allowed=True, state="half_open")
+            elif state.half_open_attempts >= self._config.half_open_max_attempts:
                 return CircuitDecision(
                     allowed=False, state=state.state, reason="circuit_half_open"
                 )
-            state.half_open_attempts += 1
-            states[skill_id] = state
-            self._store.save(states)
-            return CircuitDecision(allowed=True, state=state.state)
-
-        if self._failure_window_expired(state, now):
-            state.failure_count = 0
-            state.last_failure_at = None
-            states[skill_id] = state
-            self._store.save(states)
-
-        return CircuitDecision(allowed=True, state=state.state)
+            else:
+                state.half_open_attempts += 1
+                table.mark_dirty(skill_id)
+                decision = CircuitDecision(allowed=True, state=state.state)
+        table.schedule()
+        return decision
 
     def record_success(self, skill_id: str) -> None:
-        states = self._store.load()
-        states[skill_id] = CircuitState()
-        self._store.save(states)
+        table = self._table
+        table.ensure_loaded()
+        state = table.states.get(skill_id)
+        if state is None or _is_clean(state):
+            # Common case: nothing to reset, no lock and no I/O.
+            return
+        with table.lock:
+            previous = table.states.get(skill_id)
+            if previous is None or _is_clean(previous):
+                return
+            table.states[skill_id] = CircuitState()
+            table.mark_dirty(skill_id)
+        table.schedule()
 
     def record_failure(self, skill_id: str) -> None:
-        states = self._store.load()
-        state = states.get(skill_id, CircuitState())
+        table = self._table
+        table.ensure_loaded()
         now = self._store.now()
-
-        if state.state == "open":
-            return
-        if state.state == "half_open":
-            state = CircuitState(
-                state="open",
-                failure_count=self._config.failure_threshold,
-                last_failure_at=now,
-                opened_at=now,
-            )
-            states[skill_id] = state
-            self._store.save(states)
-            return
-
-        if self._failure_window_expired(state, now):
-            state.failure_count = 0
-        state.failure_count += 1
-        state.last_failure_at = now
-        if state.failure_count >= self._config.failure_threshold:
-            state.state = "open"
-            state.opened_at = now
-        states[skill_id] = state
-        self._store.save(states)
+        with table.lock:
+            state = table.states.setdefault(skill_id, CircuitState())
+            if state.state == "open":
+                return
+            if state.state == "half_open":
+                table.states[skill_id] = CircuitState(
+                    state="open",
+                    failure_count=self._config.failure_threshold,
+                    last_failure_at=now,
+                    opened_at=now,
+                )
+            else:
+                if self._failure_window_expired(state, now):
+                    state.failure_count = 0
+                state.failure_count += 1
+                state.last_failure_at = now
+                if state.failure_count >= self._config.failure_threshold:
+                    state.state = "open"
+                    state.opened_at = now
+            table.mark_dirty(skill_id)
+        table.schedule()
+
+    def flush(self) -> None:
+        self._table.flush()
 
     def _open_expired(self, state: CircuitState, now: datetime) -> bool:
         opened_at = state.opened_at or now
@@ -237,6 +521,166 @@ class CircuitBreaker:
         return now - last_failure > timedelta(seconds=self._config.window_seconds)
 
 
+def _is_clean(state: CircuitState) -> bool:
+    return state.state == "closed" and state.failure_count == 0
+
+
+class RedisCircuitBreaker:
+    """Circuit breaker shared by workers through one Redis hash per skill.
+
+    Each transition runs as a Lua script, so concurrent workers never lose
+    updates. A success after a clean ``allow`` (closed, no failures) costs no
+    round-trip; a success that follows failures deletes the hash.
+    """
+
+    _ALLOW_LUA = """
+    local key = KEYS[1]
+    local now = tonumber(ARGV[1])
+    local window = tonumber(ARGV[2])
+    local open_seconds = tonumber(ARGV[3])
+    local half_open_max = tonumber(ARGV[4])
+    local raw = redis.call("HMGET", key, "state", "failures", "last_failure", "opened_at", "half_open")
+    local state = raw[1] or "closed"
+    local failures = tonumber(raw[2] or "0")
+    local last_failure = tonumber(raw[3] or "0")
+    if state == "open" then
+      if now >= tonumber(raw[4] or "0") + open_seconds then
+        redis.call("HSET", key, "state", "half_open", "failures", 0, "last_failure", 0, "opened_at", 0, "half_open", 0)
+        return {1, "half_open", 0}
+      end
+      return {0, "open", failures}
+    end
+    if state == "half_open" then
+      if tonumber(raw[5] or "0") >= half_open_max then
+        return {0, "half_open", failures}
+      end
+      redis.call("HINCRBY", key, "half_open", 1)
+      return {1, "half_open", failures}
+    end
+    if last_failure > 0 and now - last_failure > window then
+      redis.call("DEL", key)
+      failures = 0
+    end
+    return {1, "closed", failures}
+    """
+
+    _FAILURE_LUA = """
+    local key = KEYS[1]
+    local now = tonumber(ARGV[1])
+    local window = tonumber(ARGV[2])
+    local threshold = tonumber(ARGV[3])
+    local raw = redis.call("HMGET", key, "state", "failures", "last_failure")
+    local state = raw[1] or "closed"
+    local failures = tonumber(raw[2] or "0")
+    local last_failure = tonumber(raw[3] or "0")
+    if state == "open" then
+      return {"open", failures}
+    end
+    if state == "half_open" then
+      redis.call("HSET", key, "state", "open", "failures", threshold, "last_failure", now, "opened_at", now, "half_open", 0)
+      redis.call("PERSIST", key)
+      return {"open", threshold}
+    end
+    if last_failure > 0 and now - last_failure > window then
+      failures = 0
+    end
+    failures = failures + 1
+    if failures >= threshold then
+      redis.call("HSET", key, "state", "open", "failures", failures, "last_failure", now, "opened_at", now, "half_open", 0)
+      redis.call("PERSIST", key)
+      return {"open", failures}
+    end
+    redis.call("HSET", key, "state", "closed", "failures", failures, "last_failure", now)
+    redis.call("EXPIRE", key, window + 1)
+    return {"closed", failures}
+    """
+
+    def __init__(
+        self,
+        client,
+        config: CircuitBreakerConfig | None = None,
+        *,
+        namespace: str = "skillos:circuit",
+        now_provider: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self._client = client
+        self._config = config or CircuitBreakerConfig()
+        self._namespace = namespace
+        self._now = now_provider
+        # Skills whose last observed Redis state was closed with no failures.
+        self._clean: set[str] = set()
+
+    def allow(self, skill_id: str) -> CircuitDecision:
+        allowed, state, failures = self._client.eval(
+            self._ALLOW_LUA,
+            1,
+            self._key(skill_id),
+            self._timestamp(),
+            self._config.window_seconds,
+            self._config.open_seconds,
+            self._config.half_open_max_attempts,
+        )
+        state = _decode(state)
+        self._observe(skill_id, state, int(failures))
+        if int(allowed):
+            return CircuitDecision(allowed=True, state=state)
+        reason = "circuit_open" if state == "open" else "circuit_half_open"
+        return CircuitDecision(allowed=False, state=state, reason=reason)
+
+    def record_success(self, skill_id: str) -> None:
+        if skill_id in self._clean:
+            return
+        self._client.delete(self._key(skill_id))
+        self._clean.add(skill_id)
+
+    def record_failure(self, skill_id: str) -> None:
+        state, failures = self._client.eval(
+            self._FAILURE_LUA,
+            1,
+            self._key(skill_id),
+            self._timestamp(),
+            self._config.window_seconds,
+            self._config.failure_threshold,
+        )
+        self._observe(skill_id, _decode(state), int(failures))
+
+    def flush(self) -> None:
+        return None
+
+    def _observe(self, skill_id: str, state: str, failures: int) -> None:
+        if state == "closed" and failures == 0:
+            self._clean.add(skill_id)
+        else:
+            self._clean.discard(skill_id)
+
+    def _key(self, skill_id: str) -> str:
+        return f"{self._namespace}:{skill_id}"
+
+    def _timestamp(self) -> float:
+        return _ensure_utc(self._now()).timestamp()
+
+
+def _decode(value: object) -> str:
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    return str(value)
+
+
+def circuit_breaker_from_env(root: Path) -> CircuitBreaker | RedisCircuitBreaker:
+    config = circuit_breaker_config_from_env()
+    if config.backend == "redis":
+        redis_url = os.getenv("SKILLOS_REDIS_URL") or os.getenv("REDIS_URL")
+        if not redis_url:
+            raise RuntimeError("circuit_breaker_redis_requires_url")
+        prefix = os.getenv("SKILLOS_CACHE_PREFIX", "skillos").strip() or "skillos"
+        return RedisCircuitBreaker(
+            shared_redis_client(redis_url),
+            config,
+            namespace=f"{prefix}:circuit:{resolve_tenant_id(Path(root))}",
+        )
+    return CircuitBreaker(circuit_breaker_store_from_env(root), config)
+
+
 def _env_int(name: str, default: int) -> int:
     raw = os.getenv(name)
     if raw is None:
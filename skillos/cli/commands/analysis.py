@@ -1,11 +1,14 @@
 from __future__ import annotations
+import json
 from pathlib import Path
 import click
 
 from skillos.skills.paths import default_skills_root
 from skillos.telemetry import EventLogger, default_log_path, default_metrics_path, new_request_id
 from skillos.feedback import (
+    FeedbackOutcome,
     FeedbackTracker,
+    correction_outcomes,
     feedback_store_from_env,
     normalize_skill_id,
 )
@@ -19,6 +22,16 @@ from skillos.optimizer import (
 from skillos.skills.registry import SkillRegistry
 from skillos.routing import build_router_from_env
 from skillos.metrics import load_golden_queries, build_metrics_summary
+from skillos.log_segments import iter_log_events, log_rotation_config_from_env, rotate_log
+from skillos.routing_cache import replay_routing_cache
+from skillos.telemetry_archive import (
+    TelemetryQuery,
+    TelemetryQueryError,
+    compact_segments,
+    default_archive_path,
+    parse_time_bound,
+    query_archive,
+)
 
 
 def _parse_optimization_result(result: str) -> tuple[str, bool]:
@@ -82,6 +95,62 @@ def feedback(
     click.echo(f"feedback_recorded: {updated_skills}")
 
 
+def _feedback_line_outcomes(line: str, line_number: int):
+    try:
+        payload = json.loads(line)
+    except json.JSONDecodeError as exc:
+        raise click.ClickException(f"Line {line_number}: invalid JSON") from exc
+    skill_id = payload.get("skill_id") if isinstance(payload, dict) else None
+    if not skill_id:
+        raise click.ClickException(f"Line {line_number}: skill_id is required")
+    skill_id = normalize_skill_id(str(skill_id))
+    outcome = payload.get("outcome")
+    if outcome is not None:
+        try:
+            return [(skill_id, FeedbackOutcome(str(outcome).lower()))]
+        except ValueError as exc:
+            raise click.ClickException(
+                f"Line {line_number}: outcome must be positive or negative"
+            ) from exc
+    expected = payload.get("expected_skill_id")
+    return correction_outcomes(
+        skill_id, normalize_skill_id(str(expected)) if expected else None
+    )
+
+
+@click.command("feedback-import")
+@click.argument(
+    "events_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+)
+@click.option("--batch-size", type=click.IntRange(min=1), default=10000, show_default=True)
+@click.option(
+    "--root",
+    "root_path",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=default_skills_root(),
+    show_default=True,
+)
+def feedback_import(events_path: Path, batch_size: int, root_path: Path) -> None:
+    """Bulk-apply a JSONL backlog of feedback events in batched writes."""
+    tracker = FeedbackTracker(feedback_store_from_env(root_path))
+    events = 0
+    skills: set[str] = set()
+    batch: list[tuple[str, FeedbackOutcome]] = []
+    with events_path.open(encoding="utf-8") as handle:
+        for line_number, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            batch.extend(_feedback_line_outcomes(line, line_number))
+            events += 1
+            if len(batch) >= batch_size:
+                skills.update(tracker.record_outcomes(batch))
+                batch = []
+    if batch:
+        skills.update(tracker.record_outcomes(batch))
+    click.echo(f"feedback_imported: {events} events, {len(skills)} skills")
+
+
 @click.command("optimize")
 @click.argument("skill_id")
 @click.option("--variant", "variants", multiple=True, required=True)
@@ -172,6 +241,7 @@ def metrics_report(root_path: Path, golden_path: Path, output_path: Path | None)
     router = build_router_from_env(
         [record.metadata for record in records.values()],
         confidence_provider=feedback_tracker.get_confidence,
+        root=root_path,
     )
     golden_queries = load_golden_queries(golden_path)
     summary = build_metrics_summary(router, golden_queries)
@@ -180,3 +250,120 @@ def metrics_report(root_path: Path, golden_path: Path, output_path: Path | None)
     destination.parent.mkdir(parents=True, exist_ok=True)
     destination.write_text(summary, encoding="utf-8")
     click.echo(f"metrics_written: {destination}")
+
+
+@click.command("cache-replay")
+@click.option(
+    "--root",
+    "root_path",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=default_skills_root(),
+    show_default=True,
+)
+@click.option(
+    "--log-path",
+    "log_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+)
+@click.option("--max-entries", type=int, default=0, show_default=True)
+def cache_replay(root_path: Path, log_path: Path | None, max_entries: int) -> None:
+    """Replay execution.log to compare raw vs normalized routing cache keys."""
+    source = log_path or default_log_path(root_path)
+    if not source.exists():
+        raise click.ClickException(f"Log not found: {source}")
+    report = replay_routing_cache(
+        iter_log_events(source, event_types=["request_received"]),
+        max_entries=max_entries,
+    )
+    click.echo(f"requests: {report.requests}")
+    click.echo(f"raw_hit_rate: {report.raw_hit_rate:.3f} ({report.raw_hits})")
+    click.echo(
+        f"normalized_hit_rate: {report.normalized_hit_rate:.3f} "
+        f"({report.normalized_hits})"
+    )
+
+
+@click.group("telemetry")
+def telemetry() -> None:
+    """Compact and query the columnar telemetry archive."""
+
+
+@telemetry.command("compact")
+@click.option(
+    "--root",
+    "root_path",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=default_skills_root(),
+    show_default=True,
+)
+@click.option(
+    "--log-path",
+    "log_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+)
+@click.option("--rotate", is_flag=True, help="Seal the active log before compacting.")
+def telemetry_compact(root_path: Path, log_path: Path | None, rotate: bool) -> None:
+    """Convert sealed log segments into date/event partitions."""
+    source = log_path or default_log_path(root_path)
+    if rotate:
+        rotate_log(source, log_rotation_config_from_env())
+    written = compact_segments(source)
+    click.echo(f"parts_written: {len(written)}")
+
+
+@telemetry.command("query")
+@click.option(
+    "--root",
+    "root_path",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=default_skills_root(),
+    show_default=True,
+)
+@click.option(
+    "--log-path",
+    "log_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+)
+@click.option("--event", "event", required=True)
+@click.option("--metric", default=None)
+@click.option("--group-by", "group_by", multiple=True)
+@click.option("--agg", "aggregates", multiple=True, default=("count",), show_default=True)
+@click.option("--since", default=None, help="ISO timestamp/date, today or yesterday.")
+@click.option("--until", default=None, help="ISO timestamp/date, today or yesterday.")
+def telemetry_query(
+    root_path: Path,
+    log_path: Path | None,
+    event: str,
+    metric: str | None,
+    group_by: tuple[str, ...],
+    aggregates: tuple[str, ...],
+    since: str | None,
+    until: str | None,
+) -> None:
+    """Aggregate archived events, e.g. p95 duration_ms per skill_id."""
+    source = log_path or default_log_path(root_path)
+    compact_segments(source)
+    try:
+        since_at = parse_time_bound(since)
+        until_at = parse_time_bound(until, end=True)
+        rows = query_archive(
+            default_archive_path(source),
+            TelemetryQuery(
+                event=event,
+                metric=metric,
+                group_by=group_by,
+                aggregates=aggregates,
+                since=since_at,
+                until=until_at,
+            ),
+        )
+    except TelemetryQueryError as exc:
+        raise click.ClickException(str(exc)) from exc
+    if not rows:
+        click.echo("no_results")
+        return
+    for row in rows:
+        click.echo(json.dumps(row, ensure_ascii=True, sort_keys=True))
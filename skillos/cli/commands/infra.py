@@ -1,4 +1,5 @@
 from __future__ import annotations
+from dataclasses import replace
 from datetime import datetime, timezone
 from pathlib import Path
 import time
@@ -595,6 +596,39 @@ def job_work(root_path: Path, log_path: Path | None, limit: int | None) -> None:
     for job_record in results:
         _emit_job_result(job_record)
 
+@click.group("budget")
+def budget() -> None:
+    """Maintain budget usage records."""
+
+@budget.command("prune")
+@click.option(
+    "--root",
+    "root_path",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=default_skills_root(),
+    show_default=True,
+)
+@click.option("--keep-days", type=int, default=None, help="Daily periods to keep.")
+@click.option("--keep-months", type=int, default=None, help="Monthly periods to keep.")
+def budget_prune(
+    root_path: Path, keep_days: int | None, keep_months: int | None
+) -> None:
+    """Delete budget periods older than the retention window."""
+    from skillos.budget import (
+        budget_retention_config_from_env,
+        budget_usage_store_from_env,
+        prune_budget_usage,
+    )
+
+    config = budget_retention_config_from_env()
+    if keep_days is not None:
+        config = replace(config, keep_days=max(keep_days, 1))
+    if keep_months is not None:
+        config = replace(config, keep_months=max(keep_months, 1))
+    removed = prune_budget_usage(budget_usage_store_from_env(root_path), config)
+    click.echo(f"pruned_periods: {removed}")
+
+
 @click.command("add-connector")
 @click.argument("connector_id")
 @click.option(
@@ -620,3 +654,59 @@ def add_connector(connector_id: str, connector_type: str, root_path: Path) -> No
     except (FileExistsError, ConnectorError) as exc:
         raise click.ClickException(str(exc)) from exc
     click.echo(f"Created {connector_file}")
+
+
+@click.command("profile")
+@click.option("--seconds", type=float, default=30.0, show_default=True)
+@click.option("--interval-ms", type=float, default=None)
+@click.option("--include-idle", is_flag=True, help="Keep samples of parked threads.")
+@click.option(
+    "--url",
+    default="http://127.0.0.1:8000",
+    show_default=True,
+    help="Base URL of the running API process.",
+)
+@click.option("--token", envvar="SKILLOS_PROFILE_TOKEN", default=None)
+@click.option(
+    "--output",
+    "output_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+)
+def profile(
+    seconds: float,
+    interval_ms: float | None,
+    include_idle: bool,
+    url: str,
+    token: str | None,
+    output_path: Path | None,
+) -> None:
+    """Sample the live API process and print collapsed stacks."""
+    import httpx
+
+    params: dict[str, object] = {"seconds": seconds}
+    if interval_ms is not None:
+        params["interval_ms"] = interval_ms
+    if include_idle:
+        params["include_idle"] = "true"
+    headers = {"X-SkillOS-Profile-Token": token} if token else {}
+    try:
+        response = httpx.post(
+            f"{url.rstrip('/')}/admin/profile",
+            params=params,
+            headers=headers,
+            timeout=seconds + 30,
+        )
+    except httpx.HTTPError as exc:
+        raise click.ClickException(f"Profile request failed: {exc}") from exc
+    if response.status_code != 200:
+        raise click.ClickException(
+            f"Profile request failed ({response.status_code}): {response.text}"
+        )
+    if output_path is None:
+        click.echo(response.text, nl=False)
+        return
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(response.text, encoding="utf-8")
+    samples = response.headers.get("X-Profile-Samples", "0")
+    click.echo(f"profile_written: {output_path} ({samples} samples)")
@@ -46,8 +46,11 @@ COMMAND_MAPPING = {
     
     # Analysis
     "feedback": ("skillos.cli.commands.analysis", "feedback"),
+    "feedback-import": ("skillos.cli.commands.analysis", "feedback_import"),
     "optimize": ("skillos.cli.commands.analysis", "optimize_skill"),
     "metrics": ("skillos.cli.commands.analysis", "metrics_report"),
+    "cache-replay": ("skillos.cli.commands.analysis", "cache_replay"),
+    "telemetry": ("skillos.cli.commands.analysis", "telemetry"),
     
     # Infra & Connectors
     "secrets": ("skillos.cli.commands.infra", "secrets"),
@@ -55,7 +58,9 @@ COMMAND_MAPPING = {
     "schedule": ("skillos.cli.commands.infra", "schedule"),
     "webhook": ("skillos.cli.commands.infra", "webhook"),
     "job": ("skillos.cli.commands.infra", "job"),
+    "budget": ("skillos.cli.commands.infra", "budget"),
     "add-connector": ("skillos.cli.commands.infra", "add_connector"),
+    "profile": ("skillos.cli.commands.infra", "profile"),
 }
 
 
@@ -18,12 +18,7 @@ from skillos.budget import (
     budget_config_from_env,
     budget_usage_store_from_env,
 )
-from skillos.circuit_breaker import (
-    CircuitBreaker,
-    CircuitBreakerStore,
-    circuit_breaker_config_from_env,
-    default_circuit_breaker_path,
-)
+from skillos.circuit_breaker import circuit_breaker_from_env
 from skillos.policy_engine import ApprovalRequirement, PolicyEngine, default_policy_path
 from skillos.risk_scorer import RiskScorer
 from skillos.skills.models import SkillMetadata
@@ -32,6 +27,7 @@ from skillos.storage import atomic_write_text
 from skillos.telemetry import EventLogger, default_log_path, new_request_id
 from skillos.tenancy import resolve_tenant_root
 from skillos.tool_wrapper import ToolWrapper
+from skillos.tracing import submit_in_context
 
 
 COMPOSITION_ENTRYPOINT = "skillos.composition:run_composed_skill"
@@ -141,10 +137,7 @@ class CompositionEngine:
                 required_token=os.getenv("SKILLOS_APPROVAL_TOKEN")
             ),
         )
-        self._circuit_breaker = CircuitBreaker(
-            CircuitBreakerStore(default_circuit_breaker_path(self._registry.root)),
-            circuit_breaker_config_from_env(),
-        )
+        self._circuit_breaker = circuit_breaker_from_env(self._registry.root)
 
     def execute(
         self,
@@ -343,7 +336,8 @@ class CompositionEngine:
         with ThreadPoolExecutor(max_workers=self._parallel_limit) as executor:
             future_map = {}
             for index, step_id in enumerate(group):
-                future = executor.submit(
+                future = submit_in_context(
+                    executor,
                     self._execute_with_timing,
                     step_id,
                     payload,
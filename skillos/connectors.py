@@ -15,7 +15,12 @@ from dotenv import dotenv_values
 from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
 import yaml
 
-from skillos.telemetry import EventLogger, default_log_path, new_request_id
+from skillos.telemetry import (
+    EventLogger,
+    default_log_path,
+    new_request_id,
+    record_connector_call,
+)
 from skillos.tenancy import resolve_tenant_root
 
 
@@ -473,6 +478,12 @@ class HttpConnector:
         return {}
 
     def _log_call(self, **fields: object) -> None:
+        record_connector_call(
+            self.connector_id,
+            self.connector_type,
+            str(fields["status"]),
+            float(fields["latency_ms"]),
+        )
         logger = self._resolve_logger()
         if not logger:
             return
@@ -556,6 +567,9 @@ class SqlConnector:
         return connection
 
     def _log_call(self, **fields: object) -> None:
+        record_connector_call(
+            self.connector_id, "sql", str(fields["status"]), float(fields["latency_ms"])
+        )
         logger = self._resolve_logger()
         if not logger:
             return
@@ -5,6 +5,7 @@ import hashlib
 import json
 from pathlib import Path
 
+from skillos.state_store import default_state_db_path, state_database
 from skillos.storage import atomic_write_text
 from skillos.tenancy import resolve_tenant_root
 from skillos.storage_backend import (
@@ -136,6 +137,68 @@ class ExperimentStore:
         self.save(experiments)
 
 
+class ExperimentStoreSqlite:
+    """Experiments as one row each in the runtime state database."""
+
+    def __init__(self, path: Path, *, legacy_path: Path | None = None) -> None:
+        self.path = Path(path)
+        self._db = state_database(self.path)
+        self._db.ensure_schema(
+            "experiments",
+            [
+                """
+                CREATE TABLE IF NOT EXISTS experiments (
+                    experiment_id TEXT PRIMARY KEY,
+                    state TEXT NOT NULL
+                )
+                """
+            ],
+            importer=self._importer(legacy_path),
+        )
+
+    def load(self) -> dict[str, ExperimentState]:
+        rows = self._db.execute("SELECT experiment_id, state FROM experiments").fetchall()
+        return {
+            row["experiment_id"]: ExperimentState.from_dict(json.loads(row["state"]))
+            for row in rows
+        }
+
+    def save(self, experiments: dict[str, ExperimentState]) -> None:
+        with self._db.transaction() as conn:
+            conn.execute("DELETE FROM experiments")
+            for experiment_id, state in experiments.items():
+                _upsert_experiment(conn, experiment_id, state)
+
+    def get(self, experiment_id: str) -> ExperimentState | None:
+        row = self._db.execute(
+            "SELECT state FROM experiments WHERE experiment_id = ?", (experiment_id,)
+        ).fetchone()
+        return ExperimentState.from_dict(json.loads(row["state"])) if row else None
+
+    def upsert(self, experiment_id: str, state: ExperimentState) -> None:
+        _upsert_experiment(self._db.connection(), experiment_id, state)
+
+    def _importer(self, legacy_path: Path | None):
+        if legacy_path is None or not Path(legacy_path).exists():
+            return None
+
+        def _import(conn) -> None:
+            for experiment_id, state in ExperimentStore(legacy_path).load().items():
+                _upsert_experiment(conn, experiment_id, state)
+
+        return _import
+
+
+def _upsert_experiment(conn, experiment_id: str, state: ExperimentState) -> None:
+    conn.execute(
+        """
+        INSERT INTO experiments (experiment_id, state) VALUES (?, ?)
+        ON CONFLICT (experiment_id) DO UPDATE SET state = excluded.state
+        """,
+        (experiment_id, json.dumps(state.to_dict(), ensure_ascii=True)),
+    )
+
+
 class ExperimentStorePostgres:
     def __init__(self, dsn: str, *, tenant_id: str, schema: str = "skillos") -> None:
         self._dsn = dsn
@@ -263,8 +326,14 @@ class ExperimentStorePostgres:
             )
 
 
-def experiment_store_from_env(root: Path) -> ExperimentStore | ExperimentStorePostgres:
+def experiment_store_from_env(
+    root: Path,
+) -> ExperimentStore | ExperimentStoreSqlite | ExperimentStorePostgres:
     config = storage_backend_from_env()
+    if config.backend == "sqlite":
+        return ExperimentStoreSqlite(
+            default_state_db_path(root), legacy_path=default_experiment_path(root)
+        )
     if config.backend != "postgres":
         return ExperimentStore(default_experiment_path(root))
     dsn = require_postgres_dsn(config, context="experiments")
@@ -2,10 +2,17 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+import hashlib
 import json
+import os
 from pathlib import Path
+import threading
+import time
+from types import MappingProxyType
+from typing import Iterable, Mapping
 
-from skillos.storage import atomic_write_text
+from skillos.state_store import default_state_db_path, state_database
+from skillos.storage import atomic_write_text, file_lock
 from skillos.tenancy import resolve_tenant_root
 from skillos.storage_backend import (
     pg_connect,
@@ -15,6 +22,8 @@ from skillos.storage_backend import (
 )
 
 DEFAULT_CONFIDENCE = 0.5
+DEFAULT_SNAPSHOT_TTL_SECONDS = 1.0
+_SQLITE_IN_CHUNK = 500
 
 
 def default_feedback_path(root: Path) -> Path:
@@ -22,6 +31,16 @@ def default_feedback_path(root: Path) -> Path:
     return root_path / "feedback" / "confidence.json"
 
 
+def feedback_snapshot_ttl_from_env() -> float:
+    raw = os.getenv("SKILLOS_FEEDBACK_SNAPSHOT_TTL_SECONDS")
+    if raw is None:
+        return DEFAULT_SNAPSHOT_TTL_SECONDS
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return DEFAULT_SNAPSHOT_TTL_SECONDS
+
+
 def normalize_skill_id(skill_id: str) -> str:
     if "/" in skill_id:
         return skill_id.replace("/", ".", 1)
@@ -40,6 +59,96 @@ class FeedbackRecord:
     negative: int = 0
 
 
+@dataclass
+class _FeedbackDelta:
+    """Net effect of consecutive outcomes on one skill.
+
+    Each outcome maps confidence ``c`` to ``0.9 * c`` (negative) or
+    ``0.9 * c + 0.1`` (positive), so any run of them composes into a single
+    ``scale * c + shift`` that a store can apply in one row update.
+    """
+
+    scale: float = 1.0
+    shift: float = 0.0
+    positive: int = 0
+    negative: int = 0
+
+    def add(self, outcome: FeedbackOutcome) -> None:
+        self.scale *= 0.9
+        self.shift *= 0.9
+        if outcome == FeedbackOutcome.POSITIVE:
+            self.shift += 0.1
+            self.positive += 1
+        else:
+            self.negative += 1
+
+    def apply(self, record: FeedbackRecord) -> FeedbackRecord:
+        return FeedbackRecord(
+            confidence=self.scale * record.confidence + self.shift,
+            positive=record.positive + self.positive,
+            negative=record.negative + self.negative,
+        )
+
+
+def _fold_outcomes(
+    outcomes: Iterable[tuple[str, FeedbackOutcome]],
+) -> dict[str, _FeedbackDelta]:
+    deltas: dict[str, _FeedbackDelta] = {}
+    for skill_id, outcome in outcomes:
+        delta = deltas.get(skill_id)
+        if delta is None:
+            delta = deltas[skill_id] = _FeedbackDelta()
+        delta.add(FeedbackOutcome(outcome))
+    return deltas
+
+
+def _apply_deltas(
+    records: dict[str, FeedbackRecord],
+    deltas: dict[str, _FeedbackDelta],
+    default_confidence: float,
+) -> dict[str, FeedbackRecord]:
+    updated: dict[str, FeedbackRecord] = {}
+    for skill_id, delta in deltas.items():
+        base = records.get(skill_id, FeedbackRecord(confidence=default_confidence))
+        updated[skill_id] = records[skill_id] = delta.apply(base)
+    return updated
+
+
+@dataclass(frozen=True)
+class ConfidenceSnapshot:
+    """Read-only confidence per skill, versioned by a hash of its content.
+
+    Equal content gives an equal version in every process, so routing cache
+    keys built from it stay shareable between workers.
+    """
+
+    version: str
+    confidences: Mapping[str, float]
+    store_version: tuple[int, int] | None = None
+
+
+def _build_snapshot(
+    records: dict[str, FeedbackRecord], store_version: tuple[int, int] | None
+) -> ConfidenceSnapshot:
+    return _snapshot_of(
+        {skill_id: record.confidence for skill_id, record in records.items()},
+        store_version,
+    )
+
+
+def _snapshot_of(
+    confidences: dict[str, float], store_version: tuple[int, int] | None
+) -> ConfidenceSnapshot:
+    digest = hashlib.blake2b(
+        repr(sorted(confidences.items())).encode("utf-8"), digest_size=8
+    ).hexdigest()
+    return ConfidenceSnapshot(
+        version=digest,
+        confidences=MappingProxyType(confidences),
+        store_version=store_version,
+    )
+
+
 class FeedbackStore:
     def __init__(self, path: Path) -> None:
         self.path = Path(path)
@@ -58,6 +167,28 @@ class FeedbackStore:
             )
         return records
 
+    def version(self) -> tuple[int, int] | None:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def apply_outcomes(
+        self,
+        outcomes: Iterable[tuple[str, FeedbackOutcome]],
+        default_confidence: float = DEFAULT_CONFIDENCE,
+    ) -> dict[str, FeedbackRecord]:
+        """Apply outcomes with one read and one rewrite of the document."""
+        deltas = _fold_outcomes(outcomes)
+        if not deltas:
+            return {}
+        with file_lock(self.path):
+            records = self.load()
+            updated = _apply_deltas(records, deltas, default_confidence)
+            self.save(records)
+        return updated
+
     def save(self, records: dict[str, FeedbackRecord]) -> None:
         payload = {
             "skills": {
@@ -76,6 +207,147 @@ class FeedbackStore:
         )
 
 
+class FeedbackStoreSqlite:
+    """Confidence records as one row per skill in the runtime state database."""
+
+    def __init__(self, path: Path, *, legacy_path: Path | None = None) -> None:
+        self.path = Path(path)
+        self._db = state_database(self.path)
+        self._db.ensure_schema(
+            "feedback",
+            [
+                """
+                CREATE TABLE IF NOT EXISTS feedback (
+                    skill_id TEXT PRIMARY KEY,
+                    confidence REAL NOT NULL,
+                    positive INTEGER NOT NULL,
+                    negative INTEGER NOT NULL
+                )
+                """,
+                """
+                CREATE TABLE IF NOT EXISTS feedback_version (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    version INTEGER NOT NULL
+                )
+                """,
+            ],
+            importer=self._importer(legacy_path),
+        )
+
+    def load(self) -> dict[str, FeedbackRecord]:
+        rows = self._db.execute(
+            "SELECT skill_id, confidence, positive, negative FROM feedback"
+        ).fetchall()
+        return {
+            row["skill_id"]: FeedbackRecord(
+                confidence=float(row["confidence"]),
+                positive=int(row["positive"]),
+                negative=int(row["negative"]),
+            )
+            for row in rows
+        }
+
+    def version(self) -> tuple[int, int] | None:
+        row = self._db.execute(
+            "SELECT version FROM feedback_version WHERE id = 0"
+        ).fetchone()
+        return (int(row["version"]), 0) if row else None
+
+    def save(self, records: dict[str, FeedbackRecord]) -> None:
+        with self._db.transaction() as conn:
+            _upsert_records(conn, records)
+
+    def apply_outcomes(
+        self,
+        outcomes: Iterable[tuple[str, FeedbackOutcome]],
+        default_confidence: float = DEFAULT_CONFIDENCE,
+    ) -> dict[str, FeedbackRecord]:
+        """Update only the touched rows, computing confidence in SQL."""
+        deltas = _fold_outcomes(outcomes)
+        if not deltas:
+            return {}
+        with self._db.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO feedback (skill_id, confidence, positive, negative)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (skill_id) DO UPDATE SET
+                    confidence = ? * confidence + ?,
+                    positive = positive + excluded.positive,
+                    negative = negative + excluded.negative
+                """,
+                [
+                    (
+                        skill_id,
+                        delta.scale * default_confidence + delta.shift,
+                        delta.positive,
+                        delta.negative,
+                        delta.scale,
+                        delta.shift,
+                    )
+                    for skill_id, delta in deltas.items()
+                ],
+            )
+            _bump_version(conn)
+            skill_ids = list(deltas)
+            rows = []
+            # Read back only the touched rows, under SQLite's bound-parameter cap.
+            for offset in range(0, len(skill_ids), _SQLITE_IN_CHUNK):
+                chunk = skill_ids[offset : offset + _SQLITE_IN_CHUNK]
+                rows.extend(
+                    conn.execute(
+                        "SELECT skill_id, confidence, positive, negative FROM feedback "
+                        f"WHERE skill_id IN ({', '.join('?' for _ in chunk)})",
+                        chunk,
+                    ).fetchall()
+                )
+        return {
+            row["skill_id"]: FeedbackRecord(
+                confidence=float(row["confidence"]),
+                positive=int(row["positive"]),
+                negative=int(row["negative"]),
+            )
+            for row in rows
+        }
+
+    def _importer(self, legacy_path: Path | None):
+        if legacy_path is None or not Path(legacy_path).exists():
+            return None
+
+        def _import(conn) -> None:
+            _upsert_records(conn, FeedbackStore(legacy_path).load())
+
+        return _import
+
+
+def _upsert_records(conn, records: dict[str, FeedbackRecord]) -> None:
+    conn.executemany(
+        """
+        INSERT INTO feedback (skill_id, confidence, positive, negative)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT (skill_id) DO UPDATE SET
+            confidence = excluded.confidence,
+            positive = excluded.positive,
+            negative = excluded.negative
+        """,
+        [
+            (skill_id, record.confidence, record.positive, record.negative)
+            for skill_id, record in records.items()
+        ],
+    )
+    _bump_version(conn)
+
+
+def _bump_version(conn) -> None:
+    # Bumped with every write so routing caches can tell confidence changed.
+    conn.execute(
+        """
+        INSERT INTO feedback_version (id, version) VALUES (0, 1)
+        ON CONFLICT (id) DO UPDATE SET version = version + 1
+        """
+    )
+
+
 class FeedbackStorePostgres:
     def __init__(self, dsn: str, *, tenant_id: str, schema: str = "skillos") -> None:
         self._dsn = dsn
@@ -100,28 +372,99 @@ class FeedbackStorePostgres:
             )
         return records
 
+    def version(self) -> tuple[int, int] | None:
+        query = (
+            f"SELECT version FROM {self._schema}.feedback_version "
+            "WHERE tenant_id = %s"
+        )
+        with pg_connect(self._dsn) as conn:
+            row = conn.execute(query, (self._tenant_id,)).fetchone()
+        return (int(row["version"]), 0) if row else None
+
     def save(self, records: dict[str, FeedbackRecord]) -> None:
+        query = f"""
+            INSERT INTO {self._schema}.feedback
+                (tenant_id, skill_id, confidence, positive, negative)
+            VALUES (%s, %s, %s, %s, %s)
+            ON CONFLICT (tenant_id, skill_id) DO UPDATE SET
+                confidence = EXCLUDED.confidence,
+                positive = EXCLUDED.positive,
+                negative = EXCLUDED.negative,
+                updated_at = now()
+            """
         with pg_connect(self._dsn) as conn:
-            for skill_id, record in records.items():
-                conn.execute(
-                    f"""
-                    INSERT INTO {self._schema}.feedback
-                        (tenant_id, skill_id, confidence, positive, negative)
-                    VALUES (%s, %s, %s, %s, %s)
-                    ON CONFLICT (tenant_id, skill_id) DO UPDATE SET
-                        confidence = EXCLUDED.confidence,
-                        positive = EXCLUDED.positive,
-                        negative = EXCLUDED.negative,
-                        updated_at = now()
-                    """,
-                    (
-                        self._tenant_id,
-                        skill_id,
-                        record.confidence,
-                        record.positive,
-                        record.negative,
-                    ),
+            with conn.cursor() as cursor:
+                cursor.executemany(
+                    query,
+                    [
+                        (
+                            self._tenant_id,
+                            skill_id,
+                            record.confidence,
+                            record.positive,
+                            record.negative,
+                        )
+                        for skill_id, record in records.items()
+                    ],
                 )
+            self._bump_version(conn)
+
+    def apply_outcomes(
+        self,
+        outcomes: Iterable[tuple[str, FeedbackOutcome]],
+        default_confidence: float = DEFAULT_CONFIDENCE,
+    ) -> dict[str, FeedbackRecord]:
+        """Update only the touched rows, computing confidence in SQL.
+
+        Outcomes are folded per skill first, so a backlog of any length
+        costs one upsert per distinct skill, sent as one ``executemany``.
+        """
+        deltas = _fold_outcomes(outcomes)
+        if not deltas:
+            return {}
+        query = (
+            f"INSERT INTO {self._schema}.feedback AS feedback "
+            "(tenant_id, skill_id, confidence, positive, negative) "
+            "VALUES (%s, %s, %s, %s, %s) "
+            "ON CONFLICT (tenant_id, skill_id) DO UPDATE SET "
+            "confidence = %s * feedback.confidence + %s, "
+            "positive = feedback.positive + EXCLUDED.positive, "
+            "negative = feedback.negative + EXCLUDED.negative, "
+            "updated_at = now() "
+            "RETURNING skill_id, confidence, positive, negative"
+        )
+        params = [
+            (
+                self._tenant_id,
+                skill_id,
+                delta.scale * default_confidence + delta.shift,
+                delta.positive,
+                delta.negative,
+                delta.scale,
+                delta.shift,
+            )
+            for skill_id, delta in deltas.items()
+        ]
+        with pg_connect(self._dsn) as conn:
+            if len(params) == 1:
+                rows = conn.execute(query, params[0]).fetchall()
+            else:
+                with conn.cursor() as cursor:
+                    cursor.executemany(query, params, returning=True)
+                    rows = []
+                    while True:
+                        rows.extend(cursor.fetchall())
+                        if not cursor.nextset():
+                            break
+            self._bump_version(conn)
+        return {
+            str(row["skill_id"]): FeedbackRecord(
+                confidence=float(row["confidence"]),
+                positive=int(row["positive"]),
+                negative=int(row["negative"]),
+            )
+            for row in rows
+        }
 
     def _ensure_table(self) -> None:
         with pg_connect(self._dsn) as conn:
@@ -139,10 +482,34 @@ class FeedbackStorePostgres:
                 )
                 """
             )
+            conn.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self._schema}.feedback_version (
+                    tenant_id TEXT PRIMARY KEY,
+                    version BIGINT NOT NULL
+                )
+                """
+            )
+
+    def _bump_version(self, conn) -> None:
+        # Same transaction as the write, and after it, so row locks are taken
+        # feedback rows first; readers compare this instead of reloading rows.
+        conn.execute(
+            f"INSERT INTO {self._schema}.feedback_version AS v (tenant_id, version) "
+            "VALUES (%s, 1) "
+            "ON CONFLICT (tenant_id) DO UPDATE SET version = v.version + 1",
+            (self._tenant_id,),
+        )
 
 
-def feedback_store_from_env(root: Path) -> FeedbackStore | FeedbackStorePostgres:
+def feedback_store_from_env(
+    root: Path,
+) -> FeedbackStore | FeedbackStoreSqlite | FeedbackStorePostgres:
     config = storage_backend_from_env()
+    if config.backend == "sqlite":
+        return FeedbackStoreSqlite(
+            default_state_db_path(root), legacy_path=default_feedback_path(root)
+        )
     if config.backend != "postgres":
         return FeedbackStore(default_feedback_path(root))
     dsn = require_postgres_dsn(config, context="feedback")
@@ -154,34 +521,171 @@ def feedback_store_from_env(root: Path) -> FeedbackStore | FeedbackStorePostgres
     )
 
 
+class _SnapshotCell:
+    """The confidence snapshot this process publishes for one store."""
+
+    def __init__(self) -> None:
+        self.snapshot: ConfidenceSnapshot | None = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+
+_SNAPSHOT_CELLS: dict[tuple, _SnapshotCell] = {}
+_SNAPSHOT_CELLS_LOCK = threading.Lock()
+
+
+def _snapshot_cell(store) -> _SnapshotCell:
+    if hasattr(store, "path"):
+        key = (type(store), os.path.abspath(os.fspath(store.path)))
+    else:
+        key = (
+            type(store),
+            getattr(store, "_schema", None),
+            getattr(store, "_tenant_id", None),
+        )
+    cell = _SNAPSHOT_CELLS.get(key)
+    if cell is None:
+        with _SNAPSHOT_CELLS_LOCK:
+            cell = _SNAPSHOT_CELLS.setdefault(key, _SnapshotCell())
+    return cell
+
+
+def _reset_snapshots_after_fork() -> None:
+    global _SNAPSHOT_CELLS_LOCK
+    _SNAPSHOT_CELLS.clear()
+    _SNAPSHOT_CELLS_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_snapshots_after_fork)
+
+
 class FeedbackTracker:
-    def __init__(self, store: FeedbackStore, default_confidence: float = DEFAULT_CONFIDENCE) -> None:
+    def __init__(
+        self,
+        store: FeedbackStore,
+        default_confidence: float = DEFAULT_CONFIDENCE,
+        *,
+        snapshot_ttl_seconds: float | None = None,
+    ) -> None:
         self._store = store
         self._default_confidence = default_confidence
+        self._snapshot_ttl = (
+            feedback_snapshot_ttl_from_env()
+            if snapshot_ttl_seconds is None
+            else snapshot_ttl_seconds
+        )
+        self._cell = _snapshot_cell(store)
+
+    def snapshot(self) -> ConfidenceSnapshot:
+        """Current confidence snapshot; a plain attribute read when fresh.
+
+        Writes through any tracker of this process publish a new snapshot
+        at once. Writes by other processes are picked up by a background
+        refresh once the snapshot is older than the TTL and the store
+        reports a different version.
+        """
+        cell = self._cell
+        snapshot = cell.snapshot
+        if snapshot is not None and self._fresh(cell):
+            return snapshot
+        if snapshot is None:
+            # Only the first load waits for the store.
+            with cell.lock:
+                return self._refresh(cell)
+        # A stale snapshot keeps being served while one background thread
+        # checks the store, so callers (including the event loop) never
+        # wait on it.
+        if cell.lock.acquire(blocking=False):
+            threading.Thread(
+                target=self._refresh_in_background,
+                args=(cell,),
+                name="skillos-feedback-refresh",
+                daemon=True,
+            ).start()
+        return snapshot
 
     def get_confidence(self, skill_id: str) -> float:
-        normalized = normalize_skill_id(skill_id)
-        record = self._store.load().get(normalized)
-        if record:
-            return record.confidence
-        return self._default_confidence
+        return self.snapshot().confidences.get(
+            normalize_skill_id(skill_id), self._default_confidence
+        )
+
+    def version(self) -> str:
+        """Changes whenever the confidence snapshot changes."""
+        return self.snapshot().version
 
     def record_feedback(self, skill_id: str, outcome: FeedbackOutcome) -> FeedbackRecord:
         normalized = normalize_skill_id(skill_id)
+        return self.record_outcomes([(normalized, outcome)])[normalized]
+
+    def record_outcomes(
+        self, outcomes: Iterable[tuple[str, FeedbackOutcome]]
+    ) -> dict[str, FeedbackRecord]:
+        """Apply outcomes in order as one store write; returns touched records."""
+        normalized = [
+            (normalize_skill_id(skill_id), outcome) for skill_id, outcome in outcomes
+        ]
+        if hasattr(self._store, "apply_outcomes"):
+            updated = self._store.apply_outcomes(normalized, self._default_confidence)
+            self._publish_updates(updated)
+            return updated
         records = self._store.load()
-        record = records.get(
-            normalized,
-            FeedbackRecord(confidence=self._default_confidence),
+        updated = _apply_deltas(
+            records, _fold_outcomes(normalized), self._default_confidence
         )
-        if outcome == FeedbackOutcome.POSITIVE:
-            record.positive += 1
-            record.confidence = record.confidence + (1 - record.confidence) * 0.1
-        else:
-            record.negative += 1
-            record.confidence = record.confidence * 0.9
-        records[normalized] = record
         self._store.save(records)
-        return record
+        self._publish(records)
+        return updated
+
+    def _fresh(self, cell: _SnapshotCell) -> bool:
+        return time.monotonic() - cell.checked_at < self._snapshot_ttl
+
+    def _refresh(self, cell: _SnapshotCell) -> ConfidenceSnapshot:
+        # Called with ``cell.lock`` held.
+        snapshot = cell.snapshot
+        if snapshot is not None and self._fresh(cell):
+            return snapshot
+        store_version = self._store.version()
+        if (
+            snapshot is None
+            or store_version is None
+            or store_version != snapshot.store_version
+        ):
+            snapshot = _build_snapshot(self._store.load(), store_version)
+            cell.snapshot = snapshot
+        cell.checked_at = time.monotonic()
+        return snapshot
+
+    def _refresh_in_background(self, cell: _SnapshotCell) -> None:
+        try:
+            self._refresh(cell)
+        except Exception:
+            # Keep serving the old snapshot and retry after another TTL.
+            cell.checked_at = time.monotonic()
+        finally:
+            cell.lock.release()
+
+    def _publish(self, records: dict[str, FeedbackRecord]) -> None:
+        snapshot = _build_snapshot(records, self._store.version())
+        with self._cell.lock:
+            self._cell.snapshot = snapshot
+            self._cell.checked_at = time.monotonic()
+
+    def _publish_updates(self, updated: dict[str, FeedbackRecord]) -> None:
+        if not updated:
+            return
+        with self._cell.lock:
+            current = self._cell.snapshot
+            if current is None:
+                return
+            confidences = dict(current.confidences)
+            confidences.update(
+                (skill_id, record.confidence) for skill_id, record in updated.items()
+            )
+            # Only the touched rows are known; without a store version the
+            # next refresh after the TTL reloads the rest.
+            self._cell.snapshot = _snapshot_of(confidences, None)
+            self._cell.checked_at = time.monotonic()
 
     def record_correction(
         self, selected_skill_id: str, expected_skill_id: str | None
@@ -192,16 +696,18 @@ class FeedbackTracker:
             if expected_skill_id
             else normalized_selected
         )
-        updates: dict[str, FeedbackRecord] = {}
-        if normalized_selected == normalized_expected:
-            updates[normalized_selected] = self.record_feedback(
-                normalized_selected, FeedbackOutcome.POSITIVE
-            )
-        else:
-            updates[normalized_selected] = self.record_feedback(
-                normalized_selected, FeedbackOutcome.NEGATIVE
-            )
-            updates[normalized_expected] = self.record_feedback(
-                normalized_expected, FeedbackOutcome.POSITIVE
-            )
-        return updates
+        return self.record_outcomes(
+            correction_outcomes(normalized_selected, normalized_expected)
+        )
+
+
+def correction_outcomes(
+    selected_skill_id: str, expected_skill_id: str | None
+) -> list[tuple[str, FeedbackOutcome]]:
+    """Outcomes implied by routing to ``selected`` when ``expected`` was wanted."""
+    if not expected_skill_id or expected_skill_id == selected_skill_id:
+        return [(selected_skill_id, FeedbackOutcome.POSITIVE)]
+    return [
+        (selected_skill_id, FeedbackOutcome.NEGATIVE),
+        (expected_skill_id, FeedbackOutcome.POSITIVE),
+    ]
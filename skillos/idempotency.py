@@ -5,8 +5,11 @@ from datetime import datetime, timedelta, timezone
 import json
 import os
 from pathlib import Path
+import threading
+import time
 from typing import Callable
 
+from skillos.state_store import default_state_db_path, state_database
 from skillos.storage import atomic_write_text, file_lock
 from skillos.tenancy import resolve_tenant_root
 from skillos.storage_backend import (
@@ -34,6 +37,49 @@ def idempotency_ttl_from_env() -> int:
         return DEFAULT_TTL_SECONDS
 
 
+_SUPPORTED_BACKENDS = {"auto", "sqlite", "redis", "postgres"}
+
+
+@dataclass(frozen=True)
+class IdempotencyConfig:
+    backend: str = "auto"
+    cleanup_interval_seconds: float = 60.0
+    cleanup_batch_size: int = 500
+
+
+def idempotency_config_from_env() -> IdempotencyConfig:
+    backend = os.getenv("SKILLOS_IDEMPOTENCY_BACKEND", "auto").strip().lower()
+    if backend not in _SUPPORTED_BACKENDS:
+        backend = "auto"
+    return IdempotencyConfig(
+        backend=backend,
+        cleanup_interval_seconds=max(
+            _env_float("SKILLOS_IDEMPOTENCY_CLEANUP_INTERVAL_SECONDS", 60.0), 0.0
+        ),
+        cleanup_batch_size=max(_env_int("SKILLOS_IDEMPOTENCY_CLEANUP_BATCH", 500), 1),
+    )
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
@@ -95,15 +141,18 @@ class IdempotencyStore:
     ) -> IdempotencyDecision:
         with file_lock(self.path):
             now = _ensure_utc(self._now())
-            entries = self._prune(self._load_entries(), now)
+            loaded = self._load_entries()
+            entries = self._prune(loaded, now)
             scoped_key = self._scoped_key(source, skill_id, idempotency_key)
             entry = entries.get(scoped_key)
             if entry and entry.expires_at > now:
-                self._save_entries(entries)
+                if len(entries) != len(loaded):
+                    self._save_entries(entries)
                 return IdempotencyDecision(allowed=False, expires_at=entry.expires_at)
 
             if ttl_seconds <= 0:
-                self._save_entries(entries)
+                if len(entries) != len(loaded):
+                    self._save_entries(entries)
                 return IdempotencyDecision(allowed=True, expires_at=None)
 
             expires_at = now + timedelta(seconds=ttl_seconds)
@@ -169,6 +218,149 @@ class IdempotencyStore:
         }
 
 
+class IdempotencyStoreSqlite:
+    """Idempotency keys as rows of the runtime state database.
+
+    A check reads or upserts only the row of its own key; expired rows are
+    treated as absent and deleted in batches at most once per
+    ``cleanup_interval_seconds`` per process.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        legacy_path: Path | None = None,
+        now_provider: Callable[[], datetime] = _utc_now,
+        cleanup_interval_seconds: float = 60.0,
+        cleanup_batch_size: int = 500,
+    ) -> None:
+        self.path = Path(path)
+        self._db = state_database(self.path)
+        self._now = now_provider
+        self._cleanup_interval = cleanup_interval_seconds
+        self._cleanup_batch = cleanup_batch_size
+        self._db.ensure_schema(
+            "idempotency",
+            [
+                """
+                CREATE TABLE IF NOT EXISTS idempotency_entries (
+                    source TEXT NOT NULL,
+                    skill_id TEXT NOT NULL,
+                    idempotency_key TEXT NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (source, skill_id, idempotency_key)
+                )
+                """,
+                """
+                CREATE INDEX IF NOT EXISTS idempotency_expires_idx
+                ON idempotency_entries (expires_at)
+                """,
+            ],
+            importer=self._importer(legacy_path),
+        )
+
+    def check_and_record(
+        self,
+        source: str,
+        skill_id: str,
+        idempotency_key: str,
+        *,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ) -> IdempotencyDecision:
+        now = _ensure_utc(self._now())
+        if _cleanup_due(("sqlite", str(self.path.resolve())), self._cleanup_interval):
+            self.purge_expired(now)
+        scope = (source, skill_id, idempotency_key)
+        existing = self._live_expiry(scope, now)
+        if existing is not None:
+            return IdempotencyDecision(allowed=False, expires_at=existing)
+        if ttl_seconds <= 0:
+            return IdempotencyDecision(allowed=True, expires_at=None)
+        expires_at = now + timedelta(seconds=ttl_seconds)
+        # Inserts the key, or takes over a row that expired but was not yet
+        # purged; a live row is left alone and reports no change.
+        cursor = self._db.execute(
+            """
+            INSERT INTO idempotency_entries
+                (source, skill_id, idempotency_key, expires_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (source, skill_id, idempotency_key)
+            DO UPDATE SET expires_at = excluded.expires_at
+            WHERE idempotency_entries.expires_at <= ?
+            """,
+            (*scope, expires_at.timestamp(), now.timestamp()),
+        )
+        if cursor.rowcount:
+            return IdempotencyDecision(allowed=True, expires_at=expires_at)
+        # Another worker recorded the key between the read and the upsert.
+        return IdempotencyDecision(
+            allowed=False, expires_at=self._live_expiry(scope, now)
+        )
+
+    def purge_expired(self, now: datetime | None = None) -> int:
+        """Delete expired rows in short batches; returns how many went."""
+        cutoff = _ensure_utc(now or self._now()).timestamp()
+        removed = 0
+        while True:
+            cursor = self._db.execute(
+                """
+                DELETE FROM idempotency_entries WHERE rowid IN (
+                    SELECT rowid FROM idempotency_entries
+                    WHERE expires_at <= ? LIMIT ?
+                )
+                """,
+                (cutoff, self._cleanup_batch),
+            )
+            removed += cursor.rowcount
+            if cursor.rowcount < self._cleanup_batch:
+                return removed
+
+    def _live_expiry(
+        self, scope: tuple[str, str, str], now: datetime
+    ) -> datetime | None:
+        row = self._db.execute(
+            """
+            SELECT expires_at FROM idempotency_entries
+            WHERE source = ? AND skill_id = ? AND idempotency_key = ?
+            AND expires_at > ?
+            """,
+            (*scope, now.timestamp()),
+        ).fetchone()
+        if row is None:
+            return None
+        return datetime.fromtimestamp(row["expires_at"], timezone.utc)
+
+    def _importer(self, legacy_path: Path | None):
+        if legacy_path is None or not Path(legacy_path).exists():
+            return None
+
+        def _import(conn) -> None:
+            legacy = IdempotencyStore(legacy_path, now_provider=self._now)
+            for entry in legacy._load_entries().values():
+                _insert_entry(conn, entry)
+
+        return _import
+
+
+def _insert_entry(conn, entry: IdempotencyEntry) -> None:
+    conn.execute(
+        """
+        INSERT INTO idempotency_entries
+            (source, skill_id, idempotency_key, expires_at)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT (source, skill_id, idempotency_key)
+        DO UPDATE SET expires_at = excluded.expires_at
+        """,
+        (
+            entry.source,
+            entry.skill_id,
+            entry.idempotency_key,
+            _ensure_utc(entry.expires_at).timestamp(),
+        ),
+    )
+
+
 class IdempotencyStorePostgres:
     def __init__(
         self,
@@ -177,12 +369,18 @@ class IdempotencyStorePostgres:
         tenant_id: str,
         now_provider: Callable[[], datetime] = _utc_now,
         schema: str = "skillos",
+        cleanup_interval_seconds: float = 60.0,
+        cleanup_batch_size: int = 500,
+        legacy_path: Path | None = None,
     ) -> None:
         self._dsn = dsn
         self._tenant_id = tenant_id
         self._now = now_provider
         self._schema = schema
+        self._cleanup_interval = cleanup_interval_seconds
+        self._cleanup_batch = cleanup_batch_size
         self._ensure_table()
+        self._import_legacy(legacy_path)
 
     def check_and_record(
         self,
@@ -193,37 +391,58 @@ class IdempotencyStorePostgres:
         ttl_seconds: int = DEFAULT_TTL_SECONDS,
     ) -> IdempotencyDecision:
         now = _ensure_utc(self._now())
-        expires_at = None
+        cleanup_key = ("postgres", self._dsn, self._schema, self._tenant_id)
+        if _cleanup_due(cleanup_key, self._cleanup_interval):
+            self.purge_expired(now)
+        scope = (self._tenant_id, source, skill_id, idempotency_key)
+        live_query = (
+            f"SELECT expires_at FROM {self._schema}.idempotency_entries "
+            "WHERE tenant_id = %s AND source = %s AND skill_id = %s "
+            "AND idempotency_key = %s AND expires_at > %s"
+        )
         with pg_connect(self._dsn) as conn:
-            conn.execute(
-                f"DELETE FROM {self._schema}.idempotency_entries "
-                "WHERE tenant_id = %s AND expires_at <= %s",
-                (self._tenant_id, now),
-            )
-            row = conn.execute(
-                f"""
-                SELECT expires_at FROM {self._schema}.idempotency_entries
-                WHERE tenant_id = %s AND source = %s AND skill_id = %s
-                AND idempotency_key = %s
-                """,
-                (self._tenant_id, source, skill_id, idempotency_key),
-            ).fetchone()
-            if row and row.get("expires_at") and row["expires_at"] > now:
+            row = conn.execute(live_query, (*scope, now)).fetchone()
+            if row:
                 return IdempotencyDecision(allowed=False, expires_at=row["expires_at"])
             if ttl_seconds <= 0:
                 return IdempotencyDecision(allowed=True, expires_at=None)
             expires_at = now + timedelta(seconds=ttl_seconds)
-            conn.execute(
+            inserted = conn.execute(
                 f"""
-                INSERT INTO {self._schema}.idempotency_entries
+                INSERT INTO {self._schema}.idempotency_entries AS entry
                     (tenant_id, source, skill_id, idempotency_key, expires_at)
                 VALUES (%s, %s, %s, %s, %s)
                 ON CONFLICT (tenant_id, source, skill_id, idempotency_key)
                 DO UPDATE SET expires_at = EXCLUDED.expires_at
+                WHERE entry.expires_at <= %s
+                RETURNING expires_at
                 """,
-                (self._tenant_id, source, skill_id, idempotency_key, expires_at),
-            )
-        return IdempotencyDecision(allowed=True, expires_at=expires_at)
+                (*scope, expires_at, now),
+            ).fetchone()
+            if inserted:
+                return IdempotencyDecision(allowed=True, expires_at=expires_at)
+            row = conn.execute(live_query, (*scope, now)).fetchone()
+        return IdempotencyDecision(
+            allowed=False, expires_at=row["expires_at"] if row else None
+        )
+
+    def purge_expired(self, now: datetime | None = None) -> int:
+        """Delete this tenant's expired rows in short batches."""
+        cutoff = _ensure_utc(now or self._now())
+        query = (
+            f"DELETE FROM {self._schema}.idempotency_entries WHERE ctid IN ("
+            f"SELECT ctid FROM {self._schema}.idempotency_entries "
+            "WHERE tenant_id = %s AND expires_at <= %s LIMIT %s)"
+        )
+        removed = 0
+        while True:
+            with pg_connect(self._dsn) as conn:
+                deleted = conn.execute(
+                    query, (self._tenant_id, cutoff, self._cleanup_batch)
+                ).rowcount
+            removed += deleted
+            if deleted < self._cleanup_batch:
+                return removed
 
     def _ensure_table(self) -> None:
         with pg_connect(self._dsn) as conn:
@@ -247,15 +466,228 @@ class IdempotencyStorePostgres:
                 """
             )
 
+    def _import_legacy(self, legacy_path: Path | None) -> None:
+        # Keys that are still live in the JSON file keep blocking duplicates;
+        # rows already present win, so repeating the import is harmless.
+        entries = _live_legacy_entries(legacy_path, _ensure_utc(self._now()))
+        if not entries:
+            return
+        query = (
+            f"INSERT INTO {self._schema}.idempotency_entries "
+            "(tenant_id, source, skill_id, idempotency_key, expires_at) "
+            "VALUES (%s, %s, %s, %s, %s) "
+            "ON CONFLICT (tenant_id, source, skill_id, idempotency_key) DO NOTHING"
+        )
+        with pg_connect(self._dsn) as conn:
+            with conn.cursor() as cursor:
+                cursor.executemany(
+                    query,
+                    [
+                        (
+                            self._tenant_id,
+                            entry.source,
+                            entry.skill_id,
+                            entry.idempotency_key,
+                            entry.expires_at,
+                        )
+                        for entry in entries
+                    ],
+                )
+
+
+class IdempotencyStoreRedis:
+    """Idempotency keys as Redis strings created with ``SET NX PX``.
+
+    Redis expires the keys itself, so there is nothing to clean up.
+    """
+
+    def __init__(
+        self,
+        client,
+        *,
+        namespace: str = "skillos:idempotency",
+        now_provider: Callable[[], datetime] = _utc_now,
+        legacy_path: Path | None = None,
+    ) -> None:
+        self._client = client
+        self._namespace = namespace
+        self._now = now_provider
+        self._import_legacy(legacy_path)
+
+    def check_and_record(
+        self,
+        source: str,
+        skill_id: str,
+        idempotency_key: str,
+        *,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    ) -> IdempotencyDecision:
+        key = self._key(source, skill_id, idempotency_key)
+        now = _ensure_utc(self._now())
+        if ttl_seconds <= 0:
+            existing = self._client.get(key)
+            return IdempotencyDecision(
+                allowed=existing is None, expires_at=_decode_expiry(existing)
+            )
+        expires_at = now + timedelta(seconds=ttl_seconds)
+        # A key that expires between a refused SET and the GET is retried once.
+        for _ in range(2):
+            if self._client.set(
+                key, _format_datetime(expires_at), nx=True, px=ttl_seconds * 1000
+            ):
+                return IdempotencyDecision(allowed=True, expires_at=expires_at)
+            existing = self._client.get(key)
+            if existing is not None:
+                return IdempotencyDecision(
+                    allowed=False, expires_at=_decode_expiry(existing)
+                )
+        return IdempotencyDecision(allowed=False, expires_at=None)
+
+    def _key(self, source: str, skill_id: str, idempotency_key: str) -> str:
+        return f"{self._namespace}:{source}:{skill_id}:{idempotency_key}"
+
+    def _import_legacy(self, legacy_path: Path | None) -> None:
+        # NX keeps keys that Redis already holds; each imported key expires
+        # when its JSON entry would have.
+        now = _ensure_utc(self._now())
+        entries = _live_legacy_entries(legacy_path, now)
+        if not entries:
+            return
+        pipeline = self._client.pipeline(transaction=False)
+        for entry in entries:
+            remaining_ms = int((entry.expires_at - now).total_seconds() * 1000)
+            pipeline.set(
+                self._key(entry.source, entry.skill_id, entry.idempotency_key),
+                _format_datetime(entry.expires_at),
+                nx=True,
+                px=max(remaining_ms, 1),
+            )
+        pipeline.execute()
+
+
+def _live_legacy_entries(
+    legacy_path: Path | None, now: datetime
+) -> list[IdempotencyEntry]:
+    if legacy_path is None or not Path(legacy_path).exists():
+        return []
+    legacy = IdempotencyStore(legacy_path)
+    return [
+        entry
+        for entry in legacy._load_entries().values()
+        if _ensure_utc(entry.expires_at) > now
+    ]
+
+
+def _decode_expiry(value: object) -> datetime | None:
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        value = value.decode("utf-8")
+    try:
+        return _parse_datetime(str(value))
+    except ValueError:
+        return None
+
+
+_CLEANUP_DUE: dict[tuple, float] = {}
+_CLEANUP_LOCK = threading.Lock()
+
+
+def _cleanup_due(key: tuple, interval_seconds: float) -> bool:
+    """Whether this process should purge the store behind ``key`` now."""
+    now = time.monotonic()
+    with _CLEANUP_LOCK:
+        if now < _CLEANUP_DUE.get(key, 0.0):
+            return False
+        _CLEANUP_DUE[key] = now + interval_seconds
+        return True
+
+
+def _reset_cleanup_after_fork() -> None:
+    global _CLEANUP_LOCK, _STORES_LOCK
+    _CLEANUP_LOCK = threading.Lock()
+    # Redis pools and database handles are not shared with a forked child.
+    _STORES.clear()
+    _STORES_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_cleanup_after_fork)
+
+
+def idempotency_store_from_env(
+    root: Path,
+) -> IdempotencyStoreSqlite | IdempotencyStoreRedis | IdempotencyStorePostgres:
+    """Build the idempotency store selected by the environment.
+
+    ``auto`` follows ``SKILLOS_STORAGE_BACKEND``: Postgres with the Postgres
+    backend, otherwise ``runtime/state.db``. Redis is used only when asked
+    for with ``SKILLOS_IDEMPOTENCY_BACKEND=redis``; a Redis URL set for the
+    cache does not switch it. Every backend imports the keys that are still
+    live in the old ``runtime/idempotency.json``.
+    """
+    config = idempotency_config_from_env()
+    storage = storage_backend_from_env()
+    backend = config.backend
+    if backend == "auto":
+        backend = "postgres" if storage.backend == "postgres" else "sqlite"
+    legacy_path = default_idempotency_path(root)
+    if backend == "redis":
+        redis_url = os.getenv("SKILLOS_REDIS_URL") or os.getenv("REDIS_URL")
+        if not redis_url:
+            raise RuntimeError("idempotency_redis_requires_url")
+        import redis
+
+        prefix = os.getenv("SKILLOS_CACHE_PREFIX", "skillos").strip() or "skillos"
+        return IdempotencyStoreRedis(
+            redis.Redis.from_url(redis_url),
+            namespace=f"{prefix}:idempotency:{resolve_tenant_id(Path(root))}",
+            legacy_path=legacy_path,
+        )
+    if backend == "postgres":
+        dsn = require_postgres_dsn(storage, context="idempotency")
+        return IdempotencyStorePostgres(
+            dsn,
+            tenant_id=resolve_tenant_id(Path(root)),
+            schema=storage.postgres_schema,
+            cleanup_interval_seconds=config.cleanup_interval_seconds,
+            cleanup_batch_size=config.cleanup_batch_size,
+            legacy_path=legacy_path,
+        )
+    return IdempotencyStoreSqlite(
+        default_state_db_path(root),
+        legacy_path=legacy_path,
+        cleanup_interval_seconds=config.cleanup_interval_seconds,
+        cleanup_batch_size=config.cleanup_batch_size,
+    )
+
+
+_STORES: dict[tuple, object] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_cached_idempotency_store(
+    root: Path,
+) -> IdempotencyStoreSqlite | IdempotencyStoreRedis | IdempotencyStorePostgres:
+    """Process-wide store per root and backend configuration.
 
-def idempotency_store_from_env(root: Path) -> IdempotencyStore | IdempotencyStorePostgres:
-    config = storage_backend_from_env()
-    if config.backend != "postgres":
-        return IdempotencyStore(default_idempotency_path(root))
-    dsn = require_postgres_dsn(config, context="idempotency")
-    tenant_id = resolve_tenant_id(Path(root))
-    return IdempotencyStorePostgres(
-        dsn,
-        tenant_id=tenant_id,
-        schema=config.postgres_schema,
+    Webhooks check a key per request; building the store each time would
+    open a Redis pool or re-run the Postgres DDL on every delivery.
+    """
+    key = (
+        str(resolve_tenant_root(root)),
+        resolve_tenant_id(Path(root)),
+        idempotency_config_from_env(),
+        storage_backend_from_env(),
+        os.getenv("SKILLOS_REDIS_URL") or os.getenv("REDIS_URL"),
+        os.getenv("SKILLOS_CACHE_PREFIX", "skillos").strip() or "skillos",
     )
+    store = _STORES.get(key)
+    if store is not None:
+        return store
+    with _STORES_LOCK:
+        store = _STORES.get(key)
+        if store is None:
+            store = idempotency_store_from_env(root)
+            _STORES[key] = store
+        return store
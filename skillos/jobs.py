@@ -19,8 +19,10 @@ from skillos.telemetry import (
     log_job_started,
     log_job_succeeded,
     new_request_id,
+    record_job_execution,
 )
 from skillos.tenancy import resolve_tenant_root
+from skillos.tracing import traced
 from skillos.storage_backend import (
     pg_connect,
     require_postgres_dsn,
@@ -549,6 +551,7 @@ class JobWorker:
             results.append(self._execute_job(job))
         return results
 
+    @traced("job")
     def _execute_job(self, job: JobRecord) -> JobRecord:
         now = self._now()
         logger = EventLogger(self.log_path, request_id=new_request_id())
@@ -614,6 +617,7 @@ class JobWorker:
             )
 
         duration_ms = (time.perf_counter() - start) * 1000
+        record_job_execution(job.skill_id, "success", duration_ms)
         job.mark_succeeded(now)
         self.store.save(job)
         log_job_succeeded(
@@ -643,6 +647,7 @@ class JobWorker:
                 duration_ms=duration_ms,
                 error_class=error_class,
             )
+        record_job_execution(job.skill_id, "error", duration_ms)
         will_retry = job.mark_failed(now, error_class)
         self.store.save(job)
         log_job_failed(
@@ -3,6 +3,7 @@ import inspect
 import asyncio
 from typing import Any, Dict, Optional
 from skillos.kernel.base import ExecutionKernel
+from skillos.profiler import skill_scope
 from skillos.skills.models import SkillMetadata
 
 class LocalExecutionKernel(ExecutionKernel):
@@ -74,7 +75,8 @@ class LocalExecutionKernel(ExecutionKernel):
             )
         
         return await asyncio.to_thread(
-            self._call_sync,
+            self._call_sync_tagged,
+            metadata.id,
             func,
             payload,
             self._build_skill_kwargs(
@@ -116,6 +118,14 @@ class LocalExecutionKernel(ExecutionKernel):
                 return kwargs
         return {key: value for key, value in kwargs.items() if key in signature.parameters}
 
+    def _call_sync_tagged(
+        self, skill_id: str, func: Any, payload: str, kwargs: Dict[str, Any]
+    ) -> Any:
+        # Worker threads run one skill at a time, so profiler samples taken
+        # on them can be attributed to it.
+        with skill_scope(skill_id):
+            return self._call_sync(func, payload, kwargs)
+
     def _call_sync(self, func: Any, payload: str, kwargs: Dict[str, Any]) -> Any:
         signature = inspect.signature(func)
         filtered_kwargs = self._filter_kwargs(signature, kwargs)
@@ -0,0 +1,470 @@
+from __future__ import annotations
+
+import atexit
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import gzip
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from typing import IO, Iterable, Iterator
+
+from skillos.storage import atomic_write_text, file_lock
+
+LOG_COMPRESSIONS = {"gzip", "none"}
+_MANIFEST_SUFFIX = ".manifest.json"
+
+
+@dataclass(frozen=True)
+class LogRotationConfig:
+    max_bytes: int = 0
+    max_age_seconds: int = 0
+    compression: str = "gzip"
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 or self.max_age_seconds > 0
+
+
+def log_rotation_config_from_env() -> LogRotationConfig:
+    compression = os.getenv("SKILLOS_LOG_COMPRESSION", "gzip").strip().lower()
+    return LogRotationConfig(
+        max_bytes=_env_int("SKILLOS_LOG_ROTATE_BYTES", 0),
+        max_age_seconds=_env_int("SKILLOS_LOG_ROTATE_SECONDS", 0),
+        compression=compression if compression in LOG_COMPRESSIONS else "gzip",
+    )
+
+
+def segments_dir(log_path: Path) -> Path:
+    return Path(log_path).parent / "segments"
+
+
+@dataclass(frozen=True)
+class SegmentManifest:
+    """Summary of a closed segment, used to skip it without opening it."""
+
+    path: Path
+    start: str | None
+    end: str | None
+    count: int
+    event_types: dict[str, int] = field(default_factory=dict)
+    min_request_id: str | None = None
+    max_request_id: str | None = None
+    compression: str = "gzip"
+
+    def overlaps(self, since: datetime | None, until: datetime | None) -> bool:
+        if self.start is None or self.end is None:
+            return True
+        if since is not None and _parse_timestamp(self.end) < since:
+            return False
+        if until is not None and _parse_timestamp(self.start) > until:
+            return False
+        return True
+
+    def has_events(self, event_types: set[str] | None) -> bool:
+        return event_types is None or not event_types.isdisjoint(self.event_types)
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "file": self.path.name,
+            "start": self.start,
+            "end": self.end,
+            "count": self.count,
+            "event_types": self.event_types,
+            "request_ids": {"min": self.min_request_id, "max": self.max_request_id},
+            "compression": self.compression,
+        }
+
+    @classmethod
+    def from_dict(cls, directory: Path, payload: dict[str, object]) -> SegmentManifest:
+        request_ids = payload.get("request_ids") or {}
+        return cls(
+            path=directory / str(payload["file"]),
+            start=payload.get("start"),
+            end=payload.get("end"),
+            count=int(payload.get("count", 0)),
+            event_types={
+                str(key): int(value)
+                for key, value in (payload.get("event_types") or {}).items()
+            },
+            min_request_id=request_ids.get("min"),
+            max_request_id=request_ids.get("max"),
+            compression=str(payload.get("compression", "gzip")),
+        )
+
+
+# Start time of the active file per path, keyed by inode so a rotation by any
+# process resets it without an extra read on every write.
+_ACTIVE_STARTS: dict[Path, tuple[int, float]] = {}
+_ACTIVE_LOCK = threading.Lock()
+
+
+def maybe_rotate(
+    log_path: Path,
+    stat: os.stat_result,
+    config: LogRotationConfig,
+    *,
+    now: float | None = None,
+) -> Path | None:
+    """Rotate ``log_path`` if the just-written file is too large or too old.
+
+    ``stat`` is the ``fstat`` of the handle that was written, so the common
+    case costs no extra syscalls. Only the rename happens in the caller; the
+    detached segment is compressed and given a manifest by a background
+    sealer (see ``wait_for_sealing``). Returns the detached segment path.
+    """
+    if not config.enabled:
+        return None
+    log_path = Path(log_path)
+    due = config.max_bytes > 0 and stat.st_size >= config.max_bytes
+    if not due and config.max_age_seconds > 0:
+        started = _active_started(log_path, stat)
+        due = (now if now is not None else time.time()) - started >= config.max_age_seconds
+    if not due:
+        return None
+    raw_path = detach_segment(log_path, expected_inode=stat.st_ino)
+    if raw_path is not None:
+        _SEALER.submit(raw_path, config.compression)
+    return raw_path
+
+
+def rotate_log(
+    log_path: Path,
+    config: LogRotationConfig,
+    *,
+    expected_inode: int | None = None,
+) -> SegmentManifest | None:
+    """Detach the active file and seal it in the calling thread."""
+    raw_path = detach_segment(log_path, expected_inode=expected_inode)
+    if raw_path is None:
+        return None
+    return seal_segment(raw_path, config.compression)
+
+
+def detach_segment(
+    log_path: Path, *, expected_inode: int | None = None
+) -> Path | None:
+    """Move the active file into ``segments/`` under the rotation lock."""
+    log_path = Path(log_path)
+    directory = segments_dir(log_path)
+    directory.mkdir(parents=True, exist_ok=True)
+    with file_lock(directory / f"{log_path.stem}.rotate"):
+        try:
+            current = log_path.stat()
+        except FileNotFoundError:
+            return None
+        if expected_inode is not None and current.st_ino != expected_inode:
+            # Another writer rotated this file first.
+            return None
+        if current.st_size == 0:
+            return None
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        raw_path = directory / f"{log_path.stem}-{stamp}.log"
+        os.replace(log_path, raw_path)
+    with _ACTIVE_LOCK:
+        _ACTIVE_STARTS.pop(log_path, None)
+    return raw_path
+
+
+class _SegmentSealer:
+    """Compresses detached segments on one daemon thread, oldest first.
+
+    A segment that fails to seal stays as a plain ``.log`` file, which
+    readers already scan without a manifest.
+    """
+
+    def __init__(self) -> None:
+        self._pending: deque[tuple[Path, str]] = deque()
+        self._condition = threading.Condition()
+        self._busy = False
+        self._thread: threading.Thread | None = None
+
+    def submit(self, raw_path: Path, compression: str) -> None:
+        with self._condition:
+            self._pending.append((raw_path, compression))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="skillos-log-sealer", daemon=True
+                )
+                self._thread.start()
+            self._condition.notify_all()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._busy, timeout
+            )
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: bool(self._pending))
+                raw_path, compression = self._pending.popleft()
+                self._busy = True
+            try:
+                seal_segment(raw_path, compression)
+            except (OSError, ValueError):
+                pass
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+
+_SEALER = _SegmentSealer()
+
+
+def wait_for_sealing(timeout: float | None = None) -> bool:
+    """Block until every segment detached by ``maybe_rotate`` is sealed."""
+    return _SEALER.wait(timeout)
+
+
+def _reset_sealer_after_fork() -> None:
+    # The sealer thread does not survive fork(); the parent still owns the
+    # segments it queued.
+    global _SEALER
+    _SEALER = _SegmentSealer()
+
+
+atexit.register(wait_for_sealing)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sealer_after_fork)
+
+
+def seal_segment(raw_path: Path, compression: str = "gzip") -> SegmentManifest:
+    """Compress a rotated segment and write its manifest."""
+    raw_path = Path(raw_path)
+    target = raw_path.with_name(raw_path.name + ".gz") if compression == "gzip" else raw_path
+    stats = _SegmentStats()
+    if compression == "gzip":
+        tmp_path = target.with_name(target.name + ".tmp")
+        with raw_path.open("r", encoding="utf-8") as source, gzip.open(
+            tmp_path, "wt", encoding="utf-8"
+        ) as sink:
+            for line in source:
+                stats.observe(line)
+                sink.write(line)
+        os.replace(tmp_path, target)
+    else:
+        with raw_path.open("r", encoding="utf-8") as source:
+            for line in source:
+                stats.observe(line)
+    manifest = stats.manifest(target, compression)
+    atomic_write_text(
+        _manifest_path(raw_path),
+        json.dumps(manifest.to_dict(), ensure_ascii=True),
+        encoding="utf-8",
+    )
+    if target != raw_path:
+        raw_path.unlink()
+    return manifest
+
+
+def load_manifests(log_path: Path) -> list[SegmentManifest]:
+    directory = segments_dir(log_path)
+    if not directory.exists():
+        return []
+    stem = Path(log_path).stem
+    manifests: list[SegmentManifest] = []
+    for path in sorted(directory.glob(f"{stem}-*{_MANIFEST_SUFFIX}")):
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            continue
+        manifests.append(SegmentManifest.from_dict(directory, payload))
+    return manifests
+
+
+def iter_log_events(
+    log_path: Path,
+    *,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    event_types: Iterable[str] | None = None,
+) -> Iterator[dict[str, object]]:
+    """Yield events from closed segments and the active log, oldest first.
+
+    Segments whose manifest shows no overlap with ``since``/``until`` or none
+    of ``event_types`` are never opened.
+    """
+    log_path = Path(log_path)
+    since = _as_utc(since)
+    until = _as_utc(until)
+    wanted = set(event_types) if event_types is not None else None
+    for source in _sources(log_path, since, until, wanted):
+        try:
+            handle = _open_segment(source)
+        except FileNotFoundError:
+            # The sealer replaced this raw segment with its ``.gz`` meanwhile.
+            sealed = source.with_name(source.name + ".gz")
+            if source.suffix != ".log" or not sealed.exists():
+                continue
+            handle = _open_segment(sealed)
+        with handle:
+            for line in handle:
+                event = _parse_line(line)
+                if event is None:
+                    continue
+                if wanted is not None and event.get("event") not in wanted:
+                    continue
+                if (since is not None or until is not None) and not _in_window(
+                    event, since, until
+                ):
+                    continue
+                yield event
+
+
+def iter_segment_events(path: Path) -> Iterator[dict[str, object]]:
+    """Yield every event of one segment file, compressed or not."""
+    with _open_segment(Path(path)) as handle:
+        for line in handle:
+            event = _parse_line(line)
+            if event is not None:
+                yield event
+
+
+def _sources(
+    log_path: Path,
+    since: datetime | None,
+    until: datetime | None,
+    wanted: set[str] | None,
+) -> list[Path]:
+    sources: list[Path] = []
+    manifests = load_manifests(log_path)
+    sealed = {manifest.path.name for manifest in manifests}
+    for manifest in manifests:
+        if manifest.overlaps(since, until) and manifest.has_events(wanted):
+            sources.append(manifest.path)
+    directory = segments_dir(log_path)
+    if directory.exists():
+        # Rotated but not yet sealed (or interrupted) segments have no
+        # manifest and are always scanned.
+        for raw in sorted(directory.glob(f"{log_path.stem}-*.log")):
+            if raw.name in sealed or _manifest_path(raw).exists():
+                continue
+            sources.append(raw)
+    sources.sort(key=lambda path: path.name)
+    if log_path.exists():
+        sources.append(log_path)
+    return sources
+
+
+def _open_segment(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return path.open("r", encoding="utf-8")
+
+
+def _manifest_path(raw_path: Path) -> Path:
+    name = raw_path.name
+    for suffix in (".gz", ".log"):
+        if name.endswith(suffix):
+            name = name[: -len(suffix)]
+    return raw_path.with_name(name + _MANIFEST_SUFFIX)
+
+
+def _active_started(log_path: Path, stat: os.stat_result) -> float:
+    with _ACTIVE_LOCK:
+        cached = _ACTIVE_STARTS.get(log_path)
+    if cached is not None and cached[0] == stat.st_ino:
+        return cached[1]
+    started = stat.st_mtime
+    try:
+        with log_path.open("r", encoding="utf-8") as handle:
+            event = _parse_line(handle.readline())
+        if event is not None and isinstance(event.get("timestamp"), str):
+            started = _parse_timestamp(str(event["timestamp"])).timestamp()
+    except (OSError, ValueError):
+        pass
+    with _ACTIVE_LOCK:
+        _ACTIVE_STARTS[log_path] = (stat.st_ino, started)
+    return started
+
+
+class _SegmentStats:
+    def __init__(self) -> None:
+        self.start: str | None = None
+        self.end: str | None = None
+        self.count = 0
+        self.event_types: dict[str, int] = {}
+        self.min_request_id: str | None = None
+        self.max_request_id: str | None = None
+
+    def observe(self, line: str) -> None:
+        event = _parse_line(line)
+        if event is None:
+            return
+        self.count += 1
+        timestamp = event.get("timestamp")
+        if isinstance(timestamp, str):
+            self.start = min(self.start or timestamp, timestamp)
+            self.end = max(self.end or timestamp, timestamp)
+        event_type = str(event.get("event"))
+        self.event_types[event_type] = self.event_types.get(event_type, 0) + 1
+        request_id = event.get("request_id")
+        if isinstance(request_id, str):
+            self.min_request_id = min(self.min_request_id or request_id, request_id)
+            self.max_request_id = max(self.max_request_id or request_id, request_id)
+
+    def manifest(self, path: Path, compression: str) -> SegmentManifest:
+        return SegmentManifest(
+            path=path,
+            start=self.start,
+            end=self.end,
+            count=self.count,
+            event_types=dict(self.event_types),
+            min_request_id=self.min_request_id,
+            max_request_id=self.max_request_id,
+            compression=compression,
+        )
+
+
+def _parse_line(line: str) -> dict[str, object] | None:
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        event = json.loads(line)
+    except json.JSONDecodeError:
+        return None
+    return event if isinstance(event, dict) else None
+
+
+def _in_window(
+    event: dict[str, object], since: datetime | None, until: datetime | None
+) -> bool:
+    timestamp = event.get("timestamp")
+    if not isinstance(timestamp, str):
+        return False
+    try:
+        moment = _parse_timestamp(timestamp)
+    except ValueError:
+        return False
+    if since is not None and moment < since:
+        return False
+    if until is not None and moment > until:
+        return False
+    return True
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return _as_utc(datetime.fromisoformat(value))
+
+
+def _as_utc(moment: datetime | None) -> datetime | None:
+    if moment is not None and moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(str(raw).strip())
+    except ValueError:
+        return default
@@ -26,17 +26,12 @@ from skillos.execution_planner import (
     load_execution_plan,
     save_execution_plan,
 )
-from skillos.circuit_breaker import (
-    CircuitBreaker,
-    CircuitBreakerStore,
-    circuit_breaker_config_from_env,
-    default_circuit_breaker_path,
-)
+from skillos.circuit_breaker import circuit_breaker_from_env
 from skillos.feedback import FeedbackTracker, feedback_store_from_env
 from skillos.policy_engine import PolicyEngine, default_policy_path
 from skillos.risk_scorer import RiskScorer
 from skillos.routing import build_router_from_env, to_internal_id
-from skillos.routing_cache import routing_cache_from_env
+from skillos.routing_cache import normalized_query_hash, routing_cache_from_env
 from skillos.mode_selector import split_query
 from skillos.pipeline import PipelineRunner
 from skillos.skills.deprecation import build_deprecation_warning
@@ -47,10 +42,13 @@ from skillos.telemetry import (
     default_log_path,
     hash_query,
     new_request_id,
+    record_skill_execution,
     route_with_telemetry,
+    route_with_telemetry_async,
     token_count,
 )
 from skillos.tool_wrapper import ToolWrapper
+from skillos.tracing import span, traced
 
 _CALL_STACK: contextvars.ContextVar[List[str]] = contextvars.ContextVar("_CALL_STACK", default=[])
 MAX_CALL_DEPTH = 10
@@ -91,9 +89,8 @@ class Orchestrator:
         if dev_mode:
             self.feedback_tracker = MagicMock()
             self.feedback_tracker.get_confidence.return_value = 1.0 # Return float, not MagicMock
-            self.router = build_router_from_env(self.skills_metadata) 
-            self.routing_cache = MagicMock()
-            self.routing_cache.get.return_value = None
+            self.router = build_router_from_env(self.skills_metadata, root=root_path)
+            self.routing_cache = None
             self.budget_manager = MagicMock()
             allowed_result = BudgetCheckResult(
                 allowed=True, 
@@ -145,8 +142,10 @@ class Orchestrator:
             self.router = build_router_from_env(
                 self.skills_metadata,
                 confidence_provider=self.feedback_tracker.get_confidence,
+                root=root_path,
             )
             self.routing_cache = routing_cache_from_env(root_path)
+            self._routing_feedback_version = None
             
             self.budget_config = budget_config_from_env()
             self.budget_manager = BudgetManager(
@@ -164,10 +163,7 @@ class Orchestrator:
                 policy_engine=self.policy_engine,
                 approval_gate=self.approval_gate,
             )
-            self.circuit_breaker = CircuitBreaker(
-                CircuitBreakerStore(default_circuit_breaker_path(root_path)),
-                circuit_breaker_config_from_env(),
-            )
+            self.circuit_breaker = circuit_breaker_from_env(root_path)
 
     @classmethod
     def run_simple(cls, query: str, root_path: Path | str, **kwargs) -> Any:
@@ -202,6 +198,7 @@ class Orchestrator:
             else:
                 os.environ["SKILLOS_ROOT"] = original_root
 
+    @traced("request")
     def run_query(
         self,
         query: str,
@@ -327,6 +324,7 @@ class Orchestrator:
 
         return self._finalize_session_response(response, session, session_store)
 
+    @traced("request")
     async def run_query_async(
         self,
         query: str,
@@ -586,7 +584,8 @@ class Orchestrator:
                 )
 
             # 6.5 Circuit Check
-            circuit_decision = self.circuit_breaker.allow(plan.internal_skill_id)
+            with span("circuit_breaker"):
+                circuit_decision = self.circuit_breaker.allow(plan.internal_skill_id)
             if not circuit_decision.allowed:
                 logger.log(
                     "policy_decision",
@@ -660,6 +659,7 @@ class Orchestrator:
         )
         request_payload = {
             "query_hash": hash_query(query),
+            "normalized_query_hash": normalized_query_hash(query),
             "query_length": len(query),
             "token_count": token_count(query),
         }
@@ -738,14 +738,27 @@ class Orchestrator:
         }
 
     def _maybe_reload_registry(self) -> None:
-        records = self.registry.reload_if_changed()
-        if records is None:
-            return
-        self.skills_metadata = [record.metadata for record in records.values()]
-        self.router = build_router_from_env(
-            self.skills_metadata,
-            confidence_provider=self.feedback_tracker.get_confidence,
-        )
+        diff = self.registry.reload_if_changed()
+        changed_tokens: frozenset[str] | None = None
+        if diff is not None:
+            self.skills_metadata = [
+                record.metadata for record in diff.records.values()
+            ]
+            changed_tokens = frozenset()
+            if not diff.is_empty:
+                changed_tokens = self.router.update(
+                    diff.upserted, removed=diff.removed
+                )
+        if self.routing_cache is not None:
+            feedback_version = self.feedback_tracker.version()
+            if feedback_version != self._routing_feedback_version:
+                # Confidence moved for every skill: no token scope applies.
+                changed_tokens = None
+                self._routing_feedback_version = feedback_version
+            self.routing_cache.observe_version(
+                (self.registry.refresh_token, feedback_version),
+                changed_tokens=changed_tokens,
+            )
 
     def _policy_refresh_state(self) -> float:
         try:
@@ -794,6 +807,7 @@ class Orchestrator:
         }
         return plan, metadata, skill_selected
 
+    @traced("budget")
     def _budget_check(
         self,
         *,
@@ -827,6 +841,7 @@ class Orchestrator:
         )
         return budget_result
 
+    @traced("permission")
     def _permission_check(
         self,
         plan,
@@ -861,6 +876,7 @@ class Orchestrator:
         )
         return perm_decision
 
+    @traced("approval")
     def _approval_check(
         self,
         plan,
@@ -890,6 +906,7 @@ class Orchestrator:
             approval_status=decision.approval.status,
         )
         return decision
+    @traced("execution")
     def _execute_skill(
         self,
         plan,
@@ -937,6 +954,9 @@ class Orchestrator:
                 skill_id=plan.skill_id,
                 duration_ms=duration,
             )
+            record_skill_execution(
+                plan.skill_id, "success", duration, source="orchestrator"
+            )
             self.circuit_breaker.record_success(plan.internal_skill_id)
             return execution.output
         except Exception as exc:
@@ -947,11 +967,13 @@ class Orchestrator:
                 error_class=exc.__class__.__name__,
                 duration_ms=duration,
             )
+            record_skill_execution(plan.skill_id, "error", duration, source="orchestrator")
             self.circuit_breaker.record_failure(plan.internal_skill_id)
             raise exc
         finally:
             _CALL_STACK.reset(token)
 
+    @traced("routing")
     def _route_query(
         self,
         query: str,
@@ -980,6 +1002,7 @@ class Orchestrator:
             })
         return result
 
+    @traced("routing")
     async def _route_query_async(
         self,
         query: str,
@@ -990,8 +1013,7 @@ class Orchestrator:
         debug_trace: Optional[DebugTrace],
     ):
         with trace_step(debug_trace, "route", inputs={"query": query}) as trace_output:
-            telemetry = await asyncio.to_thread(
-                route_with_telemetry,
+            telemetry = await route_with_telemetry_async(
                 query,
                 self.router,
                 logger,
@@ -15,20 +15,21 @@ from skillos.budget import (
     budget_usage_store_from_env,
 )
 from skillos.composition import parallel_limit_from_env
-from skillos.circuit_breaker import (
-    CircuitBreaker,
-    CircuitBreakerStore,
-    circuit_breaker_config_from_env,
-    default_circuit_breaker_path,
-)
+from skillos.circuit_breaker import circuit_breaker_from_env
 from skillos.debugging import StepController
 from skillos.skills.deprecation import build_deprecation_warning
 from skillos.policy_engine import PolicyEngine, default_policy_path
 from skillos.risk_scorer import RiskScorer
 from skillos.routing import to_internal_id, to_public_id
 from skillos.skills.registry import SkillRegistry
-from skillos.telemetry import EventLogger, default_log_path, new_request_id
+from skillos.telemetry import (
+    EventLogger,
+    default_log_path,
+    new_request_id,
+    record_skill_execution,
+)
 from skillos.tool_wrapper import ToolWrapper
+from skillos.tracing import submit_in_context, traced
 
 
 class PipelineError(ValueError):
@@ -124,10 +125,7 @@ class PipelineRunner:
             policy_engine=policy_engine,
             approval_gate=ApprovalGate(required_token=approval_token_from_env()),
         )
-        self.circuit_breaker = CircuitBreaker(
-            CircuitBreakerStore(default_circuit_breaker_path(self.root_path)),
-            circuit_breaker_config_from_env(),
-        )
+        self.circuit_breaker = circuit_breaker_from_env(self.root_path)
         self.parallel_limit = parallel_limit or parallel_limit_from_env()
         self.step_controller = step_controller
 
@@ -441,6 +439,7 @@ class PipelineRunner:
         reason: str,
     ) -> PipelineStepResult:
         duration_ms = (time.perf_counter() - start) * 1000
+        record_skill_execution(step_id, "blocked", duration_ms, source="pipeline")
         logger.log(
             "execution_result",
             status="blocked",
@@ -466,6 +465,7 @@ class PipelineRunner:
         )
         return result
 
+    @traced("pipeline.step")
     def _execute_step(
         self,
         logger: EventLogger,
@@ -506,6 +506,7 @@ class PipelineRunner:
                 error_class=exc.__class__.__name__,
                 skill_id=public_id,
             )
+            record_skill_execution(public_id, "error", duration_ms, source="pipeline")
             self.circuit_breaker.record_failure(internal_id)
             result = PipelineStepResult(
                 step_id=public_id,
@@ -536,6 +537,7 @@ class PipelineRunner:
             duration_ms=duration_ms,
             skill_id=public_id,
         )
+        record_skill_execution(public_id, "success", duration_ms, source="pipeline")
         self.circuit_breaker.record_success(internal_id)
         result = PipelineStepResult(
             step_id=public_id,
@@ -555,6 +557,7 @@ class PipelineRunner:
             )
         return result
 
+    @traced("pipeline.step")
     async def _execute_step_async(
         self,
         logger: EventLogger,
@@ -595,6 +598,7 @@ class PipelineRunner:
                 error_class=exc.__class__.__name__,
                 skill_id=public_id,
             )
+            record_skill_execution(public_id, "error", duration_ms, source="pipeline")
             self.circuit_breaker.record_failure(internal_id)
             result = PipelineStepResult(
                 step_id=public_id,
@@ -625,6 +629,7 @@ class PipelineRunner:
             duration_ms=duration_ms,
             skill_id=public_id,
         )
+        record_skill_execution(public_id, "success", duration_ms, source="pipeline")
         self.circuit_breaker.record_success(internal_id)
         result = PipelineStepResult(
             step_id=public_id,
@@ -689,7 +694,8 @@ class PipelineRunner:
         with ThreadPoolExecutor(max_workers=self.parallel_limit) as executor:
             future_map = {}
             for offset, (internal_id, public_id) in enumerate(zip(group, public_ids)):
-                future = executor.submit(
+                future = submit_in_context(
+                    executor,
                     self._execute_step,
                     logger,
                     internal_id,
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+import os
+import re
+import sys
+import threading
+import time
+
+# Leaf frames of threads that are parked rather than working: executor
+# workers blocked on their queue, the event loop in select(), Condition waits.
+_IDLE_LEAVES = frozenset(
+    {
+        "concurrent.futures.thread:_worker",
+        "selectors:select",
+        "threading:wait",
+        "queue:get",
+    }
+)
+_THREAD_SUFFIX_RE = re.compile(r"[-_]\d+(_\d+)?$")
+
+
+class ProfilerError(RuntimeError):
+    pass
+
+
+class ProfilerBusyError(ProfilerError):
+    pass
+
+
+@dataclass(frozen=True)
+class ProfilerConfig:
+    enabled: bool = False
+    token: str | None = None
+    max_seconds: float = 60.0
+    min_interval_ms: float = 5.0
+    default_interval_ms: float = 10.0
+
+
+def profiler_config_from_env() -> ProfilerConfig:
+    return ProfilerConfig(
+        enabled=_env_bool("SKILLOS_PROFILE_ENABLED", False),
+        token=os.getenv("SKILLOS_PROFILE_TOKEN") or None,
+        max_seconds=max(_env_float("SKILLOS_PROFILE_MAX_SECONDS", 60.0), 0.1),
+        min_interval_ms=max(_env_float("SKILLOS_PROFILE_MIN_INTERVAL_MS", 5.0), 1.0),
+        default_interval_ms=max(_env_float("SKILLOS_PROFILE_INTERVAL_MS", 10.0), 1.0),
+    )
+
+
+# Thread id -> skill currently executing on it. Written by skill_scope around
+# kernel calls, read by the sampler thread; plain dict operations are atomic.
+_ACTIVE_SKILLS: dict[int, str] = {}
+
+
+class skill_scope:
+    """Tag samples of the current thread with ``skill_id`` while it runs."""
+
+    __slots__ = ("_skill_id", "_thread_id", "_previous")
+
+    def __init__(self, skill_id: str) -> None:
+        self._skill_id = skill_id
+        self._thread_id = 0
+        self._previous: str | None = None
+
+    def __enter__(self) -> None:
+        self._thread_id = threading.get_ident()
+        self._previous = _ACTIVE_SKILLS.get(self._thread_id)
+        _ACTIVE_SKILLS[self._thread_id] = self._skill_id
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if self._previous is None:
+            _ACTIVE_SKILLS.pop(self._thread_id, None)
+        else:
+            _ACTIVE_SKILLS[self._thread_id] = self._previous
+
+
+class StackSampler:
+    """Periodically samples the Python stacks of every thread in the process.
+
+    Stacks are folded into collapsed-stack lines (``root;...;leaf count``) as
+    they are taken, so memory is bounded by the number of distinct stacks and
+    not by the duration. The first frame is ``skill:<id>`` while a skill runs
+    on the thread, otherwise ``thread:<name>``.
+    """
+
+    def __init__(self, interval_ms: float = 10.0, *, include_idle: bool = False) -> None:
+        self.interval = interval_ms / 1000
+        self.include_idle = include_idle
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="skillos-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def run_for(self, seconds: float) -> None:
+        self.start()
+        try:
+            self._stop.wait(seconds)
+        finally:
+            self.stop()
+
+    def sample(self) -> None:
+        own = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            stack = _collapse(frame)
+            if not stack:
+                continue
+            if not self.include_idle and stack[-1] in _IDLE_LEAVES:
+                continue
+            skill_id = _ACTIVE_SKILLS.get(thread_id)
+            if skill_id is not None:
+                root = f"skill:{skill_id}"
+            else:
+                name = names.get(thread_id, "unknown")
+                root = f"thread:{_THREAD_SUFFIX_RE.sub('', name)}"
+            self.stacks[";".join((root, *stack))] += 1
+        self.samples += 1
+
+    def collapsed(self) -> str:
+        return "".join(
+            f"{stack} {count}\n" for stack, count in sorted(self.stacks.items())
+        )
+
+    def _run(self) -> None:
+        next_at = time.monotonic()
+        while not self._stop.is_set():
+            self.sample()
+            next_at += self.interval
+            delay = next_at - time.monotonic()
+            if delay < 0:
+                # Fell behind (GIL contention under load): skip missed ticks
+                # instead of sampling in a burst.
+                next_at = time.monotonic()
+                delay = self.interval
+            self._stop.wait(delay)
+
+
+_SESSION_LOCK = threading.Lock()
+
+
+def profile_process(
+    seconds: float,
+    *,
+    interval_ms: float | None = None,
+    include_idle: bool = False,
+    config: ProfilerConfig | None = None,
+) -> StackSampler:
+    """Sample this process for ``seconds``; one session may run at a time."""
+    config = config or profiler_config_from_env()
+    if seconds <= 0:
+        raise ProfilerError("seconds must be positive")
+    seconds = min(seconds, config.max_seconds)
+    interval = max(interval_ms or config.default_interval_ms, config.min_interval_ms)
+    if not _SESSION_LOCK.acquire(blocking=False):
+        raise ProfilerBusyError("A profiling session is already running")
+    try:
+        sampler = StackSampler(interval, include_idle=include_idle)
+        sampler.run_for(seconds)
+        return sampler
+    finally:
+        _SESSION_LOCK.release()
+
+
+def _collapse(frame) -> list[str]:
+    stack: list[str] = []
+    while frame is not None:
+        code = frame.f_code
+        module = frame.f_globals.get("__name__", "?")
+        stack.append(f"{module}:{code.co_name}")
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return str(raw).strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(str(raw).strip())
+    except ValueError:
+        return default
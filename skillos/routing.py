@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
+import heapq
+import operator
 import os
+from pathlib import Path
 import re
+import threading
+import time
 from typing import Callable, Iterable
 
 from skillos.skills.models import SkillMetadata
 from skillos.vector_search import (
-    QdrantVectorSearch,
     VectorDocument,
+    VectorMatch,
+    VectorSearchBackend,
     VectorSearchError,
-    vector_search_config_from_env,
+    vector_search_from_env,
 )
 
 _TOKEN_RE = re.compile(r"[a-zA-Z0-9]+")
+# Delay before a vector backend that missed an update is fully re-synced.
+_VECTOR_RETRY_SECONDS = 30.0
 
 _KEYWORD_WEIGHTS: dict[str, int] = {
     "summarize": 3,
@@ -73,6 +82,11 @@ def _normalize_tokens(text: str) -> set[str]:
     return tokens
 
 
+def keyword_tokens(text: str) -> frozenset[str]:
+    """Tokens keyword routing matches ``text`` on, plural variants included."""
+    return frozenset(_normalize_tokens(text))
+
+
 def _token_weight(token: str) -> int:
     return _KEYWORD_WEIGHTS.get(token, 1)
 
@@ -111,6 +125,183 @@ class SkillProfile:
         )
 
 
+class _KeywordIndex:
+    """Inverted token index over router profiles.
+
+    Each profile owns a slot. Tokens map to their routing weight and the list
+    of slots that contain them, so a query only scores the profiles sharing
+    at least one token with it. Tags and deprecation are kept as slot sets
+    and intersected with the matched slots, so filtering costs follow the
+    number of matches rather than the size of the catalog.
+
+    ``copy`` shares posting lists and tag sets with the original; a copy
+    duplicates one the first time it changes it, so patching a copy never
+    alters an index that readers may still hold.
+    """
+
+    def __init__(self, profiles: Iterable[SkillProfile] = ()) -> None:
+        self._slots: list[SkillProfile | None] = []
+        self._slot_ids: list[str] = []
+        self._slot_by_id: dict[str, int] = {}
+        self._free_slots: list[int] = []
+        self._postings: dict[str, tuple[int, list[int]]] = {}
+        self._tag_slots: dict[str, set[int]] = {}
+        self._deprecated_slots: set[int] = set()
+        # Tokens and tags whose slot collections this index created and may
+        # mutate.
+        self._owned: set[str] = set()
+        self._owned_tags: set[str] = set()
+        for profile in profiles:
+            self.add(profile)
+
+    def copy(self) -> "_KeywordIndex":
+        clone = _KeywordIndex()
+        clone._slots = list(self._slots)
+        clone._slot_ids = list(self._slot_ids)
+        clone._slot_by_id = dict(self._slot_by_id)
+        clone._free_slots = list(self._free_slots)
+        clone._postings = dict(self._postings)
+        clone._tag_slots = dict(self._tag_slots)
+        clone._deprecated_slots = set(self._deprecated_slots)
+        return clone
+
+    def add(self, profile: SkillProfile) -> None:
+        if profile.public_id in self._slot_by_id:
+            self.remove(profile.public_id)
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._slots[slot] = profile
+            self._slot_ids[slot] = profile.public_id
+        else:
+            slot = len(self._slots)
+            self._slots.append(profile)
+            self._slot_ids.append(profile.public_id)
+        self._slot_by_id[profile.public_id] = slot
+        for token in profile.keywords:
+            if token in self._postings:
+                self._owned_slots(token).append(slot)
+            else:
+                self._postings[token] = (_token_weight(token), [slot])
+                self._owned.add(token)
+        for tag in profile.tags:
+            if tag in self._tag_slots:
+                self._owned_tag_slots(tag).add(slot)
+            else:
+                self._tag_slots[tag] = {slot}
+                self._owned_tags.add(tag)
+        if profile.deprecated:
+            self._deprecated_slots.add(slot)
+
+    def remove(self, public_id: str) -> SkillProfile | None:
+        slot = self._slot_by_id.pop(public_id, None)
+        if slot is None:
+            return None
+        profile = self._slots[slot]
+        self._slots[slot] = None
+        self._free_slots.append(slot)
+        for token in profile.keywords:
+            slots = self._owned_slots(token)
+            slots.remove(slot)
+            if not slots:
+                del self._postings[token]
+                self._owned.discard(token)
+        for tag in profile.tags:
+            tag_slots = self._owned_tag_slots(tag)
+            tag_slots.discard(slot)
+            if not tag_slots:
+                del self._tag_slots[tag]
+                self._owned_tags.discard(tag)
+        self._deprecated_slots.discard(slot)
+        return profile
+
+    def match(
+        self,
+        query_tokens: set[str],
+        tag_filter: set[str] | None,
+        include_deprecated: bool,
+    ) -> list[tuple[SkillProfile, int]]:
+        return self.match_many([query_tokens], tag_filter, include_deprecated)[0]
+
+    def match_many(
+        self,
+        token_sets: list[set[str]],
+        tag_filter: set[str] | None,
+        include_deprecated: bool,
+        limit: int | None = None,
+    ) -> list[list[tuple[SkillProfile, int]]]:
+        """Return ``(profile, keyword_score)`` matches for each token set.
+
+        With ``limit`` only the best ``limit`` matches of each query are
+        returned, ordered by score and then id as ``SkillRouter._rank`` would
+        order them.
+        """
+        postings: dict[str, tuple[int, list[int]] | None] = {}
+        tag_slots = (
+            [self._tag_slots[tag] for tag in tag_filter if tag in self._tag_slots]
+            if tag_filter
+            else None
+        )
+        batch: list[list[tuple[SkillProfile, int]]] = []
+        for query_tokens in token_sets:
+            scores: Counter[int] = Counter()
+            for token in query_tokens:
+                if token in postings:
+                    posting = postings[token]
+                else:
+                    posting = postings[token] = self._postings.get(token)
+                if posting is None:
+                    continue
+                weight, slots = posting
+                if weight == 1:
+                    # Counter.update counts a list in C.
+                    scores.update(slots)
+                else:
+                    for slot in slots:
+                        scores[slot] += weight
+            if tag_slots is not None:
+                allowed: set[int] = set()
+                for slots_with_tag in tag_slots:
+                    allowed |= slots_with_tag.intersection(scores)
+                scores = Counter({slot: scores[slot] for slot in allowed})
+            if not include_deprecated and self._deprecated_slots:
+                for slot in self._deprecated_slots.intersection(scores):
+                    del scores[slot]
+            batch.append(self._top_matches(scores, limit))
+        return batch
+
+    def _top_matches(
+        self, scores: dict[int, int], limit: int | None
+    ) -> list[tuple[SkillProfile, int]]:
+        profiles = self._slots
+        if limit is None:
+            return [(profiles[slot], score) for slot, score in scores.items()]
+        top = heapq.nsmallest(
+            limit,
+            zip(
+                map(operator.neg, scores.values()),
+                map(self._slot_ids.__getitem__, scores),
+                scores,
+            ),
+        )
+        return [(profiles[slot], -score) for score, _, slot in top]
+
+    def _owned_slots(self, token: str) -> list[int]:
+        weight, slots = self._postings[token]
+        if token not in self._owned:
+            slots = list(slots)
+            self._postings[token] = (weight, slots)
+            self._owned.add(token)
+        return slots
+
+    def _owned_tag_slots(self, tag: str) -> set[int]:
+        slots = self._tag_slots[tag]
+        if tag not in self._owned_tags:
+            slots = set(slots)
+            self._tag_slots[tag] = slots
+            self._owned_tags.add(tag)
+        return slots
+
+
 @dataclass
 class SkillCandidate:
     skill_id: str
@@ -194,6 +385,30 @@ def routing_config_from_env() -> RoutingConfig:
     )
 
 
+@dataclass(frozen=True)
+class _RouterSnapshot:
+    """Profiles and the keyword index built from them, published together.
+
+    Neither is mutated once published: ``SkillRouter.update`` patches copies
+    and swaps the whole snapshot, so a query reads one consistent catalog.
+    """
+
+    profiles: dict[str, SkillProfile]
+    keyword_index: _KeywordIndex
+
+
+@dataclass(frozen=True)
+class _RoutingBatch:
+    snapshot: _RouterSnapshot
+    queries: list[str]
+    unique_queries: list[str]
+    tag_filter: set[str] | None
+    token_sets: list[set[str]]
+    keyword_matches: list[list[tuple[SkillProfile, int]]]
+    # True when keyword_matches are already cut to the limit in final order.
+    keyword_ranked: bool = False
+
+
 @dataclass(frozen=True)
 class RoutingResult:
     status: str
@@ -211,13 +426,19 @@ class SkillRouter:
         low_confidence_threshold: float = 0.25,
         margin_threshold: float = 0.05,
         confidence_provider: Callable[[str], float] | None = None,
-        vector_search: QdrantVectorSearch | None = None,
+        vector_search: VectorSearchBackend | None = None,
         routing_config: RoutingConfig | None = None,
     ) -> None:
-        profiles = [SkillProfile.from_metadata(metadata) for metadata in skills]
-        self._profiles: dict[str, SkillProfile] = {
-            profile.public_id: profile for profile in profiles
+        profiles = {
+            profile.public_id: profile
+            for profile in (SkillProfile.from_metadata(metadata) for metadata in skills)
         }
+        self._snapshot = _RouterSnapshot(profiles, _KeywordIndex(profiles.values()))
+        self._update_lock = threading.Lock()
+        # Set when the vector backend missed an update; routing is then
+        # keyword-only until a full sync succeeds (retried by time or update).
+        self._vector_stale = False
+        self._vector_retry_at = 0.0
         self._low_confidence_threshold = low_confidence_threshold
         self._margin_threshold = margin_threshold
         self._confidence_provider = confidence_provider
@@ -240,11 +461,20 @@ class SkillRouter:
     def rank_candidates(
         self, query: str, candidates: Iterable[SkillCandidate]
     ) -> list[SkillCandidate]:
-        query_tokens = _normalize_tokens(query)
+        return self._rank(
+            self._snapshot.profiles, _normalize_tokens(query), candidates
+        )
+
+    def _rank(
+        self,
+        profiles: dict[str, SkillProfile],
+        query_tokens: set[str],
+        candidates: Iterable[SkillCandidate],
+    ) -> list[SkillCandidate]:
         ranked: list[SkillCandidate] = []
         for candidate in candidates:
             public_id = to_public_id(candidate.skill_id)
-            profile = self._profiles.get(public_id)
+            profile = profiles.get(public_id)
             keyword_score = candidate.keyword_score
             internal_id = candidate.internal_id
             if profile:
@@ -273,24 +503,121 @@ class SkillRouter:
         limit: int = 5,
         tags: Iterable[str] | None = None,
     ) -> RoutingResult:
-        query_tokens = _normalize_tokens(query)
-        keyword_candidates = self._keyword_candidates(query_tokens, tags)
-        if not self._vector_search or self._routing_config.mode == "keyword":
-            ranked = self.rank_candidates(query, keyword_candidates.values())[:limit]
-            return self._build_result(ranked)
+        return self.route_many([query], limit=limit, tags=tags)[0]
+
+    async def route_async(
+        self,
+        query: str,
+        limit: int = 5,
+        tags: Iterable[str] | None = None,
+    ) -> RoutingResult:
+        results = await self.route_many_async([query], limit=limit, tags=tags)
+        return results[0]
 
-        semantic_scores = self._semantic_scores(query, tags)
+    def route_many(
+        self,
+        queries: Iterable[str],
+        limit: int = 5,
+        tags: Iterable[str] | None = None,
+    ) -> list[RoutingResult]:
+        """Route a batch of queries, returning results in input order.
+
+        Repeated queries are routed once, keyword postings and filters are
+        resolved once for the whole batch and the vector backend receives a
+        single batched search.
+        """
+        batch = self._prepare_batch(queries, tags, limit)
+        semantic_batches = self._semantic_scores_many(batch)
+        return self._finish_batch(batch, semantic_batches, limit)
+
+    async def route_many_async(
+        self,
+        queries: Iterable[str],
+        limit: int = 5,
+        tags: Iterable[str] | None = None,
+    ) -> list[RoutingResult]:
+        batch = self._prepare_batch(queries, tags, limit)
+        semantic_batches = await self._semantic_scores_many_async(batch)
+        return self._finish_batch(batch, semantic_batches, limit)
+
+    def vector_connection_stats(self) -> dict[str, int] | None:
+        stats = getattr(self._vector_search, "connection_stats", None)
+        return stats() if stats else None
+
+    def _prepare_batch(
+        self, queries: Iterable[str], tags: Iterable[str] | None, limit: int
+    ) -> _RoutingBatch:
+        snapshot = self._snapshot
+        queries = list(queries)
+        unique_queries = list(dict.fromkeys(queries))
+        tag_filter = _normalize_tag_filter(tags)
+        token_sets = [_normalize_tokens(query) for query in unique_queries]
+        keyword_limit = self._keyword_limit(limit)
+        keyword_matches = snapshot.keyword_index.match_many(
+            token_sets,
+            tag_filter,
+            self._routing_config.include_deprecated,
+            limit=keyword_limit,
+        )
+        return _RoutingBatch(
+            snapshot=snapshot,
+            queries=queries,
+            unique_queries=unique_queries,
+            tag_filter=tag_filter,
+            token_sets=token_sets,
+            keyword_matches=keyword_matches,
+            keyword_ranked=keyword_limit is not None,
+        )
+
+    def _keyword_limit(self, limit: int) -> int | None:
+        # Without semantic scores or confidence adjustments the keyword
+        # order is final, so only the top ``limit`` matches can be returned.
+        if limit <= 0 or self._confidence_provider is not None:
+            return None
+        if self._vector_search and self._routing_config.mode != "keyword":
+            return None
+        return limit
+
+    def _finish_batch(
+        self,
+        batch: _RoutingBatch,
+        semantic_batches: list[dict[str, float]],
+        limit: int,
+    ) -> list[RoutingResult]:
+        routed: dict[str, RoutingResult] = {}
+        profiles = batch.snapshot.profiles
+        for query, query_tokens, matches, semantic_scores in zip(
+            batch.unique_queries,
+            batch.token_sets,
+            batch.keyword_matches,
+            semantic_batches,
+        ):
+            keyword_candidates = self._keyword_candidates(query_tokens, matches)
+            if batch.keyword_ranked:
+                ranked = list(keyword_candidates.values())
+            else:
+                ranked = self._combine(
+                    profiles, query_tokens, keyword_candidates, semantic_scores
+                )
+            routed[query] = self._build_result(ranked[:limit])
+        return [routed[query] for query in batch.queries]
+
+    def _combine(
+        self,
+        profiles: dict[str, SkillProfile],
+        query_tokens: set[str],
+        keyword_candidates: dict[str, SkillCandidate],
+        semantic_scores: dict[str, float],
+    ) -> list[SkillCandidate]:
         if not semantic_scores:
-            ranked = self.rank_candidates(query, keyword_candidates.values())[:limit]
-            return self._build_result(ranked)
+            return self._rank(profiles, query_tokens, keyword_candidates.values())
 
         keyword_weight, vector_weight = self._normalized_weights(
             self._routing_config.keyword_weight,
             self._routing_config.vector_weight,
         )
         if vector_weight == 0.0:
-            ranked = self.rank_candidates(query, keyword_candidates.values())[:limit]
-            return self._build_result(ranked)
+            return self._rank(profiles, query_tokens, keyword_candidates.values())
 
         candidates: list[SkillCandidate] = []
         for skill_id in set(keyword_candidates) | set(semantic_scores):
@@ -306,7 +633,7 @@ class SkillRouter:
             internal_id = (
                 keyword_candidate.internal_id
                 if keyword_candidate and keyword_candidate.internal_id
-                else self._profiles[skill_id].internal_id
+                else profiles[skill_id].internal_id
             )
             candidates.append(
                 SkillCandidate(
@@ -317,9 +644,7 @@ class SkillRouter:
                     internal_id=internal_id,
                 )
             )
-
-        ranked = self.rank_candidates(query, candidates)[:limit]
-        return self._build_result(ranked)
+        return self._rank(profiles, query_tokens, candidates)
 
     def _build_result(self, ranked: list[SkillCandidate]) -> RoutingResult:
         if not ranked:
@@ -356,51 +681,75 @@ class SkillRouter:
             _token_weight(token) for token in query_tokens if token in keywords
         )
 
+    @staticmethod
     def _keyword_candidates(
-        self,
         query_tokens: set[str],
-        tags: Iterable[str] | None = None,
+        matches: list[tuple[SkillProfile, int]],
     ) -> dict[str, SkillCandidate]:
         total_weight = sum(_token_weight(token) for token in query_tokens) or 1
         candidates: dict[str, SkillCandidate] = {}
-        tag_filter = _normalize_tag_filter(tags)
-        for profile in self._profiles.values():
-            if not self._routing_config.include_deprecated and profile.deprecated:
-                continue
-            if tag_filter and not _matches_tags(profile.tags, tag_filter):
-                continue
-            keyword_score = self._keyword_score(query_tokens, profile.keywords)
-            if keyword_score == 0:
-                continue
-            score = keyword_score / total_weight
+        for profile, keyword_score in matches:
             candidates[profile.public_id] = SkillCandidate(
                 skill_id=profile.public_id,
-                score=score,
+                score=keyword_score / total_weight,
                 keyword_score=keyword_score,
                 internal_id=profile.internal_id,
             )
         return candidates
 
-    def _semantic_scores(
-        self, query: str, tags: Iterable[str] | None = None
-    ) -> dict[str, float]:
-        if not self._vector_search:
-            return {}
+    def _semantic_scores_many(self, batch: _RoutingBatch) -> list[dict[str, float]]:
+        queries = batch.unique_queries
+        vector_search = self._searchable_vector_backend()
+        if vector_search is None:
+            # Keyword-only until the backend has finished indexing.
+            return [{} for _ in queries]
         try:
-            matches = self._vector_search.search(
-                query,
+            batches = vector_search.search_many(
+                queries,
                 limit=self._routing_config.vector_top_k,
                 min_score=self._routing_config.vector_min_score,
             )
         except VectorSearchError:
-            return {}
+            return [{} for _ in queries]
+        return [self._semantic_scores(batch, matches) for matches in batches]
+
+    async def _semantic_scores_many_async(
+        self, batch: _RoutingBatch
+    ) -> list[dict[str, float]]:
+        queries = batch.unique_queries
+        vector_search = self._searchable_vector_backend()
+        if vector_search is None:
+            return [{} for _ in queries]
+        try:
+            batches = await vector_search.search_many_async(
+                queries,
+                limit=self._routing_config.vector_top_k,
+                min_score=self._routing_config.vector_min_score,
+            )
+        except VectorSearchError:
+            return [{} for _ in queries]
+        return [self._semantic_scores(batch, matches) for matches in batches]
+
+    def _searchable_vector_backend(self) -> VectorSearchBackend | None:
+        vector_search = self._vector_search
+        if not vector_search or self._routing_config.mode == "keyword":
+            return None
+        if self._vector_stale:
+            self._retry_vector_sync()
+            return None
+        return vector_search if vector_search.ready else None
+
+    def _semantic_scores(
+        self, batch: _RoutingBatch, matches: Iterable[VectorMatch]
+    ) -> dict[str, float]:
+        profiles = batch.snapshot.profiles
+        tag_filter = batch.tag_filter
         scores: dict[str, float] = {}
-        tag_filter = _normalize_tag_filter(tags)
         for match in matches:
             public_id = to_public_id(match.doc_id)
-            if public_id not in self._profiles:
+            profile = profiles.get(public_id)
+            if profile is None:
                 continue
-            profile = self._profiles[public_id]
             if (
                 not self._routing_config.include_deprecated
                 and profile.deprecated
@@ -422,34 +771,122 @@ class SkillRouter:
             return 1.0, 0.0
         return keyword_weight / total, vector_weight / total
 
+    def update(
+        self,
+        upserted: Iterable[SkillMetadata] = (),
+        removed: Iterable[str] = (),
+    ) -> frozenset[str]:
+        """Patch the router in place after a registry reload.
+
+        Only the given skills are re-profiled, re-indexed and re-sent to the
+        vector backend; every other profile and vector point is left alone.
+        The patched catalog is published as a new snapshot, so queries in
+        flight finish against the one they started with. If the backend
+        rejects the change it is marked stale and fully re-synced later.
+        Returns the keyword tokens of the touched skills, before and after,
+        i.e. every token whose keyword matches may have changed.
+        """
+        with self._update_lock:
+            snapshot = self._snapshot
+            profiles = dict(snapshot.profiles)
+            keyword_index = snapshot.keyword_index.copy()
+            changed_tokens: set[str] = set()
+            removed_ids = [to_public_id(skill_id) for skill_id in removed]
+            for public_id in removed_ids:
+                keyword_index.remove(public_id)
+                previous = profiles.pop(public_id, None)
+                if previous is not None:
+                    changed_tokens.update(previous.keywords)
+            upserted_profiles = [
+                SkillProfile.from_metadata(metadata) for metadata in upserted
+            ]
+            for profile in upserted_profiles:
+                previous = profiles.get(profile.public_id)
+                if previous is not None:
+                    changed_tokens.update(previous.keywords)
+                changed_tokens.update(profile.keywords)
+                keyword_index.add(profile)
+                profiles[profile.public_id] = profile
+            self._snapshot = _RouterSnapshot(profiles, keyword_index)
+            if not self._vector_search:
+                return frozenset(changed_tokens)
+            if self._vector_stale:
+                # Earlier changes never reached the backend; send everything.
+                self._sync_vector_search()
+                return frozenset(changed_tokens)
+            try:
+                if removed_ids:
+                    self._vector_search.delete(removed_ids)
+                self._vector_search.index(_vector_documents(upserted_profiles))
+            except VectorSearchError:
+                self._mark_vector_stale()
+            return frozenset(changed_tokens)
+
     def _index_vector_search(self) -> None:
         if not self._vector_search:
             return
-        documents = [
-            VectorDocument(
-                doc_id=profile.public_id,
-                text=profile.document,
-                payload={"skill_id": profile.public_id},
-            )
-            for profile in self._profiles.values()
-        ]
+        with self._update_lock:
+            self._sync_vector_search()
+
+    def _sync_vector_search(self) -> None:
+        """Make the backend match the current snapshot; hold ``_update_lock``."""
         try:
-            self._vector_search.index(documents)
+            self._vector_search.sync(
+                _vector_documents(self._snapshot.profiles.values())
+            )
         except VectorSearchError:
-            self._vector_search = None
+            self._mark_vector_stale()
+        else:
+            self._vector_stale = False
+
+    def _mark_vector_stale(self) -> None:
+        self._vector_retry_at = time.monotonic() + _VECTOR_RETRY_SECONDS
+        self._vector_stale = True
+
+    def _retry_vector_sync(self) -> None:
+        """Start one background re-sync once the retry delay has passed."""
+        if time.monotonic() < self._vector_retry_at:
+            return
+        if not self._update_lock.acquire(blocking=False):
+            return
+        if not self._vector_stale:
+            self._update_lock.release()
+            return
+        # Push the deadline out so concurrent readers do not start another.
+        self._vector_retry_at = time.monotonic() + _VECTOR_RETRY_SECONDS
+
+        def _resync() -> None:
+            try:
+                self._sync_vector_search()
+            finally:
+                self._update_lock.release()
+
+        threading.Thread(
+            target=_resync, name="skillos-vector-resync", daemon=True
+        ).start()
+
+
+def _vector_documents(profiles: Iterable[SkillProfile]) -> list[VectorDocument]:
+    return [
+        VectorDocument(
+            doc_id=profile.public_id,
+            text=profile.document,
+            payload={"skill_id": profile.public_id},
+        )
+        for profile in profiles
+    ]
 
 
 def build_router_from_env(
     skills: Iterable[SkillMetadata],
     *,
     confidence_provider: Callable[[str], float] | None = None,
+    root: Path | None = None,
 ) -> SkillRouter:
     routing_config = routing_config_from_env()
     vector_search = None
     if routing_config.mode != "keyword":
-        vector_config = vector_search_config_from_env()
-        if vector_config:
-            vector_search = QdrantVectorSearch(vector_config)
+        vector_search = vector_search_from_env(root)
     return SkillRouter(
         skills,
         confidence_provider=confidence_provider,
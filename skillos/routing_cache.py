@@ -1,20 +1,102 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 import hashlib
 import json
-from typing import Iterable
+import os
+import re
+import threading
+import time
+from typing import Hashable, Iterable
 
 from skillos.cache import CacheBackend, CacheConfig, cache_backend_from_env, cache_config_from_env
-from skillos.routing import RoutingResult, SkillCandidate
+from skillos.routing import (
+    RoutingConfig,
+    RoutingResult,
+    SkillCandidate,
+    keyword_tokens,
+    routing_config_from_env,
+)
 from skillos.tenancy import tenant_id_from_path
 
 
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9]+")
+ROUTING_CACHE_KEY_MODES = {"raw", "normalized"}
+
+
+def query_tokens(query: str) -> list[str]:
+    """Sorted token multiset that fully determines routing for ``query``.
+
+    Keyword scoring and hashed embeddings both lower-case the same
+    ``[a-zA-Z0-9]+`` tokens and ignore their order, so punctuation, spacing
+    and case cannot change the routing result.
+    """
+    return sorted(_TOKEN_RE.findall(query.lower()))
+
+
+def normalized_query_hash(query: str) -> str:
+    return _hash_text(" ".join(query_tokens(query)))
+
+
 @dataclass(frozen=True)
 class RoutingCacheConfig:
     enabled: bool
     ttl_seconds: int
     prefix: str
+    local_max_entries: int = 1024
+    local_ttl_seconds: int | None = None
+    key_mode: str = "raw"
+
+
+class _LocalRoutingCache:
+    """Bounded LRU of decoded results with a per-entry TTL."""
+
+    def __init__(self, max_entries: int, ttl_seconds: int | None) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[
+            str, tuple[RoutingResult, float | None, frozenset[str]]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> RoutingResult | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        result, expires_at, _ = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def set(self, key: str, result: RoutingResult, tokens: frozenset[str]) -> None:
+        if self._max_entries <= 0:
+            return
+        expires_at = (
+            time.monotonic() + self._ttl_seconds
+            if self._ttl_seconds is not None
+            else None
+        )
+        self._entries[key] = (result, expires_at, tokens)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def drop_tokens(self, tokens: frozenset[str]) -> int:
+        stale = [
+            key for key, (_, _, entry_tokens) in self._entries.items()
+            if not entry_tokens.isdisjoint(tokens)
+        ]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
 
 
 class RoutingCache:
@@ -25,22 +107,53 @@ class RoutingCache:
         tenant_id: str,
         ttl_seconds: int,
         prefix: str,
+        local_max_entries: int = 1024,
+        local_ttl_seconds: int | None = None,
+        key_mode: str = "raw",
+        routing_config: RoutingConfig | None = None,
     ) -> None:
+        if key_mode not in ROUTING_CACHE_KEY_MODES:
+            raise ValueError(f"Unknown routing cache key mode: {key_mode}")
         self._backend = backend
         self._tenant_id = tenant_id
         self._ttl_seconds = ttl_seconds
         self._prefix = prefix
+        # L1 holds decoded results for this tenant only, so its size limit is
+        # a per-tenant limit. Entries never outlive the L2 TTL.
+        self._local = _LocalRoutingCache(
+            local_max_entries,
+            local_ttl_seconds if local_ttl_seconds is not None else ttl_seconds,
+        )
+        self._lock = threading.Lock()
+        self._generation: str | None = None
+        self._key_mode = key_mode
+        routing_config = routing_config or RoutingConfig()
+        self._config_hash = _hash_routing_config(routing_config)
+        # Keyword-only routing scores a skill only through tokens it shares
+        # with the query, so a registry diff can evict just the L1 routes
+        # whose query used a changed token. Vector scores come from hashed
+        # embeddings, where unrelated tokens collide, so any diff clears L1.
+        self._token_targeted = routing_config.mode == "keyword"
+        self._counters = {"l1_hits": 0, "l1_misses": 0, "l2_hits": 0, "l2_misses": 0}
 
     def get(self, query: str, tags: Iterable[str] | None = None) -> RoutingResult | None:
-        key = self._key(query, tags)
-        raw = self._backend.get(key)
-        if not raw:
-            return None
-        try:
-            payload = json.loads(raw)
-        except json.JSONDecodeError:
-            return None
-        return _routing_result_from_dict(payload)
+        key = self._key(query, query_tokens(query), tags)
+        result = self._get_local(key)
+        if result is not None:
+            return result
+        return self._get_remote(key, query)
+
+    def get_local(
+        self, query: str, tags: Iterable[str] | None = None
+    ) -> RoutingResult | None:
+        """Look up the in-process L1 only; never touches the backend."""
+        return self._get_local(self._key(query, query_tokens(query), tags))
+
+    def get_remote(
+        self, query: str, tags: Iterable[str] | None = None
+    ) -> RoutingResult | None:
+        """Look up the L2 backend and promote a hit into L1."""
+        return self._get_remote(self._key(query, query_tokens(query), tags), query)
 
     def set(
         self,
@@ -48,17 +161,81 @@ class RoutingCache:
         tags: Iterable[str] | None,
         result: RoutingResult,
     ) -> None:
-        key = self._key(query, tags)
+        key = self._key(query, query_tokens(query), tags)
+        with self._lock:
+            self._local.set(key, result, self._entry_tokens(query))
         payload = json.dumps(
             _routing_result_to_dict(result),
             ensure_ascii=True,
         )
-        self._backend.set(key, payload, self._ttl_seconds)
+        self._backend.set(self._remote_key(key), payload, self._ttl_seconds)
+
+    def observe_version(
+        self, version: Hashable, *, changed_tokens: Iterable[str] | None = None
+    ) -> None:
+        """Invalidate cached routes when the registry or feedback state moves.
 
-    def _key(self, query: str, tags: Iterable[str] | None) -> str:
-        query_hash = _hash_text(query)
+        The version becomes part of every L2 key, so stale L2 entries are no
+        longer read and simply expire; L2 is a plain key/value store shared
+        by every process and cannot be searched by token. L1 is cleared,
+        unless ``changed_tokens`` says the move is a registry diff touching
+        only skills with those keyword tokens and routing is keyword-only:
+        then just the L1 routes whose query used one of them are dropped.
+        """
+        generation = _hash_text(repr(version))[:16]
+        with self._lock:
+            if generation == self._generation:
+                return
+            self._generation = generation
+            if changed_tokens is not None and self._token_targeted:
+                self._local.drop_tokens(frozenset(changed_tokens))
+            else:
+                self._local.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {**self._counters, "l1_size": len(self._local)}
+
+    def _get_local(self, key: str) -> RoutingResult | None:
+        with self._lock:
+            result = self._local.get(key)
+            self._count("l1_hits" if result is not None else "l1_misses")
+        return result
+
+    def _get_remote(self, key: str, query: str) -> RoutingResult | None:
+        raw = self._backend.get(self._remote_key(key))
+        result = None
+        if raw:
+            try:
+                result = _routing_result_from_dict(json.loads(raw))
+            except json.JSONDecodeError:
+                result = None
+        with self._lock:
+            self._count("l2_hits" if result is not None else "l2_misses")
+            if result is not None:
+                self._local.set(key, result, self._entry_tokens(query))
+        return result
+
+    def _count(self, name: str) -> None:
+        self._counters[name] += 1
+
+    def _entry_tokens(self, query: str) -> frozenset[str]:
+        # The tokens that drove a keyword route; unused in other modes.
+        return keyword_tokens(query) if self._token_targeted else frozenset()
+
+    def _remote_key(self, key: str) -> str:
+        generation = self._generation
+        return f"{key}:{generation}" if generation is not None else key
+
+    def _key(
+        self, query: str, tokens: list[str], tags: Iterable[str] | None
+    ) -> str:
         tag_hash = _hash_tags(tags)
-        return f"{self._prefix}:tenant:{self._tenant_id}:routing:{query_hash}:{tag_hash}"
+        base = f"{self._prefix}:tenant:{self._tenant_id}:routing"
+        if self._key_mode == "normalized":
+            token_hash = _hash_text(" ".join(tokens))
+            return f"{base}:n:{token_hash}:{tag_hash}:{self._config_hash}"
+        return f"{base}:{_hash_text(query)}:{tag_hash}"
 
 
 def routing_cache_from_env(root_path) -> RoutingCache | None:
@@ -73,15 +250,95 @@ def routing_cache_from_env(root_path) -> RoutingCache | None:
         enabled=config.enabled,
         ttl_seconds=config.ttl_seconds,
         prefix=config.prefix,
+        local_max_entries=_env_int("SKILLOS_CACHE_L1_MAX_ENTRIES", 1024),
+        local_ttl_seconds=_env_int("SKILLOS_CACHE_L1_TTL_SECONDS", config.ttl_seconds),
+        key_mode=_key_mode_from_env(),
     )
     return RoutingCache(
         backend,
         tenant_id=tenant_id,
         ttl_seconds=routing_config.ttl_seconds,
         prefix=routing_config.prefix,
+        local_max_entries=routing_config.local_max_entries,
+        local_ttl_seconds=routing_config.local_ttl_seconds,
+        key_mode=routing_config.key_mode,
+        routing_config=routing_config_from_env(),
     )
 
 
+def _key_mode_from_env() -> str:
+    mode = os.getenv("SKILLOS_CACHE_ROUTING_KEY", "raw").strip().lower()
+    return mode if mode in ROUTING_CACHE_KEY_MODES else "raw"
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(str(raw).strip())
+    except ValueError:
+        return default
+
+
+@dataclass(frozen=True)
+class CacheReplayReport:
+    requests: int
+    raw_hits: int
+    normalized_hits: int
+
+    @property
+    def raw_hit_rate(self) -> float:
+        return self.raw_hits / self.requests if self.requests else 0.0
+
+    @property
+    def normalized_hit_rate(self) -> float:
+        return self.normalized_hits / self.requests if self.requests else 0.0
+
+
+def replay_routing_cache(
+    events: Iterable[dict[str, object]], *, max_entries: int = 0
+) -> CacheReplayReport:
+    """Replay ``request_received`` events against both keying schemes.
+
+    Each scheme gets an LRU of ``max_entries`` keys (0 means unbounded).
+    Events without a ``normalized_query_hash`` fall back to the raw ``query``
+    when it was captured, otherwise to ``query_hash``.
+    """
+    raw_keys: list[str] = []
+    normalized_keys: list[str] = []
+    for event in events:
+        if event.get("event") != "request_received":
+            continue
+        raw_key = str(event.get("query_hash") or "")
+        if not raw_key:
+            continue
+        normalized_key = event.get("normalized_query_hash")
+        if not normalized_key and isinstance(event.get("query"), str):
+            normalized_key = normalized_query_hash(str(event["query"]))
+        raw_keys.append(raw_key)
+        normalized_keys.append(str(normalized_key or raw_key))
+    return CacheReplayReport(
+        requests=len(raw_keys),
+        raw_hits=_replay_hits(raw_keys, max_entries),
+        normalized_hits=_replay_hits(normalized_keys, max_entries),
+    )
+
+
+def _replay_hits(keys: Iterable[str], max_entries: int) -> int:
+    seen: OrderedDict[str, None] = OrderedDict()
+    hits = 0
+    for key in keys:
+        if key in seen:
+            hits += 1
+            seen.move_to_end(key)
+            continue
+        seen[key] = None
+        if max_entries > 0 and len(seen) > max_entries:
+            seen.popitem(last=False)
+    return hits
+
+
 def _routing_result_to_dict(result: RoutingResult) -> dict[str, object]:
     return {
         "status": result.status,
@@ -136,6 +393,14 @@ def _hash_text(value: str) -> str:
     return hashlib.sha256(value.encode("utf-8")).hexdigest()
 
 
+def _hash_routing_config(config: RoutingConfig) -> str:
+    fingerprint = (
+        f"{config.mode}:{config.keyword_weight}:{config.vector_weight}:"
+        f"{config.vector_top_k}:{config.vector_min_score}:{config.include_deprecated}"
+    )
+    return _hash_text(fingerprint)[:16]
+
+
 def _hash_tags(tags: Iterable[str] | None) -> str:
     if not tags:
         return "none"
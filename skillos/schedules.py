@@ -7,6 +7,7 @@ from pathlib import Path
 import re
 from uuid import uuid4
 
+from skillos.state_store import default_state_db_path, state_database
 from skillos.storage import atomic_write_text
 from skillos.tenancy import resolve_tenant_root
 from skillos.storage_backend import (
@@ -211,6 +212,74 @@ class ScheduleStore:
         )
 
 
+class ScheduleStoreSqlite:
+    """Schedules as one row each in the runtime state database."""
+
+    def __init__(self, path: Path, *, legacy_path: Path | None = None) -> None:
+        self.path = Path(path)
+        self._db = state_database(self.path)
+        self._db.ensure_schema(
+            "schedules",
+            [
+                """
+                CREATE TABLE IF NOT EXISTS schedules (
+                    schedule_id TEXT PRIMARY KEY,
+                    run_at TEXT NOT NULL,
+                    record TEXT NOT NULL
+                )
+                """,
+                "CREATE INDEX IF NOT EXISTS schedules_run_at_idx ON schedules (run_at)",
+            ],
+            importer=self._importer(legacy_path),
+        )
+
+    def load(self) -> list[ScheduleRecord]:
+        rows = self._db.execute("SELECT record FROM schedules ORDER BY run_at").fetchall()
+        return [ScheduleRecord.from_dict(json.loads(row["record"])) for row in rows]
+
+    def save(self, records: list[ScheduleRecord]) -> None:
+        with self._db.transaction() as conn:
+            keep = {record.schedule_id for record in records}
+            existing = conn.execute("SELECT schedule_id FROM schedules").fetchall()
+            conn.executemany(
+                "DELETE FROM schedules WHERE schedule_id = ?",
+                [
+                    (row["schedule_id"],)
+                    for row in existing
+                    if row["schedule_id"] not in keep
+                ],
+            )
+            _upsert_schedules(conn, records)
+
+    def _importer(self, legacy_path: Path | None):
+        if legacy_path is None or not Path(legacy_path).exists():
+            return None
+
+        def _import(conn) -> None:
+            _upsert_schedules(conn, ScheduleStore(legacy_path).load())
+
+        return _import
+
+
+def _upsert_schedules(conn, records: list[ScheduleRecord]) -> None:
+    conn.executemany(
+        """
+        INSERT INTO schedules (schedule_id, run_at, record) VALUES (?, ?, ?)
+        ON CONFLICT (schedule_id) DO UPDATE SET
+            run_at = excluded.run_at,
+            record = excluded.record
+        """,
+        [
+            (
+                record.schedule_id,
+                _format_datetime(record.run_at),
+                json.dumps(record.to_dict(), ensure_ascii=True),
+            )
+            for record in records
+        ],
+    )
+
+
 class ScheduleStorePostgres:
     def __init__(self, dsn: str, *, tenant_id: str, schema: str = "skillos") -> None:
         self._dsn = dsn
@@ -350,8 +419,14 @@ class ScheduleStorePostgres:
         )
 
 
-def schedule_store_from_env(root: Path) -> ScheduleStore | ScheduleStorePostgres:
+def schedule_store_from_env(
+    root: Path,
+) -> ScheduleStore | ScheduleStoreSqlite | ScheduleStorePostgres:
     config = storage_backend_from_env()
+    if config.backend == "sqlite":
+        return ScheduleStoreSqlite(
+            default_state_db_path(root), legacy_path=default_schedules_path(root)
+        )
     if config.backend != "postgres":
         return ScheduleStore(default_schedules_path(root))
     dsn = require_postgres_dsn(config, context="schedules")
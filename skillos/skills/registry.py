@@ -13,6 +13,8 @@ import asyncio
 
 from skillos.skills.loader import load_skill_file
 from skillos.skills.models import SkillMetadata
+from skillos.profiler import skill_scope
+from skillos.tracing import span
 
 
 @dataclass(frozen=True)
@@ -21,6 +23,22 @@ class SkillRecord:
     source: Path
 
 
+@dataclass(frozen=True)
+class RegistryDiff:
+    records: dict[str, SkillRecord]
+    added: tuple[str, ...] = ()
+    removed: tuple[str, ...] = ()
+    changed: tuple[str, ...] = ()
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    @property
+    def upserted(self) -> list[SkillMetadata]:
+        return [self.records[skill_id].metadata for skill_id in self.added + self.changed]
+
+
 class SkillRegistry:
     def __init__(self, root: Path) -> None:
         self._root = Path(root)
@@ -33,6 +51,10 @@ class SkillRegistry:
     def root(self) -> Path:
         return self._root
 
+    @property
+    def refresh_token(self) -> tuple[int, float] | None:
+        return self._refresh_token
+
     @property
     def metadata_path(self) -> Path:
         return self._root / "metadata"
@@ -97,11 +119,13 @@ class SkillRegistry:
         self._purge_modules()
         return self.load_all(self.metadata_path)
 
-    def reload_if_changed(self) -> dict[str, SkillRecord] | None:
+    def reload_if_changed(self) -> RegistryDiff | None:
         token = self._compute_refresh_token()
-        if self._refresh_token is None or token != self._refresh_token:
-            return self.load_all(self.metadata_path)
-        return None
+        if self._refresh_token is not None and token == self._refresh_token:
+            return None
+        previous = self._skills
+        records = self.load_all(self.metadata_path)
+        return _diff_records(previous, records)
 
     def _purge_modules(self) -> None:
         """Purge dynamic skill modules to ensure fresh reloading."""
@@ -186,18 +210,19 @@ class SkillRegistry:
                 )
             
             kernel = get_kernel(record.metadata, root_path=str(self._root))
-            return kernel.execute(
-                record.metadata,
-                payload,
-                role=role,
-                attributes=attributes,
-                approval_status=approval_status,
-                approval_token=approval_token,
-                charge_budget=charge_budget,
-                root=self._root,
-                session_context=session_context,
-                **kwargs
-            )
+            with span("kernel", skill_id=skill_id), skill_scope(skill_id):
+                return kernel.execute(
+                    record.metadata,
+                    payload,
+                    role=role,
+                    attributes=attributes,
+                    approval_status=approval_status,
+                    approval_token=approval_token,
+                    charge_budget=charge_budget,
+                    root=self._root,
+                    session_context=session_context,
+                    **kwargs
+                )
 
     async def execute_async(self, skill_id: str, **kwargs):
         """Asynchronously execution entrypoint."""
@@ -223,18 +248,19 @@ class SkillRegistry:
         charge_budget = kwargs.pop("charge_budget", True)
         session_context = kwargs.pop("session_context", None)
 
-        return await kernel.execute_async(
-            record.metadata,
-            payload,
-            role=role,
-            attributes=attributes,
-            approval_status=approval_status,
-            approval_token=approval_token,
-            charge_budget=charge_budget,
-            root=self._root,
-            session_context=session_context,
-            **kwargs
-        )
+        with span("kernel", skill_id=skill_id):
+            return await kernel.execute_async(
+                record.metadata,
+                payload,
+                role=role,
+                attributes=attributes,
+                approval_status=approval_status,
+                approval_token=approval_token,
+                charge_budget=charge_budget,
+                root=self._root,
+                session_context=session_context,
+                **kwargs
+            )
 
 
 
@@ -339,6 +365,24 @@ def _load_module_safe(module_name: str, file_path: Path) -> Any:
             del sys.modules[module_name]
         raise ImportError(f"Failed to execute module {module_name} from {file_path}: {e}") from e
 
+def _diff_records(
+    previous: dict[str, SkillRecord], current: dict[str, SkillRecord]
+) -> RegistryDiff:
+    added = tuple(skill_id for skill_id in current if skill_id not in previous)
+    removed = tuple(skill_id for skill_id in previous if skill_id not in current)
+    changed = tuple(
+        skill_id
+        for skill_id, record in current.items()
+        if skill_id in previous and previous[skill_id].metadata != record.metadata
+    )
+    return RegistryDiff(
+        records=current,
+        added=added,
+        removed=removed,
+        changed=changed,
+    )
+
+
 def _iter_skill_files(metadata_path: Path) -> Iterable[Path]:
     yaml_files = list(metadata_path.rglob("*.yaml"))
     yml_files = list(metadata_path.rglob("*.yml"))
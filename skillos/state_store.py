@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass
+import os
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Callable, Iterable, Iterator
+
+from skillos.tenancy import resolve_tenant_root
+
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL"}
+
+
+def default_state_db_path(root: Path) -> Path:
+    root_path = resolve_tenant_root(root)
+    return root_path / "runtime" / "state.db"
+
+
+@dataclass(frozen=True)
+class StateStoreConfig:
+    busy_timeout_ms: int = 5000
+    synchronous: str = "NORMAL"
+
+
+def state_store_config_from_env() -> StateStoreConfig:
+    synchronous = os.getenv("SKILLOS_SQLITE_SYNCHRONOUS", "NORMAL").strip().upper()
+    if synchronous not in _SYNCHRONOUS_MODES:
+        synchronous = "NORMAL"
+    return StateStoreConfig(
+        busy_timeout_ms=max(_env_int("SKILLOS_SQLITE_BUSY_TIMEOUT_MS", 5000), 0),
+        synchronous=synchronous,
+    )
+
+
+class StateDatabase:
+    """Runtime state of one root in a single SQLite file in WAL mode.
+
+    Every thread gets its own connection in autocommit mode; multi-statement
+    updates run in ``transaction()`` (``BEGIN IMMEDIATE``), so writers queue
+    on SQLite's lock instead of rewriting whole documents under ``file_lock``
+    and readers never block behind them. Domains register their tables with
+    ``ensure_schema``, which also imports legacy JSON documents once.
+    """
+
+    def __init__(self, path: Path, config: StateStoreConfig | None = None) -> None:
+        self.path = Path(path)
+        self.config = config or StateStoreConfig()
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._ready: set[str] = set()
+        self._ready_lock = threading.Lock()
+
+    def connection(self) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            # SQLite connections must not cross fork(); start over in the child.
+            self._local = threading.local()
+            self._pid = os.getpid()
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self.connection()
+        if conn.in_transaction:
+            yield conn
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def execute(self, sql: str, parameters: Iterable[object] = ()) -> sqlite3.Cursor:
+        return self.connection().execute(sql, tuple(parameters))
+
+    def ensure_schema(
+        self,
+        domain: str,
+        statements: Iterable[str],
+        importer: Callable[[sqlite3.Connection], None] | None = None,
+    ) -> None:
+        """Create the tables of ``domain`` and run ``importer`` the first time."""
+        if domain in self._ready:
+            return
+        with self._ready_lock:
+            if domain in self._ready:
+                return
+            with self.transaction() as conn:
+                for statement in statements:
+                    conn.execute(statement)
+                migrated = conn.execute(
+                    "SELECT 1 FROM state_migrations WHERE domain = ?", (domain,)
+                ).fetchone()
+                if not migrated:
+                    if importer is not None:
+                        importer(conn)
+                    conn.execute(
+                        "INSERT INTO state_migrations (domain) VALUES (?)", (domain,)
+                    )
+            self._ready.add(domain)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.config.busy_timeout_ms / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(f"PRAGMA synchronous={self.config.synchronous}")
+        conn.execute(f"PRAGMA busy_timeout={int(self.config.busy_timeout_ms)}")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS state_migrations (
+                domain TEXT PRIMARY KEY,
+                migrated_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+            )
+            """
+        )
+        return conn
+
+
+_DATABASES: dict[Path, StateDatabase] = {}
+_DATABASES_LOCK = threading.Lock()
+
+
+def state_database(path: Path) -> StateDatabase:
+    """Return the process-wide handle for the state database at ``path``."""
+    key = Path(path).resolve()
+    database = _DATABASES.get(key)
+    if database is not None:
+        return database
+    with _DATABASES_LOCK:
+        database = _DATABASES.get(key)
+        if database is None:
+            database = StateDatabase(key, state_store_config_from_env())
+            _DATABASES[key] = database
+        return database
+
+
+def _reset_databases_after_fork() -> None:
+    global _DATABASES_LOCK
+    _DATABASES.clear()
+    _DATABASES_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_databases_after_fork)
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(str(raw).strip())
+    except ValueError:
+        return default
@@ -4,65 +4,275 @@ from contextlib import contextmanager
 import os
 import tempfile
 from pathlib import Path
+import threading
 import time
 from typing import Iterator
 
+from skillos.metrics_registry import metrics_registry
+
 try:
     import msvcrt
 
-    def _lock(fd: int) -> None:
-        # LK_NBLCK is non-blocking on Windows
-        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    # msvcrt has no shared byte-range locks; shared requests lock exclusively.
+    def _try_lock(fd: int, shared: bool) -> bool:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+
+    def _lock_blocking(fd: int, shared: bool) -> None:
+        while not _try_lock(fd, shared):
+            time.sleep(0.01)
 
     def _unlock(fd: int) -> None:
         msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
 
 except ImportError:
-    # Fallback for non-Windows (simplified, typically use fcntl)
     try:
         import fcntl
 
-        def _lock(fd: int) -> None:
-            fcntl.flock(fd, fcntl.LOCK_EX)
+        def _try_lock(fd: int, shared: bool) -> bool:
+            mode = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+            try:
+                fcntl.flock(fd, mode | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+            return True
+
+        def _lock_blocking(fd: int, shared: bool) -> None:
+            fcntl.flock(fd, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
 
         def _unlock(fd: int) -> None:
             fcntl.flock(fd, fcntl.LOCK_UN)
 
     except ImportError:  # pragma: no cover
-        def _lock(fd: int) -> None:
+        def _try_lock(fd: int, shared: bool) -> bool:
+            return True
+
+        def _lock_blocking(fd: int, shared: bool) -> None:
             pass
 
         def _unlock(fd: int) -> None:
             pass
 
 
-@contextmanager
-def file_lock(path: Path, timeout: float = 5.0) -> Iterator[None]:
-    """Simple cross-platform file lock."""
-    lock_path = path.with_suffix(path.suffix + ".lock")
-    start_time = time.time()
-    
-    # Ensure directory exists
-    lock_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    while True:
+_LOCK_WAIT_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+_MAX_POLL_SECONDS = 0.05
+_LOCK_WAIT = metrics_registry().histogram(
+    "skillos_lock_wait_seconds",
+    "Time spent waiting to acquire a file lock.",
+    ("lock", "mode"),
+    buckets=_LOCK_WAIT_BUCKETS,
+)
+_LOCK_CONTENDED = metrics_registry().counter(
+    "skillos_lock_contended_total",
+    "File lock acquisitions that had to wait for another holder.",
+    ("lock", "mode"),
+)
+
+
+class _PathLock:
+    """Readers-writer lock for one lock file.
+
+    Threads first coordinate on a condition variable, so in-process
+    contention never reaches the OS; only the first reader (or the single
+    writer) then takes ``flock`` on a descriptor that stays open for the life
+    of the process. Waiting writers block new readers.
+    """
+
+    def __init__(self, lock_path: str) -> None:
+        self.lock_path = lock_path
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer = False
+        self._waiting_writers = 0
+        self._os_guard = threading.Lock()
+        self._os_readers = 0
+        self._fd: int | None = None
+
+    def acquire(self, shared: bool, deadline: float | None) -> bool:
+        """Acquire the lock; returns whether it had to wait."""
+        contended = self._acquire_local(shared, deadline)
         try:
-            # Open for writing (creates if not exists)
-            fd = os.open(lock_path, os.O_RDWR | os.O_CREAT)
-            try:
-                _lock(fd)
-                yield
+            if shared:
+                if not self._os_guard.acquire(timeout=_remaining(deadline, -1)):
+                    raise TimeoutError
                 try:
-                    _unlock(fd)
-                except (IOError, OSError):
-                    pass # Best effort unlock before close
-                break
-            finally:
-                os.close(fd)
-        except (IOError, OSError):
-            if time.time() - start_time > timeout:
-                raise TimeoutError(f"Could not acquire lock on {path} after {timeout}s")
-            time.sleep(0.1)
+                    if self._os_readers == 0:
+                        contended |= self._acquire_os(True, deadline)
+                    self._os_readers += 1
+                finally:
+                    self._os_guard.release()
+            else:
+                contended |= self._acquire_os(False, deadline)
+        except BaseException:
+            self._release_local(shared)
+            raise
+        return contended
+
+    def release(self, shared: bool) -> None:
+        try:
+            if shared:
+                with self._os_guard:
+                    self._os_readers -= 1
+                    if self._os_readers == 0:
+                        _unlock(self._fd)
+            else:
+                _unlock(self._fd)
+        except OSError:
+            pass  # Best effort; the descriptor stays open for the next holder.
+        finally:
+            self._release_local(shared)
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _acquire_local(self, shared: bool, deadline: float | None) -> bool:
+        with self._cond:
+            if shared:
+                contended = self._writer or self._waiting_writers > 0
+                while self._writer or self._waiting_writers:
+                    self._wait(deadline)
+                self._readers += 1
+                return contended
+            contended = self._writer or self._readers > 0
+            self._waiting_writers += 1
+            try:
+                while self._writer or self._readers:
+                    self._wait(deadline)
+            except BaseException:
+                self._waiting_writers -= 1
+                # Gave up: readers queued behind this writer may proceed.
+                self._cond.notify_all()
+                raise
+            self._waiting_writers -= 1
+            self._writer = True
+            return contended
+
+    def _release_local(self, shared: bool) -> None:
+        with self._cond:
+            if shared:
+                self._readers -= 1
+            else:
+                self._writer = False
+            self._cond.notify_all()
+
+    def _wait(self, deadline: float | None) -> None:
+        remaining = _remaining(deadline, None)
+        if remaining is not None and remaining <= 0:
+            raise TimeoutError
+        self._cond.wait(remaining)
+
+    def _acquire_os(self, shared: bool, deadline: float | None) -> bool:
+        fd = self._descriptor()
+        if _try_lock(fd, shared):
+            return False
+        if deadline is None:
+            _lock_blocking(fd, shared)
+            return True
+        # Another process holds it: poll with a short, growing backoff so a
+        # bounded timeout can still be honoured.
+        delay = 0.001
+        while not _try_lock(fd, shared):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, _MAX_POLL_SECONDS)
+        return True
+
+    def _descriptor(self) -> int:
+        if self._fd is None:
+            os.makedirs(os.path.dirname(self.lock_path) or ".", exist_ok=True)
+            self._fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT)
+        return self._fd
+
+
+class LockManager:
+    """Process-wide registry of file locks keyed by lock file path."""
+
+    def __init__(self) -> None:
+        self._locks: dict[str, _PathLock] = {}
+        self._guard = threading.Lock()
+
+    @contextmanager
+    def lock(
+        self,
+        path: Path,
+        *,
+        shared: bool = False,
+        timeout: float | None = 5.0,
+    ) -> Iterator[None]:
+        lock_path = os.path.abspath(f"{os.fspath(path)}.lock")
+        path_lock = self._path_lock(lock_path)
+        mode = "shared" if shared else "exclusive"
+        name = os.path.basename(lock_path)
+        start = time.monotonic()
+        deadline = None if timeout is None else start + timeout
+        try:
+            contended = path_lock.acquire(shared, deadline)
+        except TimeoutError:
+            _LOCK_CONTENDED.inc(lock=name, mode=mode)
+            _LOCK_WAIT.observe(time.monotonic() - start, lock=name, mode=mode)
+            raise TimeoutError(
+                f"Could not acquire lock on {path} after {timeout}s"
+            ) from None
+        _LOCK_WAIT.observe(time.monotonic() - start, lock=name, mode=mode)
+        if contended:
+            _LOCK_CONTENDED.inc(lock=name, mode=mode)
+        try:
+            yield
+        finally:
+            path_lock.release(shared)
+
+    def _path_lock(self, lock_path: str) -> _PathLock:
+        path_lock = self._locks.get(lock_path)
+        if path_lock is None:
+            with self._guard:
+                path_lock = self._locks.setdefault(lock_path, _PathLock(lock_path))
+        return path_lock
+
+    def _reset_after_fork(self) -> None:
+        # Inherited descriptors share flock state with the parent; unlocking
+        # them here would release the parent's locks, so just drop them.
+        for path_lock in self._locks.values():
+            try:
+                path_lock.close()
+            except OSError:
+                pass
+        self._locks = {}
+        self._guard = threading.Lock()
+
+
+_LOCK_MANAGER = LockManager()
+
+
+def lock_manager() -> LockManager:
+    return _LOCK_MANAGER
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_LOCK_MANAGER._reset_after_fork)
+
+
+def file_lock(
+    path: Path, timeout: float | None = 5.0, *, shared: bool = False
+) -> Iterator[None]:
+    """Lock ``path`` across threads and processes.
+
+    ``shared`` locks admit any number of readers; exclusive locks admit one
+    holder. ``timeout=None`` waits indefinitely.
+    """
+    return _LOCK_MANAGER.lock(Path(path), shared=shared, timeout=timeout)
+
+
+def _remaining(deadline: float | None, default):
+    if deadline is None:
+        return default
+    return max(deadline - time.monotonic(), 0.0)
 
 
 def atomic_write_text(path: Path, data: str, *, encoding: str = "utf-8") -> None:
@@ -9,7 +9,7 @@ from pathlib import Path
 from skillos.tenancy import tenant_id_from_path, tenant_id_from_env
 
 
-_SUPPORTED_BACKENDS = {"file", "postgres"}
+_SUPPORTED_BACKENDS = {"file", "sqlite", "postgres"}
 _SCHEMA_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
 
 
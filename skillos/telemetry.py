@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import hashlib
 import json
+import os
 from pathlib import Path
 import re
+import threading
 import time
 from typing import Iterable
 from uuid import uuid4
 
+from skillos.log_segments import (
+    LogRotationConfig,
+    log_rotation_config_from_env,
+    maybe_rotate,
+)
+from skillos.metrics_registry import metrics_registry
 from skillos.routing import RoutingResult, SkillCandidate
 from skillos.tenancy import resolve_tenant_root
 
@@ -75,6 +86,113 @@ _EVENT_REQUIRED_FIELDS: dict[str, set[str]] = {
     "integration_call": {"connector_id", "connector_type", "status", "latency_ms"},
     "webhook_received": {"trigger_id", "skill_id", "status", "status_code"},
 }
+# Fields that only ever carry ids, hashes, enums, numbers or structures built
+# from those. They are written verbatim; every other field, including ones an
+# event schema does not know about, goes through the PII redactor. Free text
+# such as ``reason`` (exception messages) and ``correction`` is never listed.
+_VERBATIM_FIELDS = frozenset(
+    {
+        "request_id",
+        "query_hash",
+        "normalized_query_hash",
+        "query_length",
+        "token_count",
+        "candidates",
+        "routing_latency_ms",
+        "cache_hit",
+        "vector_connections",
+        "routing_cache",
+        "skill_id",
+        "expected_skill_id",
+        "confidence",
+        "status",
+        "alternatives",
+        "allowed",
+        "model",
+        "estimated_cost",
+        "remaining_daily",
+        "remaining_monthly",
+        "policy_id",
+        "role",
+        "required_permissions",
+        "duration_ms",
+        "step_id",
+        "order",
+        "group",
+        "source",
+        "schedule_id",
+        "due_at",
+        "lag_ms",
+        "job_id",
+        "retries",
+        "max_retries",
+        "error_class",
+        "expires_at",
+        "count",
+        "total_bytes",
+        "connector_id",
+        "connector_type",
+        "latency_ms",
+        "trigger_id",
+        "status_code",
+    }
+)
+
+
+@dataclass(frozen=True)
+class EventSchema:
+    """Validator and redactor for one event type, compiled once."""
+
+    event: str
+    required: frozenset[str]
+    verbatim: frozenset[str]
+
+    def validate(self, fields: dict[str, object]) -> None:
+        missing = self.required - fields.keys()
+        if missing:
+            raise LogSchemaError(
+                f"Missing required fields for {self.event}: {sorted(missing)}"
+            )
+
+    def redact(self, fields: dict[str, object]) -> dict[str, object]:
+        verbatim = self.verbatim
+        return {
+            key: (
+                value
+                if key in verbatim and not _is_secret_value(value)
+                else redact_pii(value)
+            )
+            for key, value in fields.items()
+        }
+
+
+_EVENT_SCHEMAS: dict[str, EventSchema] = {}
+
+
+def register_event_schema(
+    event: str,
+    required: Iterable[str] = (),
+    *,
+    verbatim: Iterable[str] = (),
+) -> EventSchema:
+    schema = EventSchema(
+        event=event,
+        required=frozenset(_BASE_REQUIRED_FIELDS | set(required)),
+        verbatim=_VERBATIM_FIELDS | frozenset(verbatim),
+    )
+    _EVENT_SCHEMAS[event] = schema
+    return schema
+
+
+def event_schema(event: str) -> EventSchema:
+    schema = _EVENT_SCHEMAS.get(event)
+    if schema is None:
+        schema = register_event_schema(event)
+    return schema
+
+
+for _event, _required in _EVENT_REQUIRED_FIELDS.items():
+    register_event_schema(_event, _required)
 
 
 def default_log_path(root: Path) -> Path:
@@ -149,35 +267,269 @@ class RoutingTelemetry:
     routing_latency_ms: float
 
 
+LOG_MODES = {"sync", "buffered"}
+LOG_OVERFLOW_POLICIES = {"block", "drop"}
+
+
+@dataclass(frozen=True)
+class LogWriterConfig:
+    mode: str = "sync"
+    buffer_size: int = 10_000
+    batch_size: int = 256
+    flush_interval_seconds: float = 0.2
+    overflow: str = "block"
+
+
+def log_writer_config_from_env() -> LogWriterConfig:
+    mode = os.getenv("SKILLOS_LOG_MODE", "sync").strip().lower()
+    overflow = os.getenv("SKILLOS_LOG_OVERFLOW", "block").strip().lower()
+    return LogWriterConfig(
+        mode=mode if mode in LOG_MODES else "sync",
+        buffer_size=max(1, _env_int("SKILLOS_LOG_BUFFER_SIZE", 10_000)),
+        batch_size=max(1, _env_int("SKILLOS_LOG_BATCH_SIZE", 256)),
+        flush_interval_seconds=max(
+            0.001, _env_int("SKILLOS_LOG_FLUSH_INTERVAL_MS", 200) / 1000
+        ),
+        overflow=overflow if overflow in LOG_OVERFLOW_POLICIES else "block",
+    )
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(str(raw).strip())
+    except ValueError:
+        return default
+
+
+class BufferedLogWriter:
+    """Appends events to one log file from a background thread.
+
+    ``write`` only enqueues; a writer thread drains the bounded buffer in
+    batches when ``batch_size`` events are waiting or ``flush_interval_seconds``
+    has passed, through a single long-lived file handle. When the buffer is
+    full the ``block`` policy waits for space and ``drop`` discards the event
+    and counts it. Events are serialised in ``write`` so a bad payload fails
+    in the caller; a batch the file refuses is counted as dropped.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        config: LogWriterConfig,
+        rotation: LogRotationConfig | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self._config = config
+        self._rotation = rotation or log_rotation_config_from_env()
+        self._buffer: deque[str] = deque()
+        self._condition = threading.Condition()
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        self._written = 0
+        self._dropped = 0
+        self._handle = None
+        self._thread = threading.Thread(
+            target=self._run, name="skillos-event-log", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, payload: dict[str, object]) -> bool:
+        line = json.dumps(payload, ensure_ascii=True) + "\n"
+        with self._condition:
+            if self._closed:
+                raise LogSchemaError("event log writer is closed")
+            while len(self._buffer) >= self._config.buffer_size:
+                if self._config.overflow == "drop":
+                    self._dropped += 1
+                    return False
+                self._condition.wait()
+            self._buffer.append(line)
+            if len(self._buffer) >= self._config.batch_size:
+                self._condition.notify_all()
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until every queued event has reached the file."""
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(
+                lambda: not self._buffer and not self._writing, timeout
+            )
+
+    def close(self) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def stats(self) -> dict[str, int]:
+        with self._condition:
+            return {
+                "queued": len(self._buffer),
+                "written": self._written,
+                "dropped": self._dropped,
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed
+                    or self._flush_requested
+                    or len(self._buffer) >= self._config.batch_size,
+                    self._config.flush_interval_seconds,
+                )
+                self._flush_requested = False
+                batch = list(self._buffer)
+                self._buffer.clear()
+                self._writing = bool(batch)
+                closed = self._closed
+                # Producers blocked on a full buffer can continue now.
+                self._condition.notify_all()
+            written = 0
+            try:
+                if batch:
+                    written = self._write_batch(batch)
+            finally:
+                with self._condition:
+                    self._written += written
+                    self._dropped += len(batch) - written
+                    self._writing = False
+                    self._condition.notify_all()
+            if closed and not self._buffer:
+                break
+        self._close_handle()
+
+    def _write_batch(self, batch: list[str]) -> int:
+        """Append ``batch`` and return how many events reached the file."""
+        try:
+            handle = self._current_handle()
+            handle.write("".join(batch))
+            handle.flush()
+            stat = os.fstat(handle.fileno())
+        except (OSError, ValueError):
+            # Reopen on the next batch; a partial write may have landed.
+            self._close_handle()
+            return 0
+        try:
+            if maybe_rotate(self.path, stat, self._rotation):
+                self._close_handle()
+        except OSError:
+            pass
+        return len(batch)
+
+    def _close_handle(self) -> None:
+        handle, self._handle = self._handle, None
+        if handle is not None:
+            try:
+                handle.close()
+            except OSError:
+                pass
+
+    def _current_handle(self):
+        handle = self._handle
+        if handle is not None:
+            try:
+                same_file = os.stat(self.path).st_ino == os.fstat(handle.fileno()).st_ino
+            except FileNotFoundError:
+                same_file = False
+            if same_file:
+                return handle
+            # Another process rotated the file; follow it to the new one.
+            handle.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = self.path.open("a", encoding="utf-8")
+        return self._handle
+
+
+_WRITERS: dict[Path, BufferedLogWriter] = {}
+_WRITERS_LOCK = threading.Lock()
+
+
+def buffered_log_writer(
+    path: Path, config: LogWriterConfig | None = None
+) -> BufferedLogWriter:
+    """Return the process-wide buffered writer for ``path``."""
+    # abspath, not resolve(): this runs per event and must not hit the disk.
+    key = Path(os.path.abspath(path))
+    with _WRITERS_LOCK:
+        writer = _WRITERS.get(key)
+        if writer is None:
+            writer = BufferedLogWriter(key, config or log_writer_config_from_env())
+            _WRITERS[key] = writer
+        return writer
+
+
+def flush_event_logs(timeout: float | None = None) -> None:
+    with _WRITERS_LOCK:
+        writers = list(_WRITERS.values())
+    for writer in writers:
+        writer.flush(timeout)
+
+
+def close_event_logs() -> None:
+    """Flush and stop every buffered writer; safe to call more than once."""
+    with _WRITERS_LOCK:
+        writers = list(_WRITERS.values())
+        _WRITERS.clear()
+    for writer in writers:
+        writer.close()
+
+
+def _forget_writers_after_fork() -> None:
+    # Writer threads do not survive fork(); children start fresh writers.
+    global _WRITERS_LOCK
+    _WRITERS.clear()
+    _WRITERS_LOCK = threading.Lock()
+
+
+atexit.register(close_event_logs)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_writers_after_fork)
+
+
 @dataclass
 class EventLogger:
     path: Path
     request_id: str | None = None
+    mode: str | None = None
+    rotation: LogRotationConfig | None = None
+
+    def __post_init__(self) -> None:
+        if self.rotation is None:
+            self.rotation = log_rotation_config_from_env()
 
     def log(self, event: str, **fields: object) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
         payload_fields = dict(fields)
         if "request_id" not in payload_fields:
             if self.request_id is None:
                 raise LogSchemaError("request_id is required for log events")
             payload_fields["request_id"] = self.request_id
 
-        required_fields = _BASE_REQUIRED_FIELDS | _EVENT_REQUIRED_FIELDS.get(
-            event, set()
-        )
-        missing = required_fields.difference(payload_fields)
-        if missing:
-            raise LogSchemaError(
-                f"Missing required fields for {event}: {sorted(missing)}"
-            )
-
+        schema = event_schema(event)
+        schema.validate(payload_fields)
         payload = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "event": event,
-            **redact_pii(payload_fields),
+            **schema.redact(payload_fields),
         }
+        mode = self.mode or os.getenv("SKILLOS_LOG_MODE", "sync").strip().lower()
+        if mode == "buffered":
+            buffered_log_writer(self.path).write(payload)
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
         with self.path.open("a", encoding="utf-8") as handle:
             handle.write(json.dumps(payload, ensure_ascii=True) + "\n")
+            handle.flush()
+            stat = os.fstat(handle.fileno())
+        maybe_rotate(self.path, stat, self.rotation)
 
 
 def log_job_enqueued(
@@ -346,6 +698,56 @@ def log_schedule_failed(
     )
 
 
+_ROUTING_SECONDS = metrics_registry().histogram(
+    "skillos_routing_duration_seconds",
+    "Routing latency; cache is hit, miss or off.",
+    ("cache",),
+)
+_ROUTING_DECISIONS = metrics_registry().counter(
+    "skillos_routing_decisions_total",
+    "Routing decisions by status.",
+    ("status",),
+)
+_SKILL_SECONDS = metrics_registry().histogram(
+    "skillos_skill_duration_seconds",
+    "Skill execution latency by skill, status and caller.",
+    ("skill_id", "status", "source"),
+)
+_JOB_SECONDS = metrics_registry().histogram(
+    "skillos_job_duration_seconds",
+    "Background job latency by skill and outcome.",
+    ("skill_id", "status"),
+)
+_CONNECTOR_SECONDS = metrics_registry().histogram(
+    "skillos_connector_duration_seconds",
+    "Connector call latency by connector and status.",
+    ("connector_id", "connector_type", "status"),
+)
+
+
+def record_skill_execution(
+    skill_id: str | None, status: str, duration_ms: float, *, source: str
+) -> None:
+    _SKILL_SECONDS.observe(
+        duration_ms / 1000, skill_id=skill_id or "", status=status, source=source
+    )
+
+
+def record_job_execution(skill_id: str, status: str, duration_ms: float) -> None:
+    _JOB_SECONDS.observe(duration_ms / 1000, skill_id=skill_id, status=status)
+
+
+def record_connector_call(
+    connector_id: str, connector_type: str, status: str, latency_ms: float
+) -> None:
+    _CONNECTOR_SECONDS.observe(
+        latency_ms / 1000,
+        connector_id=connector_id,
+        connector_type=connector_type,
+        status=status,
+    )
+
+
 def route_with_telemetry(
     query: str,
     router,
@@ -366,13 +768,85 @@ def route_with_telemetry(
         if routing_cache is not None:
             routing_cache.set(query, tags, result)
     routing_latency_ms = (time.perf_counter() - start) * 1000
+    _record_routing(routing_cache, result, routing_latency_ms, cache_hit)
+    _log_routing(
+        logger, request_id, router, routing_cache, result, routing_latency_ms, cache_hit
+    )
+    return RoutingTelemetry(result=result, routing_latency_ms=routing_latency_ms)
 
+
+async def route_with_telemetry_async(
+    query: str,
+    router,
+    logger: EventLogger,
+    request_id: str,
+    *,
+    tags: list[str] | None = None,
+    routing_cache=None,
+) -> RoutingTelemetry:
+    start = time.perf_counter()
+    result = None
+    cache_hit = False
+    if routing_cache is not None:
+        # L1 hits are answered in-process; only the L2 lookup needs a thread.
+        result = routing_cache.get_local(query, tags)
+        if result is None:
+            result = await asyncio.to_thread(routing_cache.get_remote, query, tags)
+        cache_hit = result is not None
+    if result is None:
+        result = await router.route_async(query, tags=tags)
+        if routing_cache is not None:
+            await asyncio.to_thread(routing_cache.set, query, tags, result)
+    routing_latency_ms = (time.perf_counter() - start) * 1000
+    _record_routing(routing_cache, result, routing_latency_ms, cache_hit)
+    # Sync-mode logging opens and appends to the file; keep it off the loop.
+    await asyncio.to_thread(
+        _log_routing,
+        logger,
+        request_id,
+        router,
+        routing_cache,
+        result,
+        routing_latency_ms,
+        cache_hit,
+    )
+    return RoutingTelemetry(result=result, routing_latency_ms=routing_latency_ms)
+
+
+def _record_routing(
+    routing_cache, result, routing_latency_ms: float, cache_hit: bool
+) -> None:
+    if routing_cache is None:
+        cache = "off"
+    else:
+        cache = "hit" if cache_hit else "miss"
+    _ROUTING_SECONDS.observe(routing_latency_ms / 1000, cache=cache)
+    _ROUTING_DECISIONS.inc(status=result.status)
+
+
+def _log_routing(
+    logger: EventLogger,
+    request_id: str,
+    router,
+    routing_cache,
+    result,
+    routing_latency_ms: float,
+    cache_hit: bool,
+) -> None:
+    extra: dict[str, object] = {}
+    connection_stats = getattr(router, "vector_connection_stats", None)
+    stats = connection_stats() if connection_stats else None
+    if stats is not None:
+        extra["vector_connections"] = stats
+    if routing_cache is not None:
+        extra["routing_cache"] = routing_cache.stats()
     logger.log(
         "routing_candidates",
         request_id=request_id,
         candidates=_format_candidates(result.candidates),
         routing_latency_ms=routing_latency_ms,
         cache_hit=cache_hit,
+        **extra,
     )
     logger.log(
         "routing_decision",
@@ -383,5 +857,3 @@ def route_with_telemetry(
         reason=routing_decision_reason(result),
         alternatives=result.alternatives,
     )
-
-    return RoutingTelemetry(result=result, routing_latency_ms=routing_latency_ms)
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+import json
+from pathlib import Path
+import re
+from typing import Iterable
+
+import numpy as np
+
+from skillos.log_segments import SegmentManifest, iter_segment_events, load_manifests
+from skillos.storage import atomic_write_text, file_lock
+
+_INDEX_FILE = "_index.json"
+_STATE_FILE = "compacted.json"
+_PERCENTILE_RE = re.compile(r"^p(\d{1,2}(?:\.\d+)?)$")
+_SIMPLE_AGGREGATES = {"count", "sum", "mean", "min", "max"}
+
+
+class TelemetryQueryError(ValueError):
+    pass
+
+
+def default_archive_path(log_path: Path) -> Path:
+    return Path(log_path).parent / "archive"
+
+
+@dataclass(frozen=True)
+class TelemetryQuery:
+    event: str
+    metric: str | None = None
+    group_by: tuple[str, ...] = ()
+    aggregates: tuple[str, ...] = ("count",)
+    since: datetime | None = None
+    until: datetime | None = None
+
+
+def compact_segments(log_path: Path, archive_dir: Path | None = None) -> list[Path]:
+    """Convert closed log segments into columnar partitions.
+
+    Each segment becomes one ``.npz`` part per ``date=YYYY-MM-DD/event=<type>``
+    partition. Scalar fields become columns: numeric ones as float64 (NaN when
+    absent), everything else as strings. Nested values are not archived.
+    Already compacted segments are skipped.
+    """
+    archive_dir = Path(archive_dir or default_archive_path(log_path))
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    written: list[Path] = []
+    with file_lock(archive_dir / "compact"):
+        state_path = archive_dir / _STATE_FILE
+        compacted = set(_read_json(state_path, []))
+        for manifest in load_manifests(log_path):
+            if manifest.path.name in compacted or not manifest.path.exists():
+                continue
+            written.extend(_compact_segment(manifest, archive_dir))
+            compacted.add(manifest.path.name)
+            atomic_write_text(
+                state_path,
+                json.dumps(sorted(compacted), ensure_ascii=True),
+                encoding="utf-8",
+            )
+    return written
+
+
+def query_archive(archive_dir: Path, query: TelemetryQuery) -> list[dict[str, object]]:
+    """Aggregate one event type over the archive.
+
+    Date partitions outside ``since``/``until`` are never listed, parts whose
+    index range misses the window are never opened, and only the timestamp,
+    metric and group-by columns are read from the parts that remain.
+    """
+    aggregates = _validate_aggregates(query)
+    since = _as_utc(query.since)
+    until = _as_utc(query.until)
+    names = ["timestamp", *query.group_by]
+    if query.metric:
+        names.append(query.metric)
+    columns = _load_columns(
+        Path(archive_dir), query.event, names, query.group_by, since, until
+    )
+    timestamps = columns["timestamp"]
+    mask = np.ones(timestamps.shape, dtype=bool)
+    if since is not None:
+        mask &= timestamps >= since.timestamp()
+    if until is not None:
+        mask &= timestamps <= until.timestamp()
+    values = None
+    if query.metric:
+        values = columns[query.metric]
+        mask &= ~np.isnan(values)
+        values = values[mask]
+    keys = [columns[name][mask] for name in query.group_by]
+    return _aggregate(query.group_by, keys, values, int(mask.sum()), aggregates)
+
+
+def _compact_segment(manifest: SegmentManifest, archive_dir: Path) -> list[Path]:
+    partitions: dict[tuple[str, str], list[dict[str, object]]] = {}
+    for event in iter_segment_events(manifest.path):
+        timestamp = event.get("timestamp")
+        if not isinstance(timestamp, str):
+            continue
+        try:
+            moment = _as_utc(datetime.fromisoformat(timestamp))
+        except ValueError:
+            continue
+        key = (moment.date().isoformat(), str(event.get("event")))
+        row = {name: value for name, value in event.items() if _is_scalar(value)}
+        row["timestamp"] = moment.timestamp()
+        partitions.setdefault(key, []).append(row)
+
+    part_name = manifest.path.name.split(".", 1)[0]
+    written: list[Path] = []
+    for (day, event_type), rows in sorted(partitions.items()):
+        directory = archive_dir / f"date={day}" / f"event={event_type}"
+        directory.mkdir(parents=True, exist_ok=True)
+        columns = _columns(rows)
+        part_path = directory / f"{part_name}.npz"
+        tmp_path = directory / f"{part_name}.tmp.npz"
+        np.savez_compressed(tmp_path, **columns)
+        tmp_path.replace(part_path)
+        index_path = directory / _INDEX_FILE
+        index = _read_json(index_path, {})
+        index[part_path.name] = {
+            "start": float(columns["timestamp"].min()),
+            "end": float(columns["timestamp"].max()),
+            "rows": len(rows),
+        }
+        atomic_write_text(index_path, json.dumps(index, ensure_ascii=True), encoding="utf-8")
+        written.append(part_path)
+    return written
+
+
+def _columns(rows: list[dict[str, object]]) -> dict[str, np.ndarray]:
+    names = sorted({name for row in rows for name in row})
+    columns: dict[str, np.ndarray] = {}
+    for name in names:
+        raw = [row.get(name) for row in rows]
+        present = [value for value in raw if value is not None]
+        if all(isinstance(value, (int, float)) for value in present):
+            columns[name] = np.array(
+                [np.nan if value is None else float(value) for value in raw],
+                dtype=np.float64,
+            )
+        else:
+            columns[name] = np.array(
+                ["" if value is None else str(value) for value in raw], dtype=str
+            )
+    return columns
+
+
+def _load_columns(
+    archive_dir: Path,
+    event: str,
+    names: list[str],
+    group_by: tuple[str, ...],
+    since: datetime | None,
+    until: datetime | None,
+) -> dict[str, np.ndarray]:
+    chunks: dict[str, list[np.ndarray]] = {name: [] for name in names}
+    for directory in _partition_dirs(archive_dir, event, since, until):
+        index = _read_json(directory / _INDEX_FILE, {})
+        for part_name, info in sorted(index.items()):
+            if since is not None and info["end"] < since.timestamp():
+                continue
+            if until is not None and info["start"] > until.timestamp():
+                continue
+            with np.load(directory / part_name) as part:
+                rows = int(info["rows"])
+                for name in names:
+                    column = part[name] if name in part.files else None
+                    chunks[name].append(
+                        _group_column(column, rows)
+                        if name in group_by
+                        else _numeric_column(column, rows)
+                    )
+    return {
+        name: np.concatenate(parts) if parts else np.array([], dtype=np.float64)
+        for name, parts in chunks.items()
+    }
+
+
+def _group_column(column: np.ndarray | None, rows: int) -> np.ndarray:
+    if column is None:
+        return np.full(rows, "", dtype=str)
+    if column.dtype.kind == "f":
+        # Whole numbers group as "3", not "3.0"; absent values as "".
+        return np.array(
+            ["" if np.isnan(value) else f"{value:g}" for value in column], dtype=str
+        )
+    return column
+
+
+def _numeric_column(column: np.ndarray | None, rows: int) -> np.ndarray:
+    if column is None or column.dtype.kind != "f":
+        # Absent or non-numeric in this part: the rows carry no metric value.
+        return np.full(rows, np.nan)
+    return column
+
+
+def _partition_dirs(
+    archive_dir: Path, event: str, since: datetime | None, until: datetime | None
+) -> Iterable[Path]:
+    first = since.date() if since is not None else None
+    last = until.date() if until is not None else None
+    for day_dir in sorted(archive_dir.glob("date=*")):
+        try:
+            day = date.fromisoformat(day_dir.name.split("=", 1)[1])
+        except ValueError:
+            continue
+        if first is not None and day < first:
+            continue
+        if last is not None and day > last:
+            continue
+        directory = day_dir / f"event={event}"
+        if directory.exists():
+            yield directory
+
+
+def _aggregate(
+    group_by: tuple[str, ...],
+    keys: list[np.ndarray],
+    values: np.ndarray | None,
+    row_count: int,
+    aggregates: list[str],
+) -> list[dict[str, object]]:
+    if row_count == 0:
+        return []
+    if keys:
+        combined = keys[0]
+        for key in keys[1:]:
+            combined = np.char.add(np.char.add(combined, "\x1f"), key)
+        groups, inverse = np.unique(combined, return_inverse=True)
+    else:
+        groups = np.array([""])
+        inverse = np.zeros(row_count, dtype=np.intp)
+    counts = np.bincount(inverse, minlength=len(groups))
+    sorted_values = None
+    bounds = np.concatenate([[0], np.cumsum(counts)])
+    if values is not None:
+        order = np.lexsort((values, inverse))
+        sorted_values = values[order]
+        sums = np.bincount(inverse, weights=values, minlength=len(groups))
+
+    results: list[dict[str, object]] = []
+    for position, group in enumerate(groups):
+        row: dict[str, object] = {}
+        if keys:
+            row.update(zip(group_by, str(group).split("\x1f")))
+        for aggregate in aggregates:
+            if aggregate == "count":
+                row["count"] = int(counts[position])
+                continue
+            window = sorted_values[bounds[position] : bounds[position + 1]]
+            if aggregate == "sum":
+                row["sum"] = float(sums[position])
+            elif aggregate == "mean":
+                row["mean"] = float(sums[position] / counts[position])
+            elif aggregate == "min":
+                row["min"] = float(window[0])
+            elif aggregate == "max":
+                row["max"] = float(window[-1])
+            else:
+                percentile = float(_PERCENTILE_RE.match(aggregate).group(1))
+                row[aggregate] = float(np.percentile(window, percentile))
+        results.append(row)
+    return results
+
+
+def _validate_aggregates(query: TelemetryQuery) -> list[str]:
+    aggregates = [aggregate.strip().lower() for aggregate in query.aggregates]
+    if not aggregates:
+        raise TelemetryQueryError("At least one aggregate is required")
+    for aggregate in aggregates:
+        if aggregate not in _SIMPLE_AGGREGATES and not _PERCENTILE_RE.match(aggregate):
+            raise TelemetryQueryError(f"Unknown aggregate: {aggregate}")
+        if aggregate != "count" and not query.metric:
+            raise TelemetryQueryError(f"Aggregate {aggregate} requires a metric")
+    return aggregates
+
+
+def parse_time_bound(
+    value: str | None, *, end: bool = False, now: datetime | None = None
+) -> datetime | None:
+    """Parse ``--since``/``--until``: ISO timestamps, dates, ``today``, ``yesterday``.
+
+    With ``end=True`` a whole day (date or keyword) resolves to its last instant.
+    """
+    if value is None:
+        return None
+    value = value.strip().lower()
+    today = (now or datetime.now(timezone.utc)).date()
+    try:
+        if value in {"today", "yesterday"}:
+            day = today if value == "today" else today - timedelta(days=1)
+        elif len(value) == 10:
+            day = date.fromisoformat(value)
+        else:
+            return _as_utc(datetime.fromisoformat(value))
+    except ValueError as exc:
+        raise TelemetryQueryError(f"Invalid time bound: {value}") from exc
+    start = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    return start + timedelta(days=1, microseconds=-1) if end else start
+
+
+def _is_scalar(value: object) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool))
+
+
+def _read_json(path: Path, default):
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return default
+
+
+def _as_utc(moment: datetime | None) -> datetime | None:
+    if moment is not None and moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment
@@ -0,0 +1,399 @@
+from __future__ import annotations
+
+import atexit
+from collections import deque
+import contextvars
+from dataclasses import dataclass, field
+import functools
+import inspect
+import json
+import os
+from pathlib import Path
+import random
+import threading
+import time
+from typing import Any, Callable
+
+# Monotonic clocks have no epoch; spans are timed with monotonic_ns and
+# shifted by this offset only when exported.
+_EPOCH_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+_STATUS_OK = 1
+_STATUS_ERROR = 2
+_SPAN_KIND_INTERNAL = 1
+
+
+@dataclass(frozen=True)
+class TracingConfig:
+    sample_rate: float = 0.01
+    buffer_size: int = 4096
+    export_path: Path | None = None
+    export_interval_ms: int = 1000
+    service_name: str = "skillos"
+
+
+def tracing_config_from_env() -> TracingConfig:
+    export_path = os.getenv("SKILLOS_TRACE_EXPORT_PATH", "").strip()
+    return TracingConfig(
+        sample_rate=min(max(_env_float("SKILLOS_TRACE_SAMPLE_RATE", 0.01), 0.0), 1.0),
+        buffer_size=max(_env_int("SKILLOS_TRACE_BUFFER_SIZE", 4096), 1),
+        export_path=Path(export_path) if export_path else None,
+        export_interval_ms=max(_env_int("SKILLOS_TRACE_EXPORT_INTERVAL_MS", 1000), 0),
+        service_name=os.getenv("SKILLOS_TRACE_SERVICE_NAME", "skillos").strip() or "skillos",
+    )
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    end_ns: int | None = None
+    attributes: dict[str, object] = field(default_factory=dict)
+    error: str | None = None
+
+    def set_attribute(self, key: str, value: object) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float | None:
+        if self.end_ns is None:
+            return None
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    def to_otlp(self) -> dict[str, object]:
+        payload: dict[str, object] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": _SPAN_KIND_INTERNAL,
+            "startTimeUnixNano": str(self.start_ns + _EPOCH_OFFSET_NS),
+            "endTimeUnixNano": str((self.end_ns or self.start_ns) + _EPOCH_OFFSET_NS),
+            "attributes": _otlp_attributes(self.attributes),
+            "status": (
+                {"code": _STATUS_ERROR, "message": self.error}
+                if self.error
+                else {"code": _STATUS_OK}
+            ),
+        }
+        if self.parent_id:
+            payload["parentSpanId"] = self.parent_id
+        return payload
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: object) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+# Marks a request whose root was not sampled, so nested spans skip the dice roll.
+_UNSAMPLED = object()
+_CURRENT_SPAN: contextvars.ContextVar[object | None] = contextvars.ContextVar(
+    "skillos_current_span", default=None
+)
+
+
+class Tracer:
+    """Sampled span recorder backed by a fixed-size ring buffer.
+
+    Sampling is decided once per root span; unsampled requests pay one
+    context variable lookup per nested span. Finished spans of sampled
+    requests are appended to the ring buffer (oldest are dropped when full).
+    With ``export_path`` set, a root span that ends after the export interval
+    drains the buffer and hands the spans to a background exporter thread,
+    which writes them as OTLP/JSON lines.
+    """
+
+    def __init__(self, config: TracingConfig | None = None) -> None:
+        self.config = config or TracingConfig()
+        self._buffer: deque[Span] = deque(maxlen=self.config.buffer_size)
+        self._export_lock = threading.Lock()
+        self._last_export = time.monotonic()
+        self._random = random.Random()
+        self._pending: deque[list[Span]] = deque()
+        self._condition = threading.Condition()
+        self._exporting = False
+        self._exporter: threading.Thread | None = None
+
+    def span(self, name: str, **attributes: object) -> _SpanScope:
+        return _SpanScope(self, name, attributes)
+
+    def spans(self) -> list[Span]:
+        return list(self._buffer)
+
+    def drain(self) -> list[Span]:
+        spans: list[Span] = []
+        while True:
+            try:
+                spans.append(self._buffer.popleft())
+            except IndexError:
+                return spans
+
+    def export(self, path: Path | None = None) -> int:
+        """Append buffered spans to ``path`` as one OTLP/JSON request line.
+
+        Runs in the caller, together with any batches still waiting for the
+        background exporter.
+        """
+        path = path or self.config.export_path
+        if path is None:
+            return 0
+        with self._condition:
+            spans = [span for batch in self._pending for span in batch]
+            self._pending.clear()
+            self._last_export = time.monotonic()
+        spans.extend(self.drain())
+        if not spans:
+            return 0
+        self._write(Path(path), spans)
+        return len(spans)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Block until the background exporter has written every handed-off batch."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._exporting, timeout
+            )
+
+    def _start(self, name: str, attributes: dict[str, object], parent: Span | None) -> Span:
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent else f"{self._random.getrandbits(128):032x}",
+            span_id=f"{self._random.getrandbits(64):016x}",
+            parent_id=parent.span_id if parent else None,
+            start_ns=time.monotonic_ns(),
+            attributes=attributes,
+        )
+
+    def _finish(self, span: Span, root: bool) -> None:
+        span.end_ns = time.monotonic_ns()
+        self._buffer.append(span)
+        if root:
+            self._maybe_export()
+
+    def _sampled(self) -> bool:
+        rate = self.config.sample_rate
+        return rate >= 1.0 or (rate > 0.0 and self._random.random() < rate)
+
+    def _maybe_export(self) -> None:
+        # Only the drain happens here; file I/O and encoding stay on the
+        # exporter thread, off the request that ended the root span.
+        if self.config.export_path is None:
+            return
+        interval_ms = self.config.export_interval_ms
+        if (time.monotonic() - self._last_export) * 1000 < interval_ms:
+            return
+        with self._condition:
+            now = time.monotonic()
+            if (now - self._last_export) * 1000 < interval_ms:
+                return
+            self._last_export = now
+            spans = self.drain()
+            if not spans:
+                return
+            self._pending.append(spans)
+            if self._exporter is None:
+                self._exporter = threading.Thread(
+                    target=self._run_exporter, name="skillos-trace-export", daemon=True
+                )
+                self._exporter.start()
+            self._condition.notify_all()
+
+    def _run_exporter(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: bool(self._pending))
+                spans = self._pending.popleft()
+                self._exporting = True
+            try:
+                self._write(Path(self.config.export_path), spans)
+            except (OSError, TypeError, ValueError):
+                # Tracing is best effort; a failed batch is dropped.
+                pass
+            finally:
+                with self._condition:
+                    self._exporting = False
+                    self._condition.notify_all()
+
+    def _write(self, path: Path, spans: list[Span]) -> None:
+        line = json.dumps(_otlp_request(spans, self.config.service_name)) + "\n"
+        with self._export_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+
+
+class _SpanScope:
+    """Context manager behind ``Tracer.span``; a class, not a generator, to
+    keep the unsampled path to a context variable lookup."""
+
+    __slots__ = ("_tracer", "_name", "_attributes", "_span", "_token", "_root")
+
+    def __init__(self, tracer: Tracer, name: str, attributes: dict[str, object]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._attributes = attributes
+        self._span: Span | None = None
+        self._token: contextvars.Token | None = None
+        self._root = False
+
+    def __enter__(self) -> Span | _NoopSpan:
+        parent = _CURRENT_SPAN.get()
+        if parent is _UNSAMPLED:
+            return _NOOP_SPAN
+        if parent is None:
+            self._root = True
+            if not self._tracer._sampled():
+                self._token = _CURRENT_SPAN.set(_UNSAMPLED)
+                return _NOOP_SPAN
+        self._span = self._tracer._start(self._name, self._attributes, parent)
+        self._token = _CURRENT_SPAN.set(self._span)
+        return self._span
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if self._token is not None:
+            _CURRENT_SPAN.reset(self._token)
+        if self._span is not None:
+            if exc_type is not None:
+                self._span.error = exc_type.__name__
+            self._tracer._finish(self._span, self._root)
+
+
+_TRACER: Tracer | None = None
+_TRACER_LOCK = threading.Lock()
+
+
+def tracer() -> Tracer:
+    """Return the process-wide tracer, configured from the environment."""
+    global _TRACER
+    current = _TRACER
+    if current is not None:
+        return current
+    with _TRACER_LOCK:
+        if _TRACER is None:
+            _TRACER = Tracer(tracing_config_from_env())
+        return _TRACER
+
+
+def configure_tracing(config: TracingConfig | None = None) -> Tracer:
+    """Replace the process-wide tracer, exporting what the old one buffered."""
+    global _TRACER
+    with _TRACER_LOCK:
+        previous = _TRACER
+        _TRACER = Tracer(config or tracing_config_from_env())
+    if previous is not None:
+        previous.export()
+    return _TRACER
+
+
+def span(name: str, **attributes: object):
+    return tracer().span(name, **attributes)
+
+
+def traced(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorate a function or coroutine function to run inside ``span(name)``."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with tracer().span(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with tracer().span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def submit_in_context(executor, func: Callable[..., Any], /, *args: Any, **kwargs: Any):
+    """``executor.submit`` that runs ``func`` in a copy of the caller's context.
+
+    ``asyncio.to_thread`` already copies context variables; thread pools do
+    not, which would orphan spans started by pooled steps.
+    """
+    context = contextvars.copy_context()
+    return executor.submit(context.run, func, *args, **kwargs)
+
+
+def _export_at_exit() -> None:
+    if _TRACER is not None:
+        _TRACER.flush(timeout=5)
+        _TRACER.export()
+
+
+def _reset_tracer_after_fork() -> None:
+    global _TRACER, _TRACER_LOCK
+    _TRACER = None
+    _TRACER_LOCK = threading.Lock()
+
+
+atexit.register(_export_at_exit)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_tracer_after_fork)
+
+
+def _otlp_request(spans: list[Span], service_name: str) -> dict[str, object]:
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": _otlp_attributes({"service.name": service_name})
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "skillos.tracing"},
+                        "spans": [span.to_otlp() for span in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def _otlp_attributes(attributes: dict[str, object]) -> list[dict[str, object]]:
+    encoded: list[dict[str, object]] = []
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            typed: dict[str, object] = {"boolValue": value}
+        elif isinstance(value, int):
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": str(value)}
+        encoded.append({"key": key, "value": typed})
+    return encoded
+
+
+def _env_int(name: str, default: int) -> int:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return int(str(raw).strip())
+    except ValueError:
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        return float(str(raw).strip())
+    except ValueError:
+        return default
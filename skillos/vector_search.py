@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from functools import lru_cache
 import hashlib
+from importlib import util as importlib_util
+from itertools import islice
+import json
 import os
+from pathlib import Path
 import re
-from typing import Iterable
+import threading
+from typing import Callable, Iterable, Iterator, Protocol
 
 import httpx
+import numpy as np
+
+from skillos.storage import atomic_write_text, file_lock
+from skillos.tenancy import resolve_tenant_root
 
 
 class VectorSearchError(ValueError):
@@ -14,6 +26,9 @@ class VectorSearchError(ValueError):
 
 
 _TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+# HTTP/2 needs the optional ``h2`` package (``httpx[http2]``); without it the
+# pooled client stays on HTTP/1.1 keep-alive.
+_HTTP2_AVAILABLE = importlib_util.find_spec("h2") is not None
 
 
 def _env_int(name: str, default: int) -> int:
@@ -36,34 +51,61 @@ def _env_float(name: str, default: float) -> float:
         return default
 
 
+def _env_bool(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    return str(raw).strip().lower() in {"1", "true", "yes", "on"}
+
+
 def _tokenize(text: str) -> list[str]:
     return _TOKEN_RE.findall(text.lower())
 
 
-def _normalize_vector(vector: list[float]) -> list[float]:
-    norm = sum(value * value for value in vector) ** 0.5
-    if norm == 0.0:
-        return vector
-    return [value / norm for value in vector]
+_TOKEN_CACHE_SIZE = 65_536
 
 
-def _is_zero_vector(vector: list[float]) -> bool:
-    return not any(vector)
+@lru_cache(maxsize=_TOKEN_CACHE_SIZE)
+def _token_bucket(token: str, dim: int) -> tuple[int, float]:
+    digest = hashlib.sha256(token.encode("utf-8")).digest()
+    index = int.from_bytes(digest[:4], "big") % dim
+    sign = -1.0 if (digest[4] & 1) else 1.0
+    return index, sign
 
 
-def embed_text(text: str, dim: int) -> list[float]:
+def embed_many(texts: Iterable[str], dim: int) -> np.ndarray:
+    """Embed texts into an ``(n, dim)`` float64 matrix of hashed token counts.
+
+    Each token adds its hashed sign to one bucket; rows are then scaled to
+    unit length. Values match ``embed_text`` exactly, so vectors produced
+    either way can share a collection.
+    """
     if dim <= 0:
         raise VectorSearchError("embedding_dim must be positive")
-    vector = [0.0 for _ in range(dim)]
-    tokens = _tokenize(text)
-    if not tokens:
-        return vector
-    for token in tokens:
-        digest = hashlib.sha256(token.encode("utf-8")).digest()
-        index = int.from_bytes(digest[:4], "big") % dim
-        sign = -1.0 if (digest[4] & 1) else 1.0
-        vector[index] += sign
-    return _normalize_vector(vector)
+    texts = list(texts)
+    offsets: list[int] = []
+    signs: list[float] = []
+    for row, text in enumerate(texts):
+        base = row * dim
+        for token in _tokenize(text):
+            index, sign = _token_bucket(token, dim)
+            offsets.append(base + index)
+            signs.append(sign)
+    matrix = np.bincount(
+        np.asarray(offsets, dtype=np.intp),
+        weights=np.asarray(signs, dtype=np.float64),
+        minlength=len(texts) * dim,
+    ).astype(np.float64, copy=False).reshape(len(texts), dim)
+    # Counts are small integers, so the squared sums are exact and the
+    # power/divide below round exactly like the scalar implementation did.
+    norms = np.power(np.einsum("ij,ij->i", matrix, matrix), 0.5)
+    nonzero = norms != 0.0
+    matrix[nonzero] /= norms[nonzero, None]
+    return matrix
+
+
+def embed_text(text: str, dim: int) -> list[float]:
+    return embed_many([text], dim)[0].tolist()
 
 
 @dataclass(frozen=True)
@@ -73,6 +115,13 @@ class VectorSearchConfig:
     api_key: str | None = None
     embedding_dim: int = 128
     timeout_seconds: float = 5.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry_seconds: float = 30.0
+    http2: bool = False
+    upsert_batch_size: int = 256
+    upsert_parallelism: int = 4
+    background_index: bool = False
 
 
 def vector_search_config_from_env() -> VectorSearchConfig | None:
@@ -89,9 +138,46 @@ def vector_search_config_from_env() -> VectorSearchConfig | None:
         api_key=api_key,
         embedding_dim=embedding_dim,
         timeout_seconds=timeout_seconds,
+        max_connections=_env_int("SKILLOS_VECTOR_MAX_CONNECTIONS", 20),
+        max_keepalive_connections=_env_int("SKILLOS_VECTOR_MAX_KEEPALIVE", 10),
+        keepalive_expiry_seconds=_env_float("SKILLOS_VECTOR_KEEPALIVE_EXPIRY", 30.0),
+        http2=_env_bool("SKILLOS_VECTOR_HTTP2", False),
+        upsert_batch_size=_env_int("SKILLOS_VECTOR_UPSERT_BATCH", 256),
+        upsert_parallelism=_env_int("SKILLOS_VECTOR_UPSERT_PARALLELISM", 4),
+        background_index=_env_bool("SKILLOS_VECTOR_BACKGROUND_INDEX", False),
     )
 
 
+@dataclass(frozen=True)
+class LocalVectorSearchConfig:
+    path: Path
+    embedding_dim: int = 128
+
+
+def default_vector_index_path(root: Path) -> Path:
+    root_path = resolve_tenant_root(root)
+    return root_path / "vectors" / "skills.npy"
+
+
+def vector_search_from_env(root: Path | None = None) -> "VectorSearchBackend | None":
+    backend = os.getenv("SKILLOS_VECTOR_BACKEND", "qdrant").strip().lower()
+    if backend == "local":
+        if root is None:
+            from skillos.skills.paths import default_skills_root
+
+            root = Path(os.getenv("SKILLOS_ROOT") or default_skills_root())
+        return LocalVectorSearch(
+            LocalVectorSearchConfig(
+                path=default_vector_index_path(root),
+                embedding_dim=_env_int("SKILLOS_VECTOR_DIM", 128),
+            )
+        )
+    config = vector_search_config_from_env()
+    if config is None:
+        return None
+    return QdrantVectorSearch(config)
+
+
 @dataclass(frozen=True)
 class VectorDocument:
     doc_id: str
@@ -105,34 +191,171 @@ class VectorMatch:
     score: float
 
 
+class VectorSearchBackend(Protocol):
+    @property
+    def ready(self) -> bool:
+        """False while submitted documents are still being indexed."""
+        ...
+
+    def index(self, documents: Iterable[VectorDocument]) -> None:
+        ...
+
+    def delete(self, doc_ids: Iterable[str]) -> None:
+        ...
+
+    def sync(self, documents: Iterable[VectorDocument]) -> None:
+        """Make the index hold exactly ``documents``, touching only changes."""
+        ...
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        min_score: float | None = None,
+    ) -> list[VectorMatch]:
+        ...
+
+    def search_many(
+        self,
+        queries: Iterable[str],
+        *,
+        limit: int,
+        min_score: float | None = None,
+    ) -> list[list[VectorMatch]]:
+        ...
+
+    async def search_many_async(
+        self,
+        queries: Iterable[str],
+        *,
+        limit: int,
+        min_score: float | None = None,
+    ) -> list[list[VectorMatch]]:
+        ...
+
+
+class _ConnectionStats:
+    """Process-wide counters of pooled versus newly opened connections."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._new_connections = 0
+
+    def record(self, trace: "_RequestTrace") -> None:
+        with self._lock:
+            self._requests += 1
+            if trace.new_connection:
+                self._new_connections += 1
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "pool_hits": self._requests - self._new_connections,
+                "new_connections": self._new_connections,
+            }
+
+
+class _RequestTrace:
+    """httpcore trace hook noting whether a request had to open a connection."""
+
+    def __init__(self) -> None:
+        self.new_connection = False
+
+    def __call__(self, event_name: str, info: dict[str, object]) -> None:
+        if event_name.startswith("connection.connect_"):
+            self.new_connection = True
+
+    async def async_hook(self, event_name: str, info: dict[str, object]) -> None:
+        self(event_name, info)
+
+
 class QdrantVectorSearch:
-    def __init__(self, config: VectorSearchConfig) -> None:
+    def __init__(
+        self,
+        config: VectorSearchConfig,
+        *,
+        transport: httpx.BaseTransport | None = None,
+        async_transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
         self._config = config
         self._base_url = config.base_url.rstrip("/")
         self._collection = config.collection
+        self._transport = transport
+        self._async_transport = async_transport
+        self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._client_lock = threading.Lock()
+        self._stats = _ConnectionStats()
+        self._jobs_lock = threading.Lock()
+        self._jobs: ThreadPoolExecutor | None = None
+        self._pending_jobs = 0
+        self._index_error: VectorSearchError | None = None
+
+    @property
+    def ready(self) -> bool:
+        with self._jobs_lock:
+            return self._pending_jobs == 0 and self._index_error is None
+
+    def connection_stats(self) -> dict[str, int]:
+        return self._stats.snapshot()
+
+    def close(self) -> None:
+        with self._jobs_lock:
+            jobs, self._jobs = self._jobs, None
+        if jobs is not None:
+            jobs.shutdown(wait=True)
+        with self._client_lock:
+            client, self._client = self._client, None
+            async_client, self._async_client = self._async_client, None
+            async_loop, self._async_loop = self._async_loop, None
+        if client is not None:
+            client.close()
+        if async_client is not None:
+            _retire_async_client(async_client, async_loop, wait=True)
+
+    async def aclose(self) -> None:
+        client, self._async_client = self._async_client, None
+        self._async_loop = None
+        if client is not None:
+            await client.aclose()
 
     def index(self, documents: Iterable[VectorDocument]) -> None:
-        docs = list(documents)
-        if not docs:
+        """Upsert documents in chunks of ``upsert_batch_size``.
+
+        Up to ``upsert_parallelism`` chunks are embedded and uploaded at once.
+        With ``background_index`` the upload is queued on a worker thread and
+        ``ready`` stays False until Qdrant has applied it.
+        """
+        if self._config.background_index:
+            self._submit(self._index_chunks, list(documents), True)
             return
-        self._ensure_collection()
-        points: list[dict[str, object]] = []
-        for doc in docs:
-            vector = embed_text(doc.text, self._config.embedding_dim)
-            if _is_zero_vector(vector):
-                continue
-            payload = dict(doc.payload or {})
-            if "skill_id" not in payload:
-                payload["skill_id"] = doc.doc_id
-            points.append(
-                {
-                    "id": doc.doc_id,
-                    "vector": vector,
-                    "payload": payload,
-                }
-            )
-        if points:
-            self._upsert(points)
+        self._index_chunks(documents, False)
+
+    def delete(self, doc_ids: Iterable[str]) -> None:
+        ids = list(doc_ids)
+        if not ids:
+            return
+        if self._config.background_index:
+            # Queued behind pending uploads so a stale upsert cannot
+            # resurrect a deleted point.
+            self._submit(self._delete_points, ids)
+            return
+        self._delete_points(ids)
+
+    def sync(self, documents: Iterable[VectorDocument]) -> None:
+        """Upsert changed documents and delete points with no document.
+
+        Existing point hashes are read with the scroll API, so a restart
+        against an unchanged catalog issues no upserts at all.
+        """
+        if self._config.background_index:
+            self._submit(self._sync_points, list(documents), True)
+            return
+        self._sync_points(documents, False)
 
     def search(
         self,
@@ -141,11 +364,11 @@ class QdrantVectorSearch:
         limit: int,
         min_score: float | None = None,
     ) -> list[VectorMatch]:
-        vector = embed_text(query, self._config.embedding_dim)
-        if _is_zero_vector(vector):
+        vector = embed_many([query], self._config.embedding_dim)[0]
+        if not vector.any():
             return []
         payload = {
-            "vector": vector,
+            "vector": vector.tolist(),
             "limit": limit,
             "with_payload": True,
         }
@@ -154,21 +377,74 @@ class QdrantVectorSearch:
             f"/collections/{self._collection}/points/search",
             payload,
         )
-        results = data.get("result", [])
-        matches: list[VectorMatch] = []
-        for item in results:
-            try:
-                score = float(item.get("score", 0.0))
-            except (TypeError, ValueError):
-                score = 0.0
-            if min_score is not None and score < min_score:
-                continue
-            payload = item.get("payload") or {}
-            doc_id = payload.get("skill_id", item.get("id"))
-            if doc_id is None:
+        return _parse_matches(data.get("result", []), min_score)
+
+    def search_many(
+        self,
+        queries: Iterable[str],
+        *,
+        limit: int,
+        min_score: float | None = None,
+    ) -> list[list[VectorMatch]]:
+        queries = list(queries)
+        positions, payload = self._batch_search_payload(queries, limit)
+        if not positions:
+            return [[] for _ in queries]
+        data = self._request(
+            "POST",
+            f"/collections/{self._collection}/points/search/batch",
+            payload,
+        )
+        return _batch_matches(len(queries), positions, data, min_score)
+
+    async def search_async(
+        self,
+        query: str,
+        *,
+        limit: int,
+        min_score: float | None = None,
+    ) -> list[VectorMatch]:
+        matches = await self.search_many_async(
+            [query], limit=limit, min_score=min_score
+        )
+        return matches[0]
+
+    async def search_many_async(
+        self,
+        queries: Iterable[str],
+        *,
+        limit: int,
+        min_score: float | None = None,
+    ) -> list[list[VectorMatch]]:
+        queries = list(queries)
+        positions, payload = self._batch_search_payload(queries, limit)
+        if not positions:
+            return [[] for _ in queries]
+        data = await self._request_async(
+            "POST",
+            f"/collections/{self._collection}/points/search/batch",
+            payload,
+        )
+        return _batch_matches(len(queries), positions, data, min_score)
+
+    def _batch_search_payload(
+        self, queries: list[str], limit: int
+    ) -> tuple[list[int], dict[str, object]]:
+        positions: list[int] = []
+        searches: list[dict[str, object]] = []
+        vectors = embed_many(queries, self._config.embedding_dim)
+        for position, vector in enumerate(vectors):
+            if not vector.any():
                 continue
-            matches.append(VectorMatch(doc_id=str(doc_id), score=score))
-        return matches
+            positions.append(position)
+            searches.append(
+                {
+                    "vector": vector.tolist(),
+                    "limit": limit,
+                    "with_payload": True,
+                }
+            )
+        return positions, {"searches": searches}
 
     def _ensure_collection(self) -> None:
         url = f"{self._base_url}/collections/{self._collection}"
@@ -184,14 +460,135 @@ class QdrantVectorSearch:
                 f"vector_search_error: {response.status_code}"
             )
 
-    def _upsert(self, points: list[dict[str, object]]) -> None:
-        payload = {"points": points}
+    def _index_chunks(
+        self, documents: Iterable[VectorDocument], background: bool
+    ) -> None:
+        chunks = _chunked(documents, max(1, self._config.upsert_batch_size))
+        chunk = next(chunks, None)
+        if chunk is None:
+            return
+        self._ensure_collection()
+        parallelism = max(1, self._config.upsert_parallelism)
+        with ThreadPoolExecutor(
+            max_workers=parallelism, thread_name_prefix="skillos-vector-upsert"
+        ) as executor:
+            in_flight: set[Future[None]] = set()
+            while chunk is not None:
+                next_chunk = next(chunks, None)
+                if background and next_chunk is None:
+                    # Qdrant applies a collection's updates in order, so once
+                    # the earlier ``wait=false`` chunks are acknowledged the
+                    # final ``wait=true`` upsert doubles as a readiness barrier.
+                    _drain(in_flight)
+                    self._upsert_chunk(chunk, wait_applied=True)
+                    return
+                if len(in_flight) >= parallelism:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    _drain(done)
+                in_flight.add(
+                    executor.submit(
+                        self._upsert_chunk, chunk, wait_applied=not background
+                    )
+                )
+                chunk = next_chunk
+            _drain(in_flight)
+
+    def _sync_points(
+        self, documents: Iterable[VectorDocument], background: bool
+    ) -> None:
+        self._ensure_collection()
+        stored = self._scroll_hashes()
+        changed: list[VectorDocument] = []
+        for doc in documents:
+            if stored.pop(doc.doc_id, None) != _hash_text(doc.text):
+                changed.append(doc)
+        self._index_chunks(changed, background)
+        if stored:
+            self._delete_points(list(stored))
+
+    def _scroll_hashes(self) -> dict[str, str | None]:
+        hashes: dict[str, str | None] = {}
+        offset: object = None
+        while True:
+            payload: dict[str, object] = {
+                "limit": max(1, self._config.upsert_batch_size),
+                "with_payload": ["content_hash"],
+                "with_vector": False,
+            }
+            if offset is not None:
+                payload["offset"] = offset
+            data = self._request(
+                "POST",
+                f"/collections/{self._collection}/points/scroll",
+                payload,
+            )
+            result = data.get("result") or {}
+            if not isinstance(result, dict):
+                raise VectorSearchError("vector_search_invalid_response")
+            for point in result.get("points") or []:
+                point_payload = point.get("payload") or {}
+                hashes[str(point.get("id"))] = point_payload.get("content_hash")
+            offset = result.get("next_page_offset")
+            if offset is None:
+                return hashes
+
+    def _upsert_chunk(
+        self, documents: list[VectorDocument], *, wait_applied: bool
+    ) -> None:
+        vectors = embed_many(
+            (doc.text for doc in documents), self._config.embedding_dim
+        )
+        points: list[dict[str, object]] = []
+        for doc, vector in zip(documents, vectors):
+            if not vector.any():
+                continue
+            payload = dict(doc.payload or {})
+            if "skill_id" not in payload:
+                payload["skill_id"] = doc.doc_id
+            payload["content_hash"] = _hash_text(doc.text)
+            points.append(
+                {
+                    "id": doc.doc_id,
+                    "vector": vector.tolist(),
+                    "payload": payload,
+                }
+            )
+        if not points:
+            return
+        wait_flag = "true" if wait_applied else "false"
         self._request(
             "PUT",
-            f"/collections/{self._collection}/points?wait=true",
-            payload,
+            f"/collections/{self._collection}/points?wait={wait_flag}",
+            {"points": points},
         )
 
+    def _delete_points(self, ids: list[str]) -> None:
+        self._request(
+            "POST",
+            f"/collections/{self._collection}/points/delete?wait=true",
+            {"points": ids},
+        )
+
+    def _submit(self, job: Callable[..., None], *args: object) -> None:
+        with self._jobs_lock:
+            if self._jobs is None:
+                # A single worker keeps index/delete jobs in submission order.
+                self._jobs = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="skillos-vector-index"
+                )
+            self._pending_jobs += 1
+            self._jobs.submit(self._run_job, job, *args)
+
+    def _run_job(self, job: Callable[..., None], *args: object) -> None:
+        try:
+            job(*args)
+        except VectorSearchError as exc:
+            with self._jobs_lock:
+                self._index_error = exc
+        finally:
+            with self._jobs_lock:
+                self._pending_jobs -= 1
+
     def _request(
         self,
         method: str,
@@ -200,13 +597,17 @@ class QdrantVectorSearch:
     ) -> dict[str, object]:
         url = f"{self._base_url}{path}"
         response = self._send(method, url, payload)
-        if not response.is_success:
-            raise VectorSearchError(
-                f"vector_search_error: {response.status_code}"
-            )
-        if not response.content:
-            return {}
-        return response.json()
+        return _response_json(response)
+
+    async def _request_async(
+        self,
+        method: str,
+        path: str,
+        payload: dict[str, object] | None,
+    ) -> dict[str, object]:
+        url = f"{self._base_url}{path}"
+        response = await self._send_async(method, url, payload)
+        return _response_json(response)
 
     def _send(
         self,
@@ -214,16 +615,388 @@ class QdrantVectorSearch:
         url: str,
         payload: dict[str, object] | None,
     ) -> httpx.Response:
-        headers: dict[str, str] = {}
-        if self._config.api_key:
-            headers["api-key"] = self._config.api_key
+        trace = _RequestTrace()
+        try:
+            response = self._sync_client().request(
+                method,
+                url,
+                json=payload,
+                extensions={"trace": trace},
+            )
+        except httpx.HTTPError as exc:
+            raise VectorSearchError("vector_search_unavailable") from exc
+        self._stats.record(trace)
+        return response
+
+    async def _send_async(
+        self,
+        method: str,
+        url: str,
+        payload: dict[str, object] | None,
+    ) -> httpx.Response:
+        trace = _RequestTrace()
         try:
-            return httpx.request(
+            response = await self._loop_client().request(
                 method,
                 url,
-                headers=headers or None,
                 json=payload,
-                timeout=self._config.timeout_seconds,
+                extensions={"trace": trace.async_hook},
             )
         except httpx.HTTPError as exc:
             raise VectorSearchError("vector_search_unavailable") from exc
+        self._stats.record(trace)
+        return response
+
+    def _sync_client(self) -> httpx.Client:
+        client = self._client
+        if client is not None:
+            return client
+        with self._client_lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    transport=self._transport,
+                    **self._client_options(),
+                )
+            return self._client
+
+    def _loop_client(self) -> httpx.AsyncClient:
+        # Async connections belong to the loop that opened them, so a new
+        # loop (e.g. a fresh asyncio.run) gets its own pool.
+        loop = asyncio.get_running_loop()
+        client = self._async_client
+        if client is not None and self._async_loop is loop:
+            return client
+        with self._client_lock:
+            previous, previous_loop = self._async_client, self._async_loop
+            if previous is not None and previous_loop is loop:
+                return previous
+            self._async_client = httpx.AsyncClient(
+                transport=self._async_transport,
+                **self._client_options(),
+            )
+            self._async_loop = loop
+            client = self._async_client
+        if previous is not None:
+            _retire_async_client(previous, previous_loop, wait=False)
+        return client
+
+    def _client_options(self) -> dict[str, object]:
+        headers: dict[str, str] = {}
+        if self._config.api_key:
+            headers["api-key"] = self._config.api_key
+        return {
+            "headers": headers,
+            "timeout": self._config.timeout_seconds,
+            "limits": httpx.Limits(
+                max_connections=self._config.max_connections,
+                max_keepalive_connections=self._config.max_keepalive_connections,
+                keepalive_expiry=self._config.keepalive_expiry_seconds,
+            ),
+            "http2": self._config.http2 and _HTTP2_AVAILABLE,
+        }
+
+
+class LocalVectorSearch:
+    """In-process vector index backed by a float32 matrix.
+
+    Rows are unit-length embeddings, so cosine similarity for every document
+    is one matrix-vector product. The matrix is persisted as ``.npy`` (loaded
+    memory-mapped) next to a JSON sidecar holding document ids and content
+    hashes, which lets a restart skip re-embedding unchanged documents.
+    """
+
+    def __init__(self, config: LocalVectorSearchConfig) -> None:
+        self._config = config
+        self._path = Path(config.path)
+        self._meta_path = self._path.with_suffix(".json")
+        # (matrix, ids, hashes) is published as one immutable tuple so that
+        # readers never see a matrix from one version and ids from another.
+        self._state: tuple[np.ndarray, tuple[str, ...], tuple[str, ...]] = (
+            _frozen(np.zeros((0, config.embedding_dim), dtype=np.float32)),
+            (),
+            (),
+        )
+        self._load()
+
+    @property
+    def ready(self) -> bool:
+        # Indexing is synchronous, so the matrix is always query-ready.
+        return True
+
+    @property
+    def doc_ids(self) -> list[str]:
+        return list(self._state[1])
+
+    def index(self, documents: Iterable[VectorDocument]) -> None:
+        current_matrix, current_ids, current_hashes = self._state
+        positions = {doc_id: row for row, doc_id in enumerate(current_ids)}
+        pending: dict[str, tuple[VectorDocument, str]] = {}
+        for doc in documents:
+            text_hash = _hash_text(doc.text)
+            row = positions.get(doc.doc_id)
+            if row is not None and current_hashes[row] == text_hash:
+                pending.pop(doc.doc_id, None)
+                continue
+            pending[doc.doc_id] = (doc, text_hash)
+        if not pending:
+            return
+        vectors = embed_many(
+            (doc.text for doc, _ in pending.values()), self._config.embedding_dim
+        ).astype(np.float32)
+        matrix = np.array(current_matrix, dtype=np.float32)
+        ids = list(current_ids)
+        hashes = list(current_hashes)
+        new_rows: list[np.ndarray] = []
+        emptied: set[int] = set()
+        for (doc, text_hash), vector in zip(pending.values(), vectors):
+            row = positions.get(doc.doc_id)
+            if not vector.any():
+                # Text with no tokens cannot match anything; an existing row
+                # must not keep answering with its old embedding.
+                if row is not None:
+                    emptied.add(row)
+                continue
+            if row is None:
+                ids.append(doc.doc_id)
+                hashes.append(text_hash)
+                new_rows.append(vector)
+            else:
+                matrix[row] = vector
+                hashes[row] = text_hash
+        if new_rows:
+            matrix = np.concatenate([matrix, np.stack(new_rows)])
+        if emptied:
+            keep = [row for row in range(len(ids)) if row not in emptied]
+            matrix = matrix[keep]
+            ids = [ids[row] for row in keep]
+            hashes = [hashes[row] for row in keep]
+        self._replace(matrix, ids, hashes)
+
+    def delete(self, doc_ids: Iterable[str]) -> None:
+        matrix, ids, hashes = self._state
+        removed = set(doc_ids)
+        keep = [row for row, doc_id in enumerate(ids) if doc_id not in removed]
+        if len(keep) == len(ids):
+            return
+        self._replace(
+            np.array(matrix[keep], dtype=np.float32),
+            [ids[row] for row in keep],
+            [hashes[row] for row in keep],
+        )
+
+    def sync(self, documents: Iterable[VectorDocument]) -> None:
+        docs = list(documents)
+        current = {doc.doc_id for doc in docs}
+        self.delete(doc_id for doc_id in self._state[1] if doc_id not in current)
+        self.index(docs)
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        min_score: float | None = None,
+    ) -> list[VectorMatch]:
+        return self.search_many([query], limit=limit, min_score=min_score)[0]
+
+    def search_many(
+        self,
+        queries: Iterable[str],
+        *,
+        limit: int,
+        min_score: float | None = None,
+    ) -> list[list[VectorMatch]]:
+        queries = list(queries)
+        matrix, ids, _ = self._state
+        if not queries or not ids or limit <= 0:
+            return [[] for _ in queries]
+        query_matrix = embed_many(queries, self._config.embedding_dim).astype(
+            np.float32
+        )
+        scores = matrix @ query_matrix.T
+        top_k = min(limit, len(ids))
+        if top_k < len(ids):
+            top = np.argpartition(-scores, top_k - 1, axis=0)[:top_k]
+        else:
+            top = np.broadcast_to(
+                np.arange(len(ids))[:, None], (len(ids), len(queries))
+            )
+        non_zero = query_matrix.any(axis=1)
+        results: list[list[VectorMatch]] = []
+        for column in range(len(queries)):
+            if not non_zero[column]:
+                results.append([])
+                continue
+            rows = top[:, column]
+            column_scores = scores[rows, column]
+            matches: list[VectorMatch] = []
+            for order in np.argsort(-column_scores, kind="stable"):
+                score = float(column_scores[order])
+                if min_score is not None and score < min_score:
+                    continue
+                matches.append(VectorMatch(doc_id=ids[rows[order]], score=score))
+            results.append(matches)
+        return results
+
+    async def search_async(
+        self,
+        query: str,
+        *,
+        limit: int,
+        min_score: float | None = None,
+    ) -> list[VectorMatch]:
+        return self.search(query, limit=limit, min_score=min_score)
+
+    async def search_many_async(
+        self,
+        queries: Iterable[str],
+        *,
+        limit: int,
+        min_score: float | None = None,
+    ) -> list[list[VectorMatch]]:
+        # Scoring is an in-memory matrix product; there is no I/O to await.
+        return self.search_many(queries, limit=limit, min_score=min_score)
+
+    def _replace(self, matrix: np.ndarray, ids: list[str], hashes: list[str]) -> None:
+        self._persist(matrix, ids, hashes)
+        self._state = (_frozen(matrix), tuple(ids), tuple(hashes))
+
+    def _load(self) -> None:
+        if not self._path.exists() or not self._meta_path.exists():
+            return
+        try:
+            meta = json.loads(self._meta_path.read_text(encoding="utf-8"))
+            matrix = np.load(self._path, mmap_mode="r")
+        except (OSError, ValueError):
+            return
+        ids = [str(item) for item in meta.get("ids", [])]
+        hashes = [str(item) for item in meta.get("hashes", [])]
+        if (
+            matrix.ndim != 2
+            or matrix.dtype != np.float32
+            or matrix.shape != (len(ids), self._config.embedding_dim)
+            or len(hashes) != len(ids)
+        ):
+            return
+        self._state = (_frozen(matrix), tuple(ids), tuple(hashes))
+
+    def _persist(self, matrix: np.ndarray, ids: list[str], hashes: list[str]) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self._path.with_name(f".{self._path.name}.tmp")
+        with file_lock(self._path):
+            with temp_path.open("wb") as handle:
+                np.save(handle, np.ascontiguousarray(matrix, dtype=np.float32))
+            os.replace(temp_path, self._path)
+            atomic_write_text(
+                self._meta_path,
+                json.dumps(
+                    {
+                        "embedding_dim": self._config.embedding_dim,
+                        "ids": ids,
+                        "hashes": hashes,
+                    },
+                    ensure_ascii=True,
+                ),
+            )
+
+
+def _frozen(matrix: np.ndarray) -> np.ndarray:
+    matrix.flags.writeable = False
+    return matrix
+
+
+def _retire_async_client(
+    client: httpx.AsyncClient,
+    loop: asyncio.AbstractEventLoop | None,
+    *,
+    wait: bool,
+) -> None:
+    """Close ``client`` on the loop that owns its connections when possible."""
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if loop is not None and loop is not running and loop.is_running():
+        future = asyncio.run_coroutine_threadsafe(_aclose_quietly(client), loop)
+        if wait:
+            try:
+                future.result(timeout=5)
+            except Exception:
+                pass
+        return
+    if running is not None:
+        task = running.create_task(_aclose_quietly(client))
+        _CLOSING_CLIENTS.add(task)
+        task.add_done_callback(_CLOSING_CLIENTS.discard)
+        return
+    # The owning loop is gone (e.g. a finished asyncio.run); its sockets can
+    # still be released from a throwaway loop.
+    asyncio.run(_aclose_quietly(client))
+
+
+async def _aclose_quietly(client: httpx.AsyncClient) -> None:
+    try:
+        await client.aclose()
+    except (httpx.HTTPError, OSError, RuntimeError):
+        pass
+
+
+_CLOSING_CLIENTS: set[asyncio.Task[None]] = set()
+
+
+def _chunked(
+    documents: Iterable[VectorDocument], size: int
+) -> Iterator[list[VectorDocument]]:
+    iterator = iter(documents)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _drain(futures: Iterable[Future[None]]) -> None:
+    for future in futures:
+        future.result()
+
+
+def _hash_text(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def _response_json(response: httpx.Response) -> dict[str, object]:
+    if not response.is_success:
+        raise VectorSearchError(
+            f"vector_search_error: {response.status_code}"
+        )
+    if not response.content:
+        return {}
+    return response.json()
+
+
+def _batch_matches(
+    total: int,
+    positions: list[int],
+    data: dict[str, object],
+    min_score: float | None,
+) -> list[list[VectorMatch]]:
+    results: list[list[VectorMatch]] = [[] for _ in range(total)]
+    for position, items in zip(positions, data.get("result", [])):
+        results[position] = _parse_matches(items or [], min_score)
+    return results
+
+
+def _parse_matches(
+    items: Iterable[dict[str, object]], min_score: float | None
+) -> list[VectorMatch]:
+    matches: list[VectorMatch] = []
+    for item in items:
+        try:
+            score = float(item.get("score", 0.0))
+        except (TypeError, ValueError):
+            score = 0.0
+        if min_score is not None and score < min_score:
+            continue
+        payload = item.get("payload") or {}
+        doc_id = payload.get("skill_id", item.get("id"))
+        if doc_id is None:
+            continue
+        matches.append(VectorMatch(doc_id=str(doc_id), score=score))
+    return matches
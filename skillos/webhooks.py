@@ -12,7 +12,7 @@ from skillos.attachments import AttachmentError, AttachmentReference, ingest_att
 from skillos.connectors import SecretResolutionError, SecretResolver, SecretsStore, default_secrets_path
 from skillos.idempotency import (
     IdempotencyDecision,
-    idempotency_store_from_env,
+    get_cached_idempotency_store,
     idempotency_ttl_from_env,
 )
 from skillos.jobs import job_store_from_env
@@ -390,7 +390,7 @@ def _check_idempotency(
     *,
     ttl_seconds: int | None = None,
 ) -> IdempotencyDecision:
-    store = idempotency_store_from_env(root_path)
+    store = get_cached_idempotency_store(root_path)
     ttl = ttl_seconds if ttl_seconds is not None else idempotency_ttl_from_env()
     return store.check_and_record(
         "webhook",
@@ -0,0 +1,30 @@
+import json
+
+from click.testing import CliRunner
+
+from skillos.budget import default_budget_path
+from skillos.cli import cli
+
+
+def test_cli_budget_prune_keeps_recent_periods(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("SKILLOS_STORAGE_BACKEND", raising=False)
+    path = default_budget_path(tmp_path)
+    path.parent.mkdir(parents=True)
+    path.write_text(
+        json.dumps(
+            {
+                "daily": {"2000-01-01": 1.0, "2999-01-01": 2.0},
+                "monthly": {"2000-01": 1.0, "2999-01": 2.0},
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    result = CliRunner().invoke(
+        cli, ["budget", "prune", "--root", str(tmp_path), "--keep-days", "30"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "pruned_periods: 2" in result.output
+    stored = json.loads(path.read_text(encoding="utf-8"))
+    assert stored == {"daily": {"2999-01-01": 2.0}, "monthly": {"2999-01": 2.0}}
@@ -0,0 +1,31 @@
+import json
+
+from click.testing import CliRunner
+
+from skillos.cli import cli
+from skillos.routing_cache import normalized_query_hash
+from skillos.telemetry import default_log_path, hash_query
+
+
+def test_cli_cache_replay_compares_key_schemes(tmp_path) -> None:
+    log_path = default_log_path(tmp_path)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    lines = [
+        json.dumps(
+            {
+                "event": "request_received",
+                "request_id": str(index),
+                "query_hash": hash_query(query),
+                "normalized_query_hash": normalized_query_hash(query),
+            }
+        )
+        for index, query in enumerate(["Find flights", "find  flights", "Find flights"])
+    ]
+    log_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    result = CliRunner().invoke(cli, ["cache-replay", "--root", str(tmp_path)])
+
+    assert result.exit_code == 0, result.output
+    assert "requests: 3" in result.output
+    assert "raw_hit_rate: 0.333 (1)" in result.output
+    assert "normalized_hit_rate: 0.667 (2)" in result.output
@@ -0,0 +1,42 @@
+import json
+
+from click.testing import CliRunner
+
+from skillos.cli import cli
+from skillos.feedback import FeedbackStore, default_feedback_path
+
+
+def test_cli_feedback_import_applies_backlog(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("SKILLOS_STORAGE_BACKEND", raising=False)
+    events = tmp_path / "feedback.jsonl"
+    lines = [
+        {"skill_id": "travel/search_flights", "outcome": "negative"},
+        {"skill_id": "travel/search_flights", "expected_skill_id": "travel/build_itinerary"},
+        {"skill_id": "travel/build_itinerary", "outcome": "positive"},
+    ]
+    events.write_text(
+        "\n".join(json.dumps(line) for line in lines) + "\n", encoding="utf-8"
+    )
+
+    result = CliRunner().invoke(
+        cli,
+        ["feedback-import", str(events), "--root", str(tmp_path), "--batch-size", "2"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "feedback_imported: 3 events, 2 skills" in result.output
+    records = FeedbackStore(default_feedback_path(tmp_path)).load()
+    assert records["travel.search_flights"].negative == 2
+    assert records["travel.build_itinerary"].positive == 2
+
+
+def test_cli_feedback_import_rejects_unknown_outcome(tmp_path) -> None:
+    events = tmp_path / "feedback.jsonl"
+    events.write_text(json.dumps({"skill_id": "a/b", "outcome": "meh"}), encoding="utf-8")
+
+    result = CliRunner().invoke(
+        cli, ["feedback-import", str(events), "--root", str(tmp_path)]
+    )
+
+    assert result.exit_code != 0
+    assert "Line 1: outcome must be positive or negative" in result.output
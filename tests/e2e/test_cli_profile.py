@@ -0,0 +1,43 @@
+import httpx
+from click.testing import CliRunner
+
+from skillos.cli import cli
+from skillos.testing import mock_external_apis
+
+
+def test_cli_profile_fetches_collapsed_stacks(tmp_path) -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(
+            200,
+            text="skill:travel/search_flights;mod:run 3\n",
+            headers={"X-Profile-Samples": "3"},
+        )
+
+    output = tmp_path / "profile.folded"
+    with mock_external_apis(handler=handler):
+        result = CliRunner().invoke(
+            cli,
+            [
+                "profile",
+                "--seconds",
+                "5",
+                "--token",
+                "profile-secret",
+                "--url",
+                "http://api.local:8000/",
+                "--output",
+                str(output),
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert "profile_written:" in result.output
+    assert "(3 samples)" in result.output
+    assert output.read_text(encoding="utf-8") == "skill:travel/search_flights;mod:run 3\n"
+    request = seen[0]
+    assert request.url.path == "/admin/profile"
+    assert request.url.params["seconds"] == "5.0"
+    assert request.headers["X-SkillOS-Profile-Token"] == "profile-secret"
@@ -0,0 +1,61 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+from click.testing import CliRunner
+
+from skillos.cli import cli
+from skillos.telemetry import default_log_path
+
+
+def test_cli_telemetry_query_reports_p95_per_skill(tmp_path) -> None:
+    log_path = default_log_path(tmp_path)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    yesterday = datetime.now(timezone.utc) - timedelta(days=1)
+    lines = [
+        json.dumps(
+            {
+                "timestamp": yesterday.isoformat(),
+                "event": "execution_result",
+                "skill_id": skill_id,
+                "status": "success",
+                "duration_ms": duration,
+            }
+        )
+        for skill_id, duration in [("a.one", 10), ("a.one", 30), ("b.two", 5)]
+    ]
+    log_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    runner = CliRunner()
+
+    compact = runner.invoke(cli, ["telemetry", "compact", "--root", str(tmp_path), "--rotate"])
+    result = runner.invoke(
+        cli,
+        [
+            "telemetry",
+            "query",
+            "--root",
+            str(tmp_path),
+            "--event",
+            "execution_result",
+            "--metric",
+            "duration_ms",
+            "--group-by",
+            "skill_id",
+            "--agg",
+            "count",
+            "--agg",
+            "p95",
+            "--since",
+            "yesterday",
+            "--until",
+            "yesterday",
+        ],
+    )
+
+    assert compact.exit_code == 0, compact.output
+    assert "parts_written: 1" in compact.output
+    assert result.exit_code == 0, result.output
+    rows = [json.loads(line) for line in result.output.splitlines()]
+    assert rows == [
+        {"count": 2, "p95": 29.0, "skill_id": "a.one"},
+        {"count": 1, "p95": 5.0, "skill_id": "b.two"},
+    ]
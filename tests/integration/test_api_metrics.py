@@ -0,0 +1,80 @@
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+import httpx
+import yaml
+
+from skillos.api import app
+from skillos.connectors import ConnectorRegistry
+from skillos.testing import mock_external_apis
+
+
+def _sample(body: str, prefix: str) -> float:
+    for line in body.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+_AUTH = {"X-SkillOS-Metrics-Token": "metrics-secret"}
+
+
+def test_metrics_endpoint_is_hidden_unless_enabled(monkeypatch) -> None:
+    monkeypatch.delenv("SKILLOS_METRICS_ENABLED", raising=False)
+    client = TestClient(app)
+
+    assert client.get("/metrics").status_code == 404
+
+
+def test_metrics_endpoint_requires_token(monkeypatch) -> None:
+    monkeypatch.setenv("SKILLOS_METRICS_ENABLED", "1")
+    monkeypatch.setenv("SKILLOS_METRICS_TOKEN", "metrics-secret")
+    client = TestClient(app)
+
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"X-SkillOS-Metrics-Token": "wrong"}).status_code == 401
+    bearer = client.get("/metrics", headers={"Authorization": "Bearer metrics-secret"})
+    assert bearer.status_code == 200
+
+
+def test_metrics_endpoint_exposes_routing_and_connector_series(
+    skill_root, tmp_path: Path, monkeypatch
+) -> None:
+    monkeypatch.setenv("SKILLOS_ROOT", str(skill_root))
+    monkeypatch.setenv("SKILLOS_METRICS_ENABLED", "1")
+    monkeypatch.setenv("SKILLOS_METRICS_TOKEN", "metrics-secret")
+    client = TestClient(app)
+    routed_before = _sample(
+        client.get("/metrics", headers=_AUTH).text,
+        'skillos_routing_decisions_total{status="selected"}',
+    )
+
+    client.post("/run", json={"query": "Find flights to Sochi", "execute": False})
+    connectors = tmp_path / "connectors"
+    connectors.mkdir()
+    (connectors / "weather.yaml").write_text(
+        yaml.safe_dump({"id": "weather", "type": "http", "base_url": "https://api.example.com"}),
+        encoding="utf-8",
+    )
+    registry = ConnectorRegistry(tmp_path)
+    registry.load_all()
+    with mock_external_apis(handler=lambda request: httpx.Response(503)):
+        registry.get("weather").request("GET", "/ping")
+    response = client.get("/metrics", headers=_AUTH)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert (
+        _sample(body, 'skillos_routing_decisions_total{status="selected"}')
+        == routed_before + 1
+    )
+    assert "# TYPE skillos_routing_duration_seconds histogram" in body
+    assert (
+        _sample(
+            body,
+            'skillos_connector_duration_seconds_count{connector_id="weather",'
+            'connector_type="http",status="error"}',
+        )
+        >= 1
+    )
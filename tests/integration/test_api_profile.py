@@ -0,0 +1,34 @@
+from fastapi.testclient import TestClient
+
+from skillos.api import app
+
+
+def test_profile_endpoint_is_hidden_unless_enabled(monkeypatch) -> None:
+    monkeypatch.delenv("SKILLOS_PROFILE_ENABLED", raising=False)
+    client = TestClient(app)
+
+    assert client.post("/admin/profile", params={"seconds": 0.1}).status_code == 404
+
+
+def test_profile_endpoint_requires_token_and_returns_collapsed_stacks(monkeypatch) -> None:
+    monkeypatch.setenv("SKILLOS_PROFILE_ENABLED", "1")
+    monkeypatch.setenv("SKILLOS_PROFILE_TOKEN", "profile-secret")
+    client = TestClient(app)
+
+    denied = client.post(
+        "/admin/profile",
+        params={"seconds": 0.1},
+        headers={"X-SkillOS-Profile-Token": "wrong"},
+    )
+    response = client.post(
+        "/admin/profile",
+        params={"seconds": 0.2, "interval_ms": 5, "include_idle": "true"},
+        headers={"X-SkillOS-Profile-Token": "profile-secret"},
+    )
+
+    assert denied.status_code == 401
+    assert response.status_code == 200
+    assert int(response.headers["X-Profile-Samples"]) > 0
+    lines = response.text.splitlines()
+    assert lines
+    assert all(line.startswith(("thread:", "skill:")) for line in lines)
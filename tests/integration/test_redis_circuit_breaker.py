@@ -0,0 +1,32 @@
+import os
+from uuid import uuid4
+
+import pytest
+import redis
+
+from skillos.circuit_breaker import CircuitBreakerConfig, RedisCircuitBreaker
+
+
+def _client():
+    url = os.getenv("SKILLOS_REDIS_URL", "redis://localhost:6379/0")
+    client = redis.Redis.from_url(url, socket_connect_timeout=1, socket_timeout=1)
+    try:
+        client.ping()
+    except Exception:
+        pytest.skip("Redis unavailable; run docker-compose up")
+    return client
+
+
+def test_redis_breaker_shares_state_between_workers() -> None:
+    client = _client()
+    namespace = f"test:circuit:{uuid4().hex}"
+    config = CircuitBreakerConfig(failure_threshold=2, open_seconds=60)
+    worker_a = RedisCircuitBreaker(client, config, namespace=namespace)
+    worker_b = RedisCircuitBreaker(client, config, namespace=namespace)
+
+    worker_a.record_failure("travel/search")
+    worker_b.record_failure("travel/search")
+
+    assert worker_a.allow("travel/search").reason == "circuit_open"
+    assert worker_b.allow("travel/search").reason == "circuit_open"
+    client.delete(f"{namespace}:travel/search")
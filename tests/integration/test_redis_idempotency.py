@@ -0,0 +1,32 @@
+import os
+from uuid import uuid4
+
+import pytest
+import redis
+
+from skillos.idempotency import IdempotencyStoreRedis
+
+
+def _client():
+    url = os.getenv("SKILLOS_REDIS_URL", "redis://localhost:6379/0")
+    client = redis.Redis.from_url(url, socket_connect_timeout=1, socket_timeout=1)
+    try:
+        client.ping()
+    except Exception:
+        pytest.skip("Redis unavailable; run docker-compose up")
+    return client
+
+
+def test_redis_idempotency_is_shared_between_workers() -> None:
+    client = _client()
+    namespace = f"test:idempotency:{uuid4().hex}"
+    worker_a = IdempotencyStoreRedis(client, namespace=namespace)
+    worker_b = IdempotencyStoreRedis(client, namespace=namespace)
+
+    first = worker_a.check_and_record("webhook", "ops/sample", "evt-1", ttl_seconds=5)
+    duplicate = worker_b.check_and_record("webhook", "ops/sample", "evt-1", ttl_seconds=5)
+
+    assert first.allowed is True
+    assert duplicate.allowed is False
+    assert 0 < client.pttl(f"{namespace}:webhook:ops/sample:evt-1") <= 5000
+    client.delete(f"{namespace}:webhook:ops/sample:evt-1")
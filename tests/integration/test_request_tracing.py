@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from skillos.orchestrator import Orchestrator
+from skillos.tracing import TracingConfig, configure_tracing
+
+
+def _write_travel_impl(root: Path) -> None:
+    impl_dir = root / "implementations" / "travel"
+    impl_dir.mkdir(parents=True, exist_ok=True)
+    (root / "implementations" / "__init__.py").write_text("", encoding="utf-8")
+    (impl_dir / "__init__.py").write_text("", encoding="utf-8")
+    (impl_dir / "search_flights.py").write_text(
+        "def run(payload: str = 'ok') -> str:\n    return 'ok'\n",
+        encoding="utf-8",
+    )
+
+
+def test_request_spans_cover_every_stage(skill_root) -> None:
+    _write_travel_impl(skill_root)
+    orchestrator = Orchestrator(skill_root)
+    tracer = configure_tracing(TracingConfig(sample_rate=1.0))
+    try:
+        response = orchestrator.run_query("Find flights to Sochi", execute=True)
+    finally:
+        configure_tracing()
+
+    assert response["status"] == "success"
+    spans = {span.name: span for span in tracer.spans()}
+    request = spans["request"]
+    for stage in (
+        "routing",
+        "permission",
+        "approval",
+        "circuit_breaker",
+        "budget",
+        "execution",
+    ):
+        assert spans[stage].parent_id == request.span_id, stage
+        assert spans[stage].trace_id == request.trace_id
+    assert spans["kernel"].parent_id == spans["execution"].span_id
+    assert spans["kernel"].attributes == {"skill_id": "travel/search_flights"}
@@ -14,9 +14,9 @@ def test_golden_queries_accuracy(skill_root):
         Path("tests/fixtures/golden_queries.json").read_text(encoding="utf-8")
     )
 
+    results = router.route_many([item["query"] for item in golden_queries])
     correct = 0
-    for item in golden_queries:
-        result = router.route(item["query"])
+    for item, result in zip(golden_queries, results):
         if result.skill_id == item["expected_skill_id"]:
             correct += 1
     accuracy = correct / len(golden_queries)
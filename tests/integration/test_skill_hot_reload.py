@@ -1,3 +1,5 @@
+import os
+import time
 from pathlib import Path
 
 from skillos.skills.registry import SkillRegistry
@@ -29,3 +31,44 @@ def test_hot_reload_updates_registry(tmp_path):
 
     registry.reload()
     assert registry.get("travel/search_flights").version == "1.1.0"
+
+
+def test_reload_if_changed_reports_diff(tmp_path):
+    root = tmp_path / "skills"
+    metadata_dir = root / "metadata" / "travel"
+    metadata_dir.mkdir(parents=True)
+    fixture_root = Path("tests/fixtures/skills")
+    skill_file = metadata_dir / "search_flights.yaml"
+    skill_file.write_text(
+        (fixture_root / "valid_skill_v1.yaml").read_text(encoding="utf-8"),
+        encoding="utf-8",
+    )
+
+    registry = SkillRegistry(root)
+    registry.load_all()
+    assert registry.reload_if_changed() is None
+
+    skill_file.write_text(
+        (fixture_root / "valid_skill_v2.yaml").read_text(encoding="utf-8"),
+        encoding="utf-8",
+    )
+    hotel_file = metadata_dir / "search_hotels.yaml"
+    hotel_file.write_text(
+        (fixture_root / "valid_skill_v1.yaml")
+        .read_text(encoding="utf-8")
+        .replace("search_flights", "search_hotels"),
+        encoding="utf-8",
+    )
+    os.utime(hotel_file, (time.time() + 5, time.time() + 5))
+
+    diff = registry.reload_if_changed()
+    assert diff is not None
+    assert diff.added == ("travel/search_hotels",)
+    assert diff.changed == ("travel/search_flights",)
+    assert diff.removed == ()
+
+    skill_file.unlink()
+    diff = registry.reload_if_changed()
+    assert diff is not None
+    assert diff.removed == ("travel/search_flights",)
+    assert set(diff.records) == {"travel/search_hotels"}
@@ -0,0 +1,46 @@
+import gc
+import hashlib
+import random
+import re
+import time
+
+from skillos.vector_search import embed_many
+
+_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+
+
+def _scalar_embed(text: str, dim: int) -> list[float]:
+    vector = [0.0 for _ in range(dim)]
+    for token in _TOKEN_RE.findall(text.lower()):
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+        index = int.from_bytes(digest[:4], "big") % dim
+        vector[index] += -1.0 if (digest[4] & 1) else 1.0
+    norm = sum(value * value for value in vector) ** 0.5
+    if norm == 0.0:
+        return vector
+    return [value / norm for value in vector]
+
+
+def test_embed_many_outpaces_scalar_embedding():
+    rng = random.Random(3)
+    vocabulary = [f"term{index}" for index in range(2000)]
+    texts = [" ".join(rng.sample(vocabulary, 24)) for _ in range(2000)]
+    embed_many(texts[:10], 128)
+
+    # A full collection of the suite's heap takes as long as the batch
+    # itself; keep it out of both timings.
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        for text in texts:
+            _scalar_embed(text, 128)
+        scalar_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        embed_many(texts, 128)
+        batch_seconds = time.perf_counter() - start
+    finally:
+        gc.enable()
+
+    assert batch_seconds < scalar_seconds
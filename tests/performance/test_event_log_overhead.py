@@ -0,0 +1,44 @@
+import time
+
+from skillos.telemetry import event_schema, redact_pii
+
+
+def _candidates(count: int) -> list[dict[str, object]]:
+    return [
+        {
+            "skill_id": f"domain_{index % 40}.skill_{index}",
+            "score": 0.5 + index / 10_000,
+            "keyword_score": index % 7,
+            "semantic_score": 0.25,
+        }
+        for index in range(count)
+    ]
+
+
+def test_compiled_schema_skips_large_candidate_payloads():
+    fields = {
+        "request_id": "req-bench",
+        "candidates": _candidates(500),
+        "routing_latency_ms": 1.25,
+        "cache_hit": False,
+    }
+    schema = event_schema("routing_candidates")
+    rounds = 200
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        redact_pii(fields)
+    walk_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        schema.validate(fields)
+        schema.redact(fields)
+    compiled_seconds = time.perf_counter() - start
+
+    per_event_us = compiled_seconds / rounds * 1_000_000
+    print(
+        f"routing_candidates x500: full walk {walk_seconds / rounds * 1e6:.1f}us, "
+        f"compiled {per_event_us:.1f}us per event"
+    )
+    assert compiled_seconds * 10 < walk_seconds
@@ -0,0 +1,40 @@
+from pathlib import Path
+import time
+
+from skillos.feedback import (
+    FeedbackOutcome,
+    FeedbackStore,
+    FeedbackStoreSqlite,
+    FeedbackTracker,
+)
+
+_EVENTS = 100_000
+_SKILLS = 200
+
+
+def _backlog() -> list[tuple[str, FeedbackOutcome]]:
+    return [
+        (
+            f"team/skill_{index % _SKILLS}",
+            FeedbackOutcome.POSITIVE if index % 3 else FeedbackOutcome.NEGATIVE,
+        )
+        for index in range(_EVENTS)
+    ]
+
+
+def test_feedback_backlog_ingests_in_seconds(tmp_path: Path) -> None:
+    backlog = _backlog()
+    for store in (
+        FeedbackStore(tmp_path / "confidence.json"),
+        FeedbackStoreSqlite(tmp_path / "state.db"),
+    ):
+        tracker = FeedbackTracker(store)
+        start = time.perf_counter()
+        for offset in range(0, _EVENTS, 10_000):
+            tracker.record_outcomes(backlog[offset : offset + 10_000])
+        elapsed = time.perf_counter() - start
+
+        records = store.load()
+        assert len(records) == _SKILLS
+        assert sum(r.positive + r.negative for r in records.values()) == _EVENTS
+        assert elapsed < 5.0
@@ -0,0 +1,22 @@
+from pathlib import Path
+import time
+
+from skillos.idempotency import IdempotencyStore, IdempotencyStoreSqlite
+
+_KEYS = 200
+
+
+def _time_burst(store) -> float:
+    start = time.perf_counter()
+    for index in range(_KEYS):
+        store.check_and_record("webhook", "ops/sample", f"evt-{index}", ttl_seconds=300)
+    for index in range(_KEYS):
+        store.check_and_record("webhook", "ops/sample", f"evt-{index}", ttl_seconds=300)
+    return time.perf_counter() - start
+
+
+def test_keyed_store_does_not_rewrite_every_key(tmp_path: Path) -> None:
+    json_seconds = _time_burst(IdempotencyStore(tmp_path / "idempotency.json"))
+    sqlite_seconds = _time_burst(IdempotencyStoreSqlite(tmp_path / "state.db"))
+
+    assert sqlite_seconds * 3 < json_seconds
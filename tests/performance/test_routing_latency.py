@@ -1,8 +1,11 @@
+import gc
 import json
 from pathlib import Path
+import random
 import time
 
-from skillos.routing import SkillRouter
+from skillos.routing import RoutingConfig, SkillRouter
+from skillos.skills.models import SkillMetadata
 from skillos.skills.registry import SkillRegistry
 
 
@@ -32,3 +35,54 @@ def test_routing_latency_p95(skill_root):
 
     p95 = _percentile(timings_ms, 95)
     assert p95 <= 100
+
+
+# Fixed across catalog sizes, so posting lists grow with the catalog.
+_VOCABULARY = [f"term{index}" for index in range(50_000)]
+
+
+def _synthetic_router(size: int, rng: random.Random) -> SkillRouter:
+    skills = [
+        SkillMetadata(
+            id=f"domain{index % 50}/skill_{index}",
+            name=f"Skill {index}",
+            description=" ".join(rng.sample(_VOCABULARY, 4)),
+            version="1.0.0",
+            entrypoint=f"implementations.domain{index % 50}.skill_{index}:run",
+            tags=[f"tag{index % 20}"],
+            deprecated=index % 10 == 0,
+            deprecation_reason="superseded" if index % 10 == 0 else None,
+        )
+        for index in range(size)
+    ]
+    return SkillRouter(skills, routing_config=RoutingConfig(mode="keyword"))
+
+
+def test_routing_latency_flat_across_catalog_sizes():
+    rng = random.Random(7)
+    small = _synthetic_router(5_000, rng)
+    large = _synthetic_router(50_000, rng)
+    queries = [" ".join(rng.sample(_VOCABULARY, 3)) for _ in range(300)]
+    for query in queries[:20]:
+        small.route(query)
+        large.route(query)
+
+    small_ms: list[float] = []
+    large_ms: list[float] = []
+    # Both catalogs answer each query back to back, so machine noise hits
+    # them alike; collections of the suite's heap are kept out of the timings.
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(3):
+            for index, query in enumerate(queries):
+                tags = ["tag3"] if index % 2 else None
+                for router, timings_ms in ((small, small_ms), (large, large_ms)):
+                    start = time.perf_counter()
+                    router.route(query, tags=tags)
+                    timings_ms.append((time.perf_counter() - start) * 1000)
+    finally:
+        gc.enable()
+
+    assert _percentile(large_ms, 50) <= _percentile(small_ms, 50) * 2
+    assert _percentile(large_ms, 95) <= _percentile(small_ms, 95) * 2
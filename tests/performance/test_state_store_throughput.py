@@ -0,0 +1,28 @@
+from pathlib import Path
+import time
+
+from skillos.circuit_breaker import (
+    CircuitBreakerStore,
+    CircuitBreakerStoreSqlite,
+    CircuitState,
+)
+
+_SKILLS = 2000
+_CALLS = 100
+
+
+def _time_put(store) -> float:
+    store.save({f"skill/{index}": CircuitState() for index in range(_SKILLS)})
+    start = time.perf_counter()
+    for index in range(_CALLS):
+        store.put(f"skill/{index}", CircuitState(state="open"))
+    return time.perf_counter() - start
+
+
+def test_sqlite_put_does_not_rewrite_every_skill(tmp_path: Path) -> None:
+    json_seconds = _time_put(CircuitBreakerStore(tmp_path / "circuit_breaker.json"))
+    sqlite_seconds = _time_put(
+        CircuitBreakerStoreSqlite(tmp_path / "state.db")
+    )
+
+    assert sqlite_seconds * 5 < json_seconds
@@ -0,0 +1,55 @@
+from pathlib import Path
+import time
+
+from skillos.orchestrator import Orchestrator
+from skillos.tracing import Tracer, TracingConfig, configure_tracing
+
+
+def _write_travel_impl(root: Path) -> None:
+    impl_dir = root / "implementations" / "travel"
+    impl_dir.mkdir(parents=True, exist_ok=True)
+    (root / "implementations" / "__init__.py").write_text("", encoding="utf-8")
+    (impl_dir / "__init__.py").write_text("", encoding="utf-8")
+    (impl_dir / "search_flights.py").write_text(
+        "def run(payload: str = 'ok') -> str:\n    return 'ok'\n",
+        encoding="utf-8",
+    )
+
+
+def _per_span_seconds(tracer: Tracer, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        with tracer.span("root"):
+            for _ in range(7):
+                with tracer.span("stage"):
+                    pass
+    return (time.perf_counter() - start) / (rounds * 8)
+
+
+def test_tracing_overhead_stays_under_two_percent_of_a_request(skill_root):
+    _write_travel_impl(skill_root)
+    orchestrator = Orchestrator(skill_root)
+    sampled_tracer = configure_tracing(TracingConfig(sample_rate=1.0))
+    try:
+        orchestrator.run_query("Find flights to Sochi", execute=True)
+        spans_per_request = len(sampled_tracer.spans())
+        configure_tracing(TracingConfig(sample_rate=0.0))
+        rounds = 30
+        start = time.perf_counter()
+        for _ in range(rounds):
+            orchestrator.run_query("Find flights to Sochi", execute=True)
+        request_seconds = (time.perf_counter() - start) / rounds
+    finally:
+        configure_tracing()
+
+    unsampled = _per_span_seconds(Tracer(TracingConfig(sample_rate=0.0)), 2000)
+    sampled = _per_span_seconds(Tracer(TracingConfig(sample_rate=1.0)), 2000)
+    default_rate = TracingConfig().sample_rate
+    per_span = (1 - default_rate) * unsampled + default_rate * sampled
+    overhead = spans_per_request * per_span / request_seconds
+    print(
+        f"{spans_per_request} spans: unsampled {unsampled * 1e6:.2f}us, "
+        f"sampled {sampled * 1e6:.2f}us; request {request_seconds * 1e3:.2f}ms; "
+        f"overhead at {default_rate:.0%} sampling {overhead:.3%}"
+    )
+    assert overhead < 0.02
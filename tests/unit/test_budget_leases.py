@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone
+import multiprocessing
+from pathlib import Path
+import sys
+
+import pytest
+
+from skillos.budget import (
+    BudgetConfig,
+    BudgetManager,
+    BudgetUsageStore,
+    release_budget_leases,
+)
+
+
+def _config(**overrides) -> BudgetConfig:
+    values = dict(
+        per_request_limit=5.0,
+        daily_limit=100.0,
+        monthly_limit=1000.0,
+        low_remaining_threshold=0.0,
+        standard_cost=1.0,
+        lease_fraction=0.1,
+        lease_ttl_seconds=3600.0,
+    )
+    values.update(overrides)
+    return BudgetConfig(**values)
+
+
+class _CountingStore(BudgetUsageStore):
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.saves = 0
+
+    def save(self, usage) -> None:
+        self.saves += 1
+        super().save(usage)
+
+
+def _authorize_in_worker(path: str, attempts: int, queue) -> None:
+    now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    manager = BudgetManager(
+        BudgetUsageStore(Path(path)),
+        _config(daily_limit=30.0),
+        now_provider=lambda: now,
+    )
+    allowed = sum(manager.authorize().allowed for _ in range(attempts))
+    release_budget_leases()
+    queue.put(allowed)
+
+
+def test_leased_authorizations_touch_store_only_on_renewal(tmp_path: Path) -> None:
+    store = _CountingStore(tmp_path / "usage.json")
+    now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    manager = BudgetManager(store, _config(), now_provider=lambda: now)
+
+    results = [manager.authorize() for _ in range(40)]
+
+    assert all(result.allowed for result in results)
+    assert store.saves < 10
+    release_budget_leases()
+    assert store.load().daily == {"2026-03-01": 40.0}
+
+
+def test_lease_is_returned_when_the_day_changes(tmp_path: Path) -> None:
+    store = BudgetUsageStore(tmp_path / "usage.json")
+    clock = {"now": datetime(2026, 3, 1, tzinfo=timezone.utc)}
+    manager = BudgetManager(store, _config(), now_provider=lambda: clock["now"])
+
+    manager.authorize()
+    manager.authorize()
+    clock["now"] += timedelta(days=1)
+    manager.authorize()
+
+    usage = store.load()
+    assert usage.daily["2026-03-01"] == 2.0
+    assert usage.daily["2026-03-02"] > 0
+    release_budget_leases()
+    assert store.load().daily["2026-03-02"] == 1.0
+
+
+def test_lease_max_bounds_a_single_lease(tmp_path: Path) -> None:
+    store = BudgetUsageStore(tmp_path / "usage.json")
+    now = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    manager = BudgetManager(
+        store, _config(lease_fraction=0.5, lease_max=3.0), now_provider=lambda: now
+    )
+
+    manager.authorize()
+
+    assert store.load().daily == {"2026-03-01": 3.0}
+    release_budget_leases()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fork start method")
+def test_leases_keep_hard_limit_across_processes(tmp_path: Path) -> None:
+    path = tmp_path / "usage.json"
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    workers = [
+        context.Process(target=_authorize_in_worker, args=(str(path), 25, queue))
+        for _ in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    allowed = sum(queue.get(timeout=30) for _ in workers)
+    for worker in workers:
+        worker.join(10)
+
+    # Leases still held by a worker can deny another one, never overspend.
+    assert 25 <= allowed <= 30
+    spent = BudgetUsageStore(path).load().daily["2026-03-01"]
+    assert spent == pytest.approx(allowed)
@@ -0,0 +1,158 @@
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+import threading
+
+import skillos.budget as budget_module
+from skillos.budget import (
+    BudgetConfig,
+    BudgetManager,
+    BudgetRetentionConfig,
+    BudgetUsage,
+    BudgetUsageStore,
+    BudgetUsageStorePostgres,
+    BudgetUsageStoreSqlite,
+    prune_budget_usage,
+)
+
+
+class _ConditionalStore:
+    """In-memory stand-in for a store that checks and charges atomically."""
+
+    def __init__(self) -> None:
+        self.usage = BudgetUsage(daily={}, monthly={})
+        self._lock = threading.Lock()
+
+    def load(self) -> BudgetUsage:
+        return BudgetUsage(daily=dict(self.usage.daily), monthly=dict(self.usage.monthly))
+
+    def try_charge(self, day_key, month_key, amount, daily_limit, monthly_limit):
+        with self._lock:
+            daily = self.usage.daily.get(day_key, 0.0) + amount
+            monthly = self.usage.monthly.get(month_key, 0.0) + amount
+            if daily > daily_limit:
+                return "daily"
+            if monthly > monthly_limit:
+                return "monthly"
+            self.usage.daily[day_key] = daily
+            self.usage.monthly[month_key] = monthly
+            return None
+
+
+def _config(**overrides) -> BudgetConfig:
+    values = dict(
+        per_request_limit=5.0,
+        daily_limit=10.0,
+        monthly_limit=100.0,
+        low_remaining_threshold=0.0,
+        standard_cost=1.0,
+    )
+    values.update(overrides)
+    return BudgetConfig(**values)
+
+
+def test_conditional_charge_never_exceeds_limit() -> None:
+    store = _ConditionalStore()
+    now = datetime(2026, 4, 1, tzinfo=timezone.utc)
+    manager = BudgetManager(store, _config(), now_provider=lambda: now)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(lambda _: manager.authorize(), range(40)))
+
+    assert sum(result.allowed for result in results) == 10
+    assert store.usage.daily == {"2026-04-01": 10.0}
+    assert {result.reason for result in results if not result.allowed} == {
+        "daily_limit_exceeded"
+    }
+
+
+def test_refused_charge_reports_the_period_that_refused() -> None:
+    store = _ConditionalStore()
+    now = datetime(2026, 4, 1, tzinfo=timezone.utc)
+    manager = BudgetManager(store, _config(), now_provider=lambda: now)
+    store.try_charge = lambda *args: "monthly"
+
+    result = manager.authorize()
+
+    assert result.allowed is False
+    assert result.reason == "monthly_limit_exceeded"
+    assert store.usage.daily == {}
+
+
+def test_conditional_check_reads_and_charges_in_one_session() -> None:
+    store = _ConditionalStore()
+    sessions = []
+
+    @contextmanager
+    def session():
+        sessions.append(store)
+        yield store
+
+    store.session = session
+    now = datetime(2026, 4, 1, tzinfo=timezone.utc)
+    manager = BudgetManager(store, _config(), now_provider=lambda: now)
+
+    assert manager.authorize().allowed
+    assert len(sessions) == 1
+    assert store.usage.daily == {"2026-04-01": 1.0}
+
+
+def test_prune_drops_periods_outside_retention(tmp_path: Path) -> None:
+    now = datetime(2026, 4, 15, tzinfo=timezone.utc)
+    usage = BudgetUsage(
+        daily={"2026-04-01": 1.0, "2026-04-09": 2.0, "2026-04-15": 3.0},
+        monthly={"2025-12": 4.0, "2026-02": 5.0, "2026-04": 6.0},
+    )
+    retention = BudgetRetentionConfig(keep_days=7, keep_months=2)
+    stores = [
+        BudgetUsageStore(tmp_path / "usage.json"),
+        BudgetUsageStoreSqlite(tmp_path / "state.db"),
+    ]
+
+    for store in stores:
+        store.save(usage)
+
+        removed = prune_budget_usage(store, retention, now=now)
+
+        assert removed == 2
+        assert store.load().daily == {"2026-04-09": 2.0, "2026-04-15": 3.0}
+        assert store.load().monthly == {"2026-02": 5.0, "2026-04": 6.0}
+
+
+class _RecordingConnection:
+    def __init__(self, statements: list[str]) -> None:
+        self._statements = statements
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def execute(self, sql: str, params=()):
+        self._statements.append(" ".join(sql.split()))
+        return self
+
+    def fetchone(self):
+        last = self._statements[-1]
+        if last.startswith("SELECT to_regclass"):
+            return {"name": "budget_usage"}
+        return None
+
+
+def test_postgres_ledger_setup_runs_once_and_keeps_legacy_table(monkeypatch) -> None:
+    statements: list[str] = []
+    monkeypatch.setattr(budget_module, "_LEDGER_READY", set())
+    monkeypatch.setattr(
+        budget_module, "pg_connect", lambda dsn: _RecordingConnection(statements)
+    )
+
+    BudgetUsageStorePostgres("postgresql://db/one", tenant_id="acme", schema="ledger")
+    setup = list(statements)
+    BudgetUsageStorePostgres("postgresql://db/one", tenant_id="other", schema="ledger")
+
+    assert statements == setup
+    assert any(sql.startswith("INSERT INTO ledger.budget_ledger") for sql in setup)
+    assert any(sql.startswith("INSERT INTO ledger.state_migrations") for sql in setup)
+    assert not any("RENAME" in sql or "DROP" in sql for sql in setup)
@@ -0,0 +1,128 @@
+import json
+import threading
+
+import pytest
+
+from skillos.telemetry import (
+    BufferedLogWriter,
+    EventLogger,
+    LogSchemaError,
+    LogWriterConfig,
+    close_event_logs,
+    flush_event_logs,
+)
+
+
+def _lines(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_buffered_logger_writes_events_after_flush(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("SKILLOS_LOG_MODE", "buffered")
+    monkeypatch.setenv("SKILLOS_LOG_FLUSH_INTERVAL_MS", "60000")
+    log_path = tmp_path / "logs" / "execution.log"
+    logger = EventLogger(log_path, request_id="req-1")
+    try:
+        for index in range(5):
+            logger.log("execution_result", status="success", duration_ms=index)
+        flush_event_logs()
+        events = _lines(log_path)
+    finally:
+        close_event_logs()
+
+    assert [event["duration_ms"] for event in events] == [0, 1, 2, 3, 4]
+    assert {event["request_id"] for event in events} == {"req-1"}
+
+
+def test_buffered_logger_still_validates_synchronously(tmp_path) -> None:
+    logger = EventLogger(tmp_path / "execution.log", request_id="req-1", mode="buffered")
+    try:
+        with pytest.raises(LogSchemaError):
+            logger.log("execution_result", status="success")
+    finally:
+        close_event_logs()
+
+
+def test_close_flushes_pending_events(tmp_path) -> None:
+    log_path = tmp_path / "execution.log"
+    writer = BufferedLogWriter(
+        log_path, LogWriterConfig(mode="buffered", flush_interval_seconds=60)
+    )
+    writer.write({"event": "a"})
+    writer.write({"event": "b"})
+
+    writer.close()
+
+    assert [event["event"] for event in _lines(log_path)] == ["a", "b"]
+    assert writer.stats() == {"queued": 0, "written": 2, "dropped": 0}
+
+
+def test_drop_policy_counts_overflow(tmp_path) -> None:
+    writer = BufferedLogWriter(
+        tmp_path / "execution.log",
+        LogWriterConfig(
+            mode="buffered",
+            buffer_size=2,
+            batch_size=100,
+            flush_interval_seconds=60,
+            overflow="drop",
+        ),
+    )
+    accepted = [writer.write({"event": str(index)}) for index in range(5)]
+    writer.close()
+
+    assert accepted == [True, True, False, False, False]
+    assert writer.stats()["dropped"] == 3
+    assert writer.stats()["written"] == 2
+
+
+def test_block_policy_waits_for_writer(tmp_path) -> None:
+    log_path = tmp_path / "execution.log"
+    writer = BufferedLogWriter(
+        log_path,
+        LogWriterConfig(
+            mode="buffered", buffer_size=2, batch_size=2, flush_interval_seconds=0.01
+        ),
+    )
+
+    def produce() -> None:
+        for index in range(50):
+            writer.write({"event": str(index)})
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    producer.join(timeout=5)
+    writer.close()
+
+    assert not producer.is_alive()
+    assert len(_lines(log_path)) == 50
+    assert writer.stats()["dropped"] == 0
+
+
+def test_unserialisable_event_fails_in_caller(tmp_path) -> None:
+    writer = BufferedLogWriter(
+        tmp_path / "execution.log", LogWriterConfig(mode="buffered")
+    )
+    try:
+        with pytest.raises(TypeError):
+            writer.write({"event": object()})
+        assert writer.stats()["queued"] == 0
+    finally:
+        writer.close()
+
+
+def test_failed_write_counts_dropped_and_flush_returns(tmp_path) -> None:
+    # The log path is a directory, so every open() fails.
+    log_path = tmp_path / "execution.log"
+    log_path.mkdir()
+    writer = BufferedLogWriter(
+        log_path, LogWriterConfig(mode="buffered", flush_interval_seconds=60)
+    )
+    writer.write({"event": "a"})
+    writer.write({"event": "b"})
+
+    assert writer.flush(timeout=5)
+    writer.write({"event": "c"})
+    writer.close()
+
+    assert writer.stats() == {"queued": 0, "written": 0, "dropped": 3}
@@ -1,10 +1,16 @@
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+import time
 
+import pytest
+
+from skillos import circuit_breaker as circuit_breaker_module
 from skillos.circuit_breaker import (
     CircuitBreaker,
     CircuitBreakerConfig,
     CircuitBreakerStore,
+    RedisCircuitBreaker,
+    circuit_breaker_from_env,
     default_circuit_breaker_path,
 )
 
@@ -68,3 +74,131 @@ def test_circuit_breaker_half_open_resets_on_success(tmp_path: Path) -> None:
     assert half_open.allowed is True
     breaker.record_success("travel/search_flights")
     assert breaker.allow("travel/search_flights").allowed is True
+
+
+class _CountingStore(CircuitBreakerStore):
+    def __init__(self, path: Path, **kwargs) -> None:
+        super().__init__(path, **kwargs)
+        self.loads = 0
+        self.puts: list[str] = []
+
+    def load(self):
+        self.loads += 1
+        return super().load()
+
+    def put(self, skill_id, state) -> None:
+        self.puts.append(state.state)
+        super().put(skill_id, state)
+
+
+def test_success_on_closed_circuit_touches_no_storage(tmp_path: Path) -> None:
+    store = _CountingStore(default_circuit_breaker_path(tmp_path))
+    breaker = CircuitBreaker(store, CircuitBreakerConfig(flush_interval_ms=0))
+
+    for _ in range(100):
+        assert breaker.allow("travel/search_flights").allowed is True
+        breaker.record_success("travel/search_flights")
+
+    assert store.loads == 1
+    assert store.puts == []
+    assert not store.path.exists()
+
+
+def test_failures_and_transitions_are_persisted(tmp_path: Path) -> None:
+    clock = _Clock(datetime(2026, 1, 1, tzinfo=timezone.utc))
+    store = _CountingStore(default_circuit_breaker_path(tmp_path), now_provider=clock.now)
+    breaker = CircuitBreaker(
+        store,
+        CircuitBreakerConfig(failure_threshold=3, open_seconds=10, flush_interval_ms=0),
+    )
+
+    breaker.record_failure("travel/search_flights")
+    breaker.record_failure("travel/search_flights")
+    assert store.get("travel/search_flights").failure_count == 2
+    breaker.record_failure("travel/search_flights")
+    clock.advance(11)
+    breaker.allow("travel/search_flights")
+    breaker.record_success("travel/search_flights")
+    breaker.record_success("travel/search_flights")
+
+    assert store.puts == ["closed", "closed", "open", "half_open", "closed"]
+
+
+def test_processes_share_failures_through_the_store(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = default_circuit_breaker_path(tmp_path)
+    config = CircuitBreakerConfig(
+        failure_threshold=3, flush_interval_ms=0, reload_interval_ms=0
+    )
+    # A fresh table registry per breaker stands in for separate processes.
+    monkeypatch.setattr(circuit_breaker_module, "_TABLES", {})
+    api = CircuitBreaker(CircuitBreakerStore(path), config)
+    monkeypatch.setattr(circuit_breaker_module, "_TABLES", {})
+    worker = CircuitBreaker(CircuitBreakerStore(path), config)
+
+    api.record_failure("travel/search_flights")
+    api.record_failure("travel/search_flights")
+    worker.record_failure("travel/search_flights")
+
+    assert api.allow("travel/search_flights").reason == "circuit_open"
+    monkeypatch.setattr(circuit_breaker_module, "_TABLES", {})
+    cli = CircuitBreaker(CircuitBreakerStore(path), config)
+    assert cli.allow("travel/search_flights").reason == "circuit_open"
+
+
+def test_breakers_on_one_store_share_state_and_flush_in_background(
+    tmp_path: Path,
+) -> None:
+    path = default_circuit_breaker_path(tmp_path)
+    config = CircuitBreakerConfig(failure_threshold=1, flush_interval_ms=10)
+    first = CircuitBreaker(CircuitBreakerStore(path), config)
+    second = CircuitBreaker(CircuitBreakerStore(path), config)
+
+    first.record_failure("travel/search_flights")
+
+    assert second.allow("travel/search_flights").reason == "circuit_open"
+    deadline = time.monotonic() + 2
+    while not path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert CircuitBreakerStore(path).get("travel/search_flights").state == "open"
+
+
+class _FakeRedis:
+    def __init__(self, responses: list) -> None:
+        self.responses = responses
+        self.calls: list[str] = []
+
+    def eval(self, script, numkeys, key, *args):
+        self.calls.append("eval")
+        return self.responses.pop(0)
+
+    def delete(self, key) -> None:
+        self.calls.append("delete")
+
+
+def test_redis_breaker_skips_round_trip_for_clean_success() -> None:
+    client = _FakeRedis([[1, b"closed", 0], [b"closed", 1], [1, b"closed", 1]])
+    breaker = RedisCircuitBreaker(client, namespace="test:circuit")
+
+    assert breaker.allow("travel/search_flights").allowed is True
+    breaker.record_success("travel/search_flights")
+    breaker.record_failure("travel/search_flights")
+    breaker.allow("travel/search_flights")
+    breaker.record_success("travel/search_flights")
+    breaker.record_success("travel/search_flights")
+
+    assert client.calls == ["eval", "eval", "eval", "delete"]
+
+
+def test_redis_breakers_share_one_client_per_url(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("redis")
+    monkeypatch.setenv("SKILLOS_CIRCUIT_BACKEND", "redis")
+    monkeypatch.setenv("SKILLOS_REDIS_URL", "redis://localhost:6379/0")
+
+    first = circuit_breaker_from_env(tmp_path)
+    second = circuit_breaker_from_env(tmp_path)
+
+    assert first._client is second._client
@@ -0,0 +1,51 @@
+import hashlib
+import random
+import re
+
+import pytest
+
+from skillos.vector_search import VectorSearchError, embed_many, embed_text
+
+_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+
+
+def _reference_embed(text: str, dim: int) -> list[float]:
+    # Scalar implementation that produced the vectors stored in existing collections.
+    vector = [0.0 for _ in range(dim)]
+    tokens = _TOKEN_RE.findall(text.lower())
+    if not tokens:
+        return vector
+    for token in tokens:
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+        index = int.from_bytes(digest[:4], "big") % dim
+        vector[index] += -1.0 if (digest[4] & 1) else 1.0
+    norm = sum(value * value for value in vector) ** 0.5
+    if norm == 0.0:
+        return vector
+    return [value / norm for value in vector]
+
+
+def _sample_texts() -> list[str]:
+    rng = random.Random(42)
+    words = [f"w{index}" for index in range(500)] + ["Summarize", "flights", "RATES"]
+    texts = [
+        " ".join(rng.choice(words) for _ in range(rng.randint(0, 40)))
+        for _ in range(300)
+    ]
+    return texts + ["", "!!!", "a a a a", "convert USD to EUR, please"]
+
+
+@pytest.mark.parametrize("dim", [7, 128, 384])
+def test_embeddings_match_reference_bit_for_bit(dim: int) -> None:
+    texts = _sample_texts()
+    matrix = embed_many(texts, dim)
+    assert matrix.shape == (len(texts), dim)
+    for text, row in zip(texts, matrix):
+        expected = _reference_embed(text, dim)
+        assert row.tolist() == expected
+        assert embed_text(text, dim) == expected
+
+
+def test_embed_rejects_non_positive_dim() -> None:
+    with pytest.raises(VectorSearchError):
+        embed_text("flights", 0)
@@ -1,6 +1,14 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from skillos.feedback import FeedbackOutcome, FeedbackStore, FeedbackTracker
+import pytest
+
+from skillos.feedback import (
+    FeedbackOutcome,
+    FeedbackStore,
+    FeedbackStoreSqlite,
+    FeedbackTracker,
+)
 from skillos.routing import SkillRouter
 from skillos.skills.models import SkillMetadata
 
@@ -46,3 +54,70 @@ def test_feedback_updates_confidence_and_demotes_rank(tmp_path: Path) -> None:
     router = SkillRouter(skills, confidence_provider=tracker.get_confidence)
     result = router.route(query)
     assert result.skill_id == "sales.beta_report"
+
+
+def _sequential(confidence: float, outcomes: list[FeedbackOutcome]) -> float:
+    for outcome in outcomes:
+        if outcome == FeedbackOutcome.POSITIVE:
+            confidence = confidence + (1 - confidence) * 0.1
+        else:
+            confidence = confidence * 0.9
+    return confidence
+
+
+def test_batched_outcomes_match_sequential_feedback(tmp_path: Path) -> None:
+    outcomes = [FeedbackOutcome.POSITIVE, FeedbackOutcome.NEGATIVE] * 3 + [
+        FeedbackOutcome.NEGATIVE
+    ]
+    for store in (
+        FeedbackStore(tmp_path / "confidence.json"),
+        FeedbackStoreSqlite(tmp_path / "state.db"),
+    ):
+        tracker = FeedbackTracker(store)
+        tracker.record_feedback("sales/alpha_report", FeedbackOutcome.POSITIVE)
+
+        updated = tracker.record_outcomes(
+            [("sales/alpha_report", outcome) for outcome in outcomes]
+            + [("sales/beta_report", FeedbackOutcome.NEGATIVE)]
+        )
+
+        record = updated["sales.alpha_report"]
+        expected = _sequential(0.5, [FeedbackOutcome.POSITIVE, *outcomes])
+        assert record.confidence == pytest.approx(expected)
+        assert (record.positive, record.negative) == (4, 4)
+        assert store.load()["sales.beta_report"].confidence == pytest.approx(0.45)
+        assert tracker.get_confidence("sales.alpha_report") == pytest.approx(expected)
+
+
+def test_sqlite_outcomes_return_only_touched_rows(tmp_path: Path) -> None:
+    store = FeedbackStoreSqlite(tmp_path / "state.db")
+    store.apply_outcomes([("sales.untouched", FeedbackOutcome.POSITIVE)])
+
+    skill_ids = [f"sales.report_{index}" for index in range(1200)]
+    updated = store.apply_outcomes(
+        (skill_id, FeedbackOutcome.NEGATIVE) for skill_id in skill_ids
+    )
+
+    assert sorted(updated) == sorted(skill_ids)
+    assert {record.negative for record in updated.values()} == {1}
+
+
+def test_concurrent_feedback_loses_no_updates(tmp_path: Path) -> None:
+    for store in (
+        FeedbackStore(tmp_path / "confidence.json"),
+        FeedbackStoreSqlite(tmp_path / "state.db"),
+    ):
+        tracker = FeedbackTracker(store)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(
+                executor.map(
+                    lambda _: tracker.record_feedback(
+                        "sales/alpha_report", FeedbackOutcome.NEGATIVE
+                    ),
+                    range(40),
+                )
+            )
+
+        record = store.load()["sales.alpha_report"]
+        assert record.negative == 40
+        assert record.confidence == pytest.approx(0.5 * 0.9**40)
@@ -0,0 +1,96 @@
+from pathlib import Path
+import time
+
+from skillos.cache import MemoryCache
+from skillos.feedback import (
+    FeedbackOutcome,
+    FeedbackRecord,
+    FeedbackStore,
+    FeedbackTracker,
+)
+from skillos.routing import RoutingResult
+from skillos.routing_cache import RoutingCache
+
+
+class _CountingStore(FeedbackStore):
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.loads = 0
+
+    def load(self):
+        self.loads += 1
+        return super().load()
+
+
+def test_confidence_reads_come_from_the_snapshot(tmp_path: Path) -> None:
+    store = _CountingStore(tmp_path / "confidence.json")
+    store.save({"travel.search": FeedbackRecord(confidence=0.8)})
+    tracker = FeedbackTracker(store, snapshot_ttl_seconds=60)
+
+    values = [tracker.get_confidence("travel/search") for _ in range(100)]
+
+    assert values == [0.8] * 100
+    assert tracker.get_confidence("travel/other") == 0.5
+    assert store.loads == 1
+
+
+def test_writes_publish_a_new_snapshot_to_every_tracker(tmp_path: Path) -> None:
+    path = tmp_path / "confidence.json"
+    reader = FeedbackTracker(FeedbackStore(path), snapshot_ttl_seconds=60)
+    writer = FeedbackTracker(FeedbackStore(path), snapshot_ttl_seconds=60)
+    before = reader.snapshot()
+
+    writer.record_feedback("travel/search", FeedbackOutcome.NEGATIVE)
+
+    assert reader.get_confidence("travel/search") < 0.5
+    assert reader.version() != before.version
+    assert dict(before.confidences) == {}
+
+
+def test_external_writes_are_seen_after_the_ttl(tmp_path: Path) -> None:
+    path = tmp_path / "confidence.json"
+    cached = FeedbackTracker(FeedbackStore(path), snapshot_ttl_seconds=60)
+    polling = FeedbackTracker(FeedbackStore(path), snapshot_ttl_seconds=0)
+    cached.get_confidence("travel/search")
+
+    # Written by "another process": straight to the store, no tracker.
+    FeedbackStore(path).save({"travel.search": FeedbackRecord(confidence=0.9)})
+
+    assert cached.get_confidence("travel/search") == 0.5
+    # The stale snapshot is served while a background refresh picks it up.
+    assert polling.get_confidence("travel/search") == 0.5
+    deadline = time.monotonic() + 5
+    while polling.get_confidence("travel/search") != 0.9:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_snapshot_version_depends_only_on_content(tmp_path: Path) -> None:
+    records = {"travel.search": FeedbackRecord(confidence=0.7)}
+    FeedbackStore(tmp_path / "a.json").save(records)
+    FeedbackStore(tmp_path / "b.json").save(records)
+
+    first = FeedbackTracker(FeedbackStore(tmp_path / "a.json"))
+    second = FeedbackTracker(FeedbackStore(tmp_path / "b.json"))
+
+    assert first.version() == second.version()
+
+
+def test_feedback_version_rekeys_the_routing_cache(tmp_path: Path) -> None:
+    tracker = FeedbackTracker(FeedbackStore(tmp_path / "confidence.json"))
+    cache = RoutingCache(MemoryCache(), tenant_id="acme", ttl_seconds=60, prefix="skillos")
+    result = RoutingResult(
+        status="selected",
+        skill_id="travel.search",
+        internal_skill_id="travel/search",
+        confidence=0.9,
+        candidates=[],
+        alternatives=[],
+    )
+    cache.observe_version((1, tracker.version()))
+    cache.set("Find flights", None, result)
+
+    tracker.record_feedback("travel/search", FeedbackOutcome.NEGATIVE)
+    cache.observe_version((1, tracker.version()))
+
+    assert cache.get("Find flights") is None
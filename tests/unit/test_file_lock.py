@@ -0,0 +1,112 @@
+import multiprocessing
+from pathlib import Path
+import sys
+import threading
+import time
+
+import pytest
+
+from skillos.metrics_registry import metrics_registry
+from skillos.storage import file_lock
+
+
+def _hold_lock(path: str, acquired, release) -> None:
+    with file_lock(Path(path)):
+        acquired.set()
+        release.wait(10)
+
+
+def test_shared_locks_overlap(tmp_path: Path) -> None:
+    path = tmp_path / "usage.json"
+    inside = threading.Barrier(3, timeout=2)
+
+    def reader() -> None:
+        with file_lock(path, shared=True):
+            inside.wait()
+
+    threads = [threading.Thread(target=reader) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not inside.broken
+
+
+def test_exclusive_lock_blocks_readers_until_released(tmp_path: Path) -> None:
+    path = tmp_path / "usage.json"
+    order: list[str] = []
+
+    def reader() -> None:
+        with file_lock(path, shared=True):
+            order.append("reader")
+
+    with file_lock(path):
+        thread = threading.Thread(target=reader)
+        thread.start()
+        time.sleep(0.05)
+        order.append("writer")
+    thread.join()
+
+    assert order == ["writer", "reader"]
+
+
+def test_waiting_thread_acquires_without_polling_delay(tmp_path: Path) -> None:
+    path = tmp_path / "usage.json"
+    acquired_at: list[float] = []
+
+    def waiter() -> None:
+        with file_lock(path):
+            acquired_at.append(time.monotonic())
+
+    with file_lock(path):
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.02)
+        released_at = time.monotonic()
+    thread.join()
+
+    assert acquired_at[0] - released_at < 0.05
+
+
+def test_timeout_is_counted_as_contention(tmp_path: Path) -> None:
+    path = tmp_path / "timeout.json"
+    errors: list[Exception] = []
+
+    def contender() -> None:
+        try:
+            with file_lock(path, timeout=0.05):
+                pass
+        except TimeoutError as exc:
+            errors.append(exc)
+
+    with file_lock(path):
+        thread = threading.Thread(target=contender)
+        thread.start()
+        thread.join()
+
+    assert len(errors) == 1
+    rendered = metrics_registry().render()
+    assert 'skillos_lock_contended_total{lock="timeout.json.lock",mode="exclusive"} 1' in rendered
+    assert 'skillos_lock_wait_seconds_count{lock="timeout.json.lock",mode="exclusive"}' in rendered
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fork start method")
+def test_lock_excludes_other_processes(tmp_path: Path) -> None:
+    path = tmp_path / "shared.json"
+    context = multiprocessing.get_context("fork")
+    acquired = context.Event()
+    release = context.Event()
+    process = context.Process(target=_hold_lock, args=(str(path), acquired, release))
+    process.start()
+    try:
+        assert acquired.wait(5)
+        with pytest.raises(TimeoutError):
+            with file_lock(path, timeout=0.1):
+                pass
+    finally:
+        release.set()
+        process.join(5)
+
+    with file_lock(path, timeout=1):
+        pass
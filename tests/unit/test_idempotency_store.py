@@ -1,6 +1,12 @@
 from datetime import datetime, timedelta, timezone
 
-from skillos.idempotency import IdempotencyStore
+from skillos.idempotency import (
+    IdempotencyStore,
+    IdempotencyStoreRedis,
+    IdempotencyStoreSqlite,
+    get_cached_idempotency_store,
+    idempotency_store_from_env,
+)
 
 
 def test_idempotency_store_detects_duplicates_and_expiry(tmp_path) -> None:
@@ -44,3 +50,122 @@ def test_idempotency_store_detects_duplicates_and_expiry(tmp_path) -> None:
         ttl_seconds=60,
     )
     assert different_scope.allowed is True
+
+
+def test_sqlite_duplicate_check_does_not_write(tmp_path) -> None:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    store = IdempotencyStoreSqlite(tmp_path / "state.db", now_provider=lambda: now)
+    store.check_and_record("webhook", "ops/sample", "evt-1", ttl_seconds=60)
+    connection = store._db.connection()
+    changes = connection.total_changes
+
+    duplicate = store.check_and_record("webhook", "ops/sample", "evt-1", ttl_seconds=60)
+
+    assert duplicate.allowed is False
+    assert duplicate.expires_at == now + timedelta(seconds=60)
+    assert connection.total_changes == changes
+
+
+def test_sqlite_expired_rows_are_reused_and_purged_in_batches(tmp_path) -> None:
+    current = [datetime(2026, 1, 1, tzinfo=timezone.utc)]
+    store = IdempotencyStoreSqlite(
+        tmp_path / "state.db",
+        now_provider=lambda: current[0],
+        cleanup_interval_seconds=3600,
+        cleanup_batch_size=2,
+    )
+    for index in range(5):
+        store.check_and_record("webhook", "ops/sample", f"evt-{index}", ttl_seconds=60)
+    current[0] += timedelta(seconds=61)
+
+    # Expired but not yet purged: the key is free again.
+    again = store.check_and_record("webhook", "ops/sample", "evt-0", ttl_seconds=60)
+
+    assert again.allowed is True
+    assert store.purge_expired() == 4
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.values: dict[str, str] = {}
+        self.calls: list[str] = []
+
+    def set(self, key, value, nx=False, px=None):
+        self.calls.append("set")
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        return True
+
+    def get(self, key):
+        self.calls.append("get")
+        value = self.values.get(key)
+        return value.encode("utf-8") if value is not None else None
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def execute(self):
+        return []
+
+
+def test_redis_store_records_with_set_nx() -> None:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    client = _FakeRedis()
+    store = IdempotencyStoreRedis(client, namespace="test", now_provider=lambda: now)
+
+    first = store.check_and_record("webhook", "ops/sample", "evt-1", ttl_seconds=60)
+    duplicate = store.check_and_record("webhook", "ops/sample", "evt-1", ttl_seconds=60)
+
+    assert first.allowed is True
+    assert duplicate.allowed is False
+    assert duplicate.expires_at == first.expires_at
+    assert client.calls == ["set", "set", "get"]
+    assert list(client.values) == ["test:webhook:ops/sample:evt-1"]
+
+
+def test_store_factory_uses_redis_only_when_asked(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("SKILLOS_STORAGE_BACKEND", raising=False)
+    monkeypatch.delenv("SKILLOS_IDEMPOTENCY_BACKEND", raising=False)
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    # A Redis URL configured for the cache must not move idempotency keys.
+    monkeypatch.setenv("SKILLOS_REDIS_URL", "redis://localhost:6379/0")
+
+    assert isinstance(idempotency_store_from_env(tmp_path), IdempotencyStoreSqlite)
+    monkeypatch.setenv("SKILLOS_IDEMPOTENCY_BACKEND", "redis")
+    assert isinstance(idempotency_store_from_env(tmp_path), IdempotencyStoreRedis)
+
+
+def test_redis_store_imports_live_legacy_keys(tmp_path) -> None:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    legacy_path = tmp_path / "runtime" / "idempotency.json"
+    legacy = IdempotencyStore(legacy_path, now_provider=lambda: now)
+    legacy.check_and_record("webhook", "ops/sample", "evt-live", ttl_seconds=60)
+    legacy.check_and_record("webhook", "ops/sample", "evt-gone", ttl_seconds=1)
+    later = now + timedelta(seconds=30)
+
+    client = _FakeRedis()
+    store = IdempotencyStoreRedis(
+        client, namespace="test", now_provider=lambda: later, legacy_path=legacy_path
+    )
+
+    assert list(client.values) == ["test:webhook:ops/sample:evt-live"]
+    duplicate = store.check_and_record(
+        "webhook", "ops/sample", "evt-live", ttl_seconds=60
+    )
+    assert duplicate.allowed is False
+
+
+def test_cached_store_is_reused_per_root_and_backend(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("SKILLOS_STORAGE_BACKEND", raising=False)
+    monkeypatch.delenv("SKILLOS_IDEMPOTENCY_BACKEND", raising=False)
+    monkeypatch.setenv("SKILLOS_REDIS_URL", "redis://localhost:6379/0")
+
+    first = get_cached_idempotency_store(tmp_path)
+    assert get_cached_idempotency_store(tmp_path) is first
+    assert get_cached_idempotency_store(tmp_path / "other") is not first
+
+    monkeypatch.setenv("SKILLOS_IDEMPOTENCY_BACKEND", "redis")
+    redis_store = get_cached_idempotency_store(tmp_path)
+    assert isinstance(redis_store, IdempotencyStoreRedis)
+    assert get_cached_idempotency_store(tmp_path) is redis_store
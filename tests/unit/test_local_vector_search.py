@@ -0,0 +1,123 @@
+from pathlib import Path
+
+import numpy as np
+
+from skillos import vector_search
+from skillos.routing import RoutingConfig, SkillRouter
+from skillos.skills.models import SkillMetadata
+from skillos.vector_search import (
+    LocalVectorSearch,
+    LocalVectorSearchConfig,
+    VectorDocument,
+    default_vector_index_path,
+    embed_text,
+    vector_search_from_env,
+)
+
+
+def _documents() -> list[VectorDocument]:
+    return [
+        VectorDocument(doc_id="travel.search_flights", text="search flights airline tickets"),
+        VectorDocument(doc_id="travel.search_hotels", text="search hotels rooms booking"),
+        VectorDocument(doc_id="finance.convert_currency", text="convert currency exchange rates"),
+    ]
+
+
+def _backend(tmp_path: Path) -> LocalVectorSearch:
+    return LocalVectorSearch(LocalVectorSearchConfig(path=tmp_path / "vectors" / "skills.npy"))
+
+
+def test_local_search_ranks_by_cosine_similarity(tmp_path: Path) -> None:
+    backend = _backend(tmp_path)
+    backend.index(_documents())
+
+    matches = backend.search("currency exchange rates", limit=2)
+
+    assert [match.doc_id for match in matches][0] == "finance.convert_currency"
+    assert len(matches) == 2
+    expected = float(
+        np.dot(
+            np.asarray(embed_text("currency exchange rates", 128), dtype=np.float32),
+            np.asarray(embed_text("convert currency exchange rates", 128), dtype=np.float32),
+        )
+    )
+    assert abs(matches[0].score - expected) < 1e-6
+    assert backend.search("zzz qqq", limit=2, min_score=0.5) == []
+
+
+def test_local_search_many_preserves_query_order(tmp_path: Path) -> None:
+    backend = _backend(tmp_path)
+    backend.index(_documents())
+
+    batches = backend.search_many(["hotels rooms", "", "airline tickets"], limit=1)
+
+    assert [[match.doc_id for match in batch] for batch in batches] == [
+        ["travel.search_hotels"],
+        [],
+        ["travel.search_flights"],
+    ]
+
+
+def test_local_index_persists_and_skips_unchanged_documents(tmp_path: Path, monkeypatch) -> None:
+    backend = _backend(tmp_path)
+    backend.index(_documents())
+    assert (tmp_path / "vectors" / "skills.npy").exists()
+
+    calls: list[str] = []
+    original = vector_search.embed_many
+
+    def counting_embed(texts, dim: int):
+        texts = list(texts)
+        calls.extend(texts)
+        return original(texts, dim)
+
+    monkeypatch.setattr(vector_search, "embed_many", counting_embed)
+    reloaded = _backend(tmp_path)
+    assert len(reloaded.doc_ids) == 3
+    reloaded.index(_documents())
+    assert calls == []
+
+    reloaded.index([VectorDocument(doc_id="travel.search_hotels", text="book hotel suites")])
+    assert calls == ["book hotel suites"]
+    assert reloaded.search("hotel suites", limit=1)[0].doc_id == "travel.search_hotels"
+
+    reloaded.delete(["travel.search_hotels"])
+    assert _backend(tmp_path).doc_ids == [
+        "travel.search_flights",
+        "finance.convert_currency",
+    ]
+
+
+def test_reindexing_to_empty_text_removes_the_stale_row(tmp_path: Path) -> None:
+    backend = _backend(tmp_path)
+    backend.index(_documents())
+
+    backend.index([VectorDocument(doc_id="travel.search_hotels", text="")])
+
+    assert "travel.search_hotels" not in backend.doc_ids
+    matches = backend.search("hotels rooms booking", limit=3)
+    assert "travel.search_hotels" not in [match.doc_id for match in matches]
+    assert "travel.search_hotels" not in _backend(tmp_path).doc_ids
+
+
+def test_vector_backend_env_selects_local_index(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("SKILLOS_VECTOR_BACKEND", "local")
+    backend = vector_search_from_env(tmp_path)
+    assert isinstance(backend, LocalVectorSearch)
+
+    router = SkillRouter(
+        [
+            SkillMetadata(
+                id="travel/search_flights",
+                name="Search Flights",
+                description="Find flights",
+                version="1.0.0",
+                entrypoint="implementations.travel.search_flights:run",
+                tags=["travel"],
+            )
+        ],
+        vector_search=backend,
+        routing_config=RoutingConfig(mode="vector", vector_min_score=0.1),
+    )
+    assert default_vector_index_path(tmp_path).exists()
+    assert router.route("flights").skill_id == "travel.search_flights"
@@ -0,0 +1,137 @@
+import gzip
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+
+import skillos.log_segments as log_segments
+from skillos.log_segments import (
+    LogRotationConfig,
+    iter_log_events,
+    load_manifests,
+    maybe_rotate,
+    rotate_log,
+    segments_dir,
+    wait_for_sealing,
+)
+from skillos.telemetry import EventLogger
+
+
+def _write(log_path, events) -> None:
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with log_path.open("a", encoding="utf-8") as handle:
+        for event in events:
+            handle.write(json.dumps(event) + "\n")
+
+
+def _event(moment: datetime, event: str, request_id: str) -> dict:
+    return {"timestamp": moment.isoformat(), "event": event, "request_id": request_id}
+
+
+def test_size_rotation_writes_compressed_segment_and_manifest(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("SKILLOS_LOG_ROTATE_BYTES", "400")
+    log_path = tmp_path / "logs" / "execution.log"
+    logger = EventLogger(log_path, request_id="req-a")
+
+    for index in range(6):
+        logger.log("execution_result", status="success", duration_ms=index)
+
+    assert wait_for_sealing(timeout=5)
+    manifests = load_manifests(log_path)
+    assert manifests
+    manifest = manifests[0]
+    assert manifest.path.suffix == ".gz"
+    assert manifest.event_types == {"execution_result": manifest.count}
+    assert manifest.min_request_id == manifest.max_request_id == "req-a"
+    with gzip.open(manifest.path, "rt", encoding="utf-8") as handle:
+        assert len(handle.readlines()) == manifest.count
+    assert not list(segments_dir(log_path).glob("*.log"))
+    durations = [event["duration_ms"] for event in iter_log_events(log_path)]
+    assert durations == list(range(6))
+
+
+def test_rotation_is_off_unless_configured(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("SKILLOS_LOG_ROTATE_BYTES", raising=False)
+    monkeypatch.delenv("SKILLOS_LOG_ROTATE_SECONDS", raising=False)
+    log_path = tmp_path / "execution.log"
+    old = datetime.now(timezone.utc) - timedelta(days=30)
+    _write(log_path, [_event(old, "request_received", "r1")])
+
+    config = log_segments.log_rotation_config_from_env()
+
+    assert not config.enabled
+    assert maybe_rotate(log_path, os.stat(log_path), config) is None
+    assert log_path.exists()
+
+
+def test_age_rotation_uses_first_event_timestamp(tmp_path) -> None:
+    log_path = tmp_path / "execution.log"
+    old = datetime.now(timezone.utc) - timedelta(hours=2)
+    _write(log_path, [_event(old, "request_received", "r1")])
+    config = LogRotationConfig(max_bytes=0, max_age_seconds=3600)
+
+    assert maybe_rotate(log_path, os.stat(log_path), config) is not None
+    assert not log_path.exists()
+    assert wait_for_sealing(timeout=5)
+    assert load_manifests(log_path)[0].start == old.isoformat()
+
+
+def test_maybe_rotate_seals_off_the_calling_thread(tmp_path, monkeypatch) -> None:
+    log_path = tmp_path / "execution.log"
+    _write(log_path, [_event(datetime.now(timezone.utc), "request_received", "r1")])
+    caller = threading.get_ident()
+    sealed_on = []
+    original_seal = log_segments.seal_segment
+
+    def recording_seal(raw_path, compression="gzip"):
+        sealed_on.append(threading.get_ident())
+        return original_seal(raw_path, compression)
+
+    monkeypatch.setattr(log_segments, "seal_segment", recording_seal)
+    raw_path = maybe_rotate(log_path, os.stat(log_path), LogRotationConfig(max_bytes=1))
+
+    assert raw_path is not None and raw_path.parent == segments_dir(log_path)
+    assert wait_for_sealing(timeout=5)
+    assert sealed_on and caller not in sealed_on
+    assert [event["request_id"] for event in iter_log_events(log_path)] == ["r1"]
+
+
+def test_reader_opens_only_segments_in_window(tmp_path, monkeypatch) -> None:
+    log_path = tmp_path / "execution.log"
+    base = datetime(2026, 3, 1, tzinfo=timezone.utc)
+    config = LogRotationConfig(compression="gzip")
+    for day in range(3):
+        moment = base + timedelta(days=day)
+        _write(
+            log_path,
+            [
+                _event(moment, "request_received", f"d{day}-1"),
+                _event(moment + timedelta(minutes=1), "execution_result", f"d{day}-2"),
+            ],
+        )
+        rotate_log(log_path, config)
+    _write(log_path, [_event(base + timedelta(days=3), "request_received", "live")])
+
+    opened = []
+    original_open = log_segments._open_segment
+
+    def recording_open(path):
+        opened.append(path.name)
+        return original_open(path)
+
+    monkeypatch.setattr(log_segments, "_open_segment", recording_open)
+    events = list(
+        iter_log_events(
+            log_path,
+            since=base + timedelta(days=1),
+            until=base + timedelta(days=1, hours=1),
+        )
+    )
+
+    assert [event["request_id"] for event in events] == ["d1-1", "d1-2"]
+    assert len(opened) == 2
+    assert opened[-1] == "execution.log"
+
+    opened.clear()
+    events = list(iter_log_events(log_path, event_types=["execution_result"]))
+    assert [event["request_id"] for event in events] == ["d0-2", "d1-2", "d2-2"]
@@ -0,0 +1,67 @@
+import threading
+
+import pytest
+
+from skillos.metrics_registry import MetricsError, MetricsRegistry
+
+
+def test_render_counters_gauges_and_histograms() -> None:
+    registry = MetricsRegistry()
+    requests = registry.counter("app_requests_total", "Requests.", ("status",))
+    inflight = registry.gauge("app_inflight", "In-flight requests.")
+    latency = registry.histogram(
+        "app_latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0)
+    )
+
+    requests.inc(status="ok")
+    requests.inc(2, status="ok")
+    inflight.set(3)
+    inflight.dec()
+    for value in (0.05, 0.1, 0.5, 4.0):
+        latency.observe(value, route='a"b')
+
+    assert registry.render().splitlines() == [
+        "# HELP app_inflight In-flight requests.",
+        "# TYPE app_inflight gauge",
+        "app_inflight 2",
+        "# HELP app_latency_seconds Latency.",
+        "# TYPE app_latency_seconds histogram",
+        'app_latency_seconds_bucket{route="a\\"b",le="0.1"} 2',
+        'app_latency_seconds_bucket{route="a\\"b",le="1"} 3',
+        'app_latency_seconds_bucket{route="a\\"b",le="+Inf"} 4',
+        'app_latency_seconds_sum{route="a\\"b"} 4.65',
+        'app_latency_seconds_count{route="a\\"b"} 4',
+        "# HELP app_requests_total Requests.",
+        "# TYPE app_requests_total counter",
+        'app_requests_total{status="ok"} 3',
+    ]
+
+
+def test_registration_is_idempotent_and_checks_labels() -> None:
+    registry = MetricsRegistry()
+    counter = registry.counter("jobs_total", "Jobs.", ("status",))
+
+    assert registry.counter("jobs_total", "Jobs.", ("status",)) is counter
+    with pytest.raises(MetricsError):
+        registry.gauge("jobs_total", "Jobs.", ("status",))
+    with pytest.raises(MetricsError):
+        counter.inc(skill_id="x")
+    with pytest.raises(MetricsError):
+        counter.inc(-1, status="ok")
+
+
+def test_concurrent_updates_are_not_lost() -> None:
+    registry = MetricsRegistry()
+    histogram = registry.histogram("work_seconds", "Work.", ("worker",))
+
+    def work() -> None:
+        for _ in range(2000):
+            histogram.observe(0.01, worker="w")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert 'work_seconds_count{worker="w"} 16000' in registry.render()
@@ -0,0 +1,86 @@
+import threading
+import time
+
+import pytest
+
+from skillos.profiler import (
+    ProfilerBusyError,
+    ProfilerConfig,
+    StackSampler,
+    profile_process,
+    skill_scope,
+)
+
+
+def _busy_skill(stop: threading.Event) -> None:
+    with skill_scope("travel/search_flights"):
+        while not stop.is_set():
+            sum(range(200))
+
+
+def test_sampler_tags_threads_running_a_skill_and_skips_idle_ones() -> None:
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_skill, args=(stop,), name="ThreadPoolExecutor-0_3")
+    idle = threading.Thread(target=stop.wait, name="parked")
+    worker.start()
+    idle.start()
+    sampler = StackSampler(interval_ms=2)
+    try:
+        sampler.run_for(0.2)
+    finally:
+        stop.set()
+        worker.join()
+        idle.join()
+
+    lines = sampler.collapsed().splitlines()
+    assert sampler.samples > 0
+    tagged = [line for line in lines if line.startswith("skill:travel/search_flights;")]
+    assert tagged
+    assert any("test_profiler:_busy_skill" in line for line in tagged)
+    assert not any(line.startswith("thread:parked") for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_skill_scope_restores_outer_skill() -> None:
+    # The thread parks in Event.wait, which is only sampled with include_idle.
+    sampler = StackSampler(include_idle=True)
+    ready = threading.Event()
+    release = threading.Event()
+
+    def nested() -> None:
+        with skill_scope("outer"):
+            with skill_scope("inner"):
+                pass
+            ready.set()
+            release.wait()
+
+    thread = threading.Thread(target=nested)
+    thread.start()
+    ready.wait()
+    sampler.sample()
+    release.set()
+    thread.join()
+
+    roots = {line.split(";", 1)[0] for line in sampler.collapsed().splitlines()}
+    assert "skill:outer" in roots
+    assert "skill:inner" not in roots
+
+
+def test_only_one_profiling_session_runs_at_a_time() -> None:
+    config = ProfilerConfig(enabled=True, max_seconds=0.3)
+    started = threading.Event()
+    result: list[StackSampler] = []
+
+    def first() -> None:
+        started.set()
+        result.append(profile_process(5, config=config))
+
+    thread = threading.Thread(target=first)
+    thread.start()
+    started.wait()
+    time.sleep(0.05)
+    with pytest.raises(ProfilerBusyError):
+        profile_process(0.1, config=config)
+    thread.join()
+
+    assert result and result[0].samples > 0
@@ -0,0 +1,120 @@
+import json
+
+import httpx
+import pytest
+
+from skillos.routing import RoutingConfig, SkillRouter
+from skillos.skills.models import SkillMetadata
+from skillos.vector_search import QdrantVectorSearch, VectorSearchConfig
+
+
+def _skills() -> list[SkillMetadata]:
+    return [
+        SkillMetadata(
+            id="travel/search_flights",
+            name="Search Flights",
+            description="Find flights",
+            version="1.0.0",
+            entrypoint="implementations.travel.search_flights:run",
+            tags=["travel"],
+        ),
+        SkillMetadata(
+            id="finance/convert_currency",
+            name="Convert Currency",
+            description="Convert money",
+            version="1.0.0",
+            entrypoint="implementations.finance.convert_currency:run",
+            tags=["finance"],
+        ),
+    ]
+
+
+def test_route_many_matches_route_in_input_order() -> None:
+    router = SkillRouter(_skills(), routing_config=RoutingConfig(mode="keyword"))
+    queries = ["Convert money", "Find flights", "unrelated", "Convert money"]
+
+    results = router.route_many(queries)
+
+    assert [result.skill_id for result in results] == [
+        "finance.convert_currency",
+        "travel.search_flights",
+        None,
+        "finance.convert_currency",
+    ]
+    assert results == [router.route(query) for query in queries]
+
+
+def test_route_many_applies_tag_filter() -> None:
+    router = SkillRouter(_skills(), routing_config=RoutingConfig(mode="keyword"))
+    results = router.route_many(["Find flights", "Convert money"], tags=["travel"])
+    assert results[0].skill_id == "travel.search_flights"
+    assert results[1].status == "no_skill_found"
+
+
+def _qdrant_handler(calls: list[tuple[str, str, dict | None]]):
+    def handler(request: httpx.Request) -> httpx.Response:
+        payload = json.loads(request.content) if request.content else None
+        calls.append((request.method, str(request.url), payload))
+        if request.url.path.endswith("/points/search/batch"):
+            return httpx.Response(
+                200,
+                json={
+                    "result": [
+                        [{"score": 0.9, "payload": {"skill_id": "finance.convert_currency"}}],
+                        [{"score": 0.8, "payload": {"skill_id": "travel.search_flights"}}],
+                    ]
+                },
+            )
+        return httpx.Response(200, json={"result": {}})
+
+    return handler
+
+
+def test_route_many_sends_single_batched_vector_search() -> None:
+    calls: list[tuple[str, str, dict | None]] = []
+    vector_search = QdrantVectorSearch(
+        VectorSearchConfig(base_url="http://qdrant:6333", collection="skills"),
+        transport=httpx.MockTransport(_qdrant_handler(calls)),
+    )
+    router = SkillRouter(
+        _skills(),
+        vector_search=vector_search,
+        routing_config=RoutingConfig(mode="hybrid"),
+    )
+    calls.clear()
+
+    results = router.route_many(["Convert money", "Find flights"])
+
+    assert [url for _, url, _ in calls] == [
+        "http://qdrant:6333/collections/skills/points/search/batch"
+    ]
+    assert len(calls[0][2]["searches"]) == 2
+    assert [result.skill_id for result in results] == [
+        "finance.convert_currency",
+        "travel.search_flights",
+    ]
+    assert results[0].candidates[0].semantic_score == 0.9
+
+
+@pytest.mark.asyncio
+async def test_route_many_async_matches_sync_routing() -> None:
+    calls: list[tuple[str, str, dict | None]] = []
+    handler = _qdrant_handler(calls)
+    vector_search = QdrantVectorSearch(
+        VectorSearchConfig(base_url="http://qdrant:6333", collection="skills"),
+        transport=httpx.MockTransport(handler),
+        async_transport=httpx.MockTransport(handler),
+    )
+    router = SkillRouter(
+        _skills(),
+        vector_search=vector_search,
+        routing_config=RoutingConfig(mode="hybrid"),
+    )
+    queries = ["Convert money", "Find flights"]
+
+    expected = router.route_many(queries)
+    results = await router.route_many_async(queries)
+    await vector_search.aclose()
+
+    assert results == expected
+    assert calls[-1][1].endswith("/points/search/batch")
@@ -1,6 +1,8 @@
 from skillos.cache import MemoryCache
-from skillos.routing import RoutingResult, SkillCandidate
-from skillos.routing_cache import RoutingCache
+from skillos.routing import RoutingConfig, RoutingResult, SkillCandidate, SkillRouter
+from skillos.routing_cache import RoutingCache, normalized_query_hash, replay_routing_cache
+from skillos.skills.models import SkillMetadata
+from skillos.telemetry import hash_query
 
 
 def test_routing_cache_roundtrip() -> None:
@@ -58,3 +60,201 @@ def test_routing_cache_isolated_by_tenant() -> None:
     )
     cache_a.set("Find flights", None, result)
     assert cache_b.get("Find flights", None) is None
+
+
+class _CountingBackend(MemoryCache):
+    def __init__(self) -> None:
+        super().__init__()
+        self.gets = 0
+
+    def get(self, key: str) -> str | None:
+        self.gets += 1
+        return super().get(key)
+
+
+def _result(skill_id: str) -> RoutingResult:
+    return RoutingResult(
+        status="selected",
+        skill_id=skill_id,
+        internal_skill_id=skill_id.replace(".", "/", 1),
+        confidence=0.9,
+        candidates=[],
+        alternatives=[],
+    )
+
+
+def test_routing_cache_serves_hot_queries_from_local_layer() -> None:
+    backend = _CountingBackend()
+    cache = RoutingCache(backend, tenant_id="acme", ttl_seconds=60, prefix="skillos")
+    cache.set("Find flights", None, _result("travel.search_flights"))
+
+    for _ in range(3):
+        assert cache.get("Find flights").skill_id == "travel.search_flights"
+
+    assert backend.gets == 0
+    assert cache.stats() == {
+        "l1_hits": 3,
+        "l1_misses": 0,
+        "l2_hits": 0,
+        "l2_misses": 0,
+        "l1_size": 1,
+    }
+
+
+def test_routing_cache_promotes_backend_hits_and_bounds_local_layer() -> None:
+    backend = _CountingBackend()
+    writer = RoutingCache(backend, tenant_id="acme", ttl_seconds=60, prefix="skillos")
+    for query in ("a", "b", "c"):
+        writer.set(query, None, _result(f"skill.{query}"))
+    cache = RoutingCache(
+        backend,
+        tenant_id="acme",
+        ttl_seconds=60,
+        prefix="skillos",
+        local_max_entries=2,
+    )
+
+    assert cache.get("a").skill_id == "skill.a"
+    assert cache.get("a").skill_id == "skill.a"
+    cache.get("b")
+    cache.get("c")
+    cache.get("a")
+
+    stats = cache.stats()
+    assert backend.gets == 4
+    assert stats["l1_hits"] == 1
+    assert stats["l2_hits"] == 4
+    assert stats["l1_size"] == 2
+
+
+def test_routing_cache_version_change_invalidates_cached_routes() -> None:
+    backend = _CountingBackend()
+    cache = RoutingCache(backend, tenant_id="acme", ttl_seconds=60, prefix="skillos")
+    cache.observe_version(((3, 1.0), None))
+    cache.set("Find flights", None, _result("travel.search_flights"))
+
+    cache.observe_version(((3, 1.0), None))
+    assert cache.get("Find flights") is not None
+
+    cache.observe_version(((4, 2.0), None))
+    assert cache.get("Find flights") is None
+    assert cache.stats()["l1_size"] == 0
+
+
+def test_normalized_keys_share_entries_across_spelling_variants() -> None:
+    backend = MemoryCache()
+    normalized = RoutingCache(
+        backend,
+        tenant_id="acme",
+        ttl_seconds=60,
+        prefix="skillos",
+        key_mode="normalized",
+    )
+    raw = RoutingCache(backend, tenant_id="acme", ttl_seconds=60, prefix="skillos")
+    normalized.set("Summarize this document", None, _result("docs.summarize"))
+    raw.set("Summarize this document", None, _result("docs.summarize"))
+
+    assert normalized.get("summarize  this DOCUMENT!").skill_id == "docs.summarize"
+    assert raw.get("summarize  this DOCUMENT!") is None
+
+
+def test_normalized_keys_include_routing_config() -> None:
+    backend = MemoryCache()
+    hybrid = RoutingCache(
+        backend,
+        tenant_id="acme",
+        ttl_seconds=60,
+        prefix="skillos",
+        key_mode="normalized",
+        routing_config=RoutingConfig(mode="hybrid"),
+    )
+    keyword = RoutingCache(
+        backend,
+        tenant_id="acme",
+        ttl_seconds=60,
+        prefix="skillos",
+        key_mode="normalized",
+        routing_config=RoutingConfig(mode="keyword", keyword_weight=1.0, vector_weight=0.0),
+    )
+    hybrid.set("find flights", None, _result("travel.search_flights"))
+
+    assert keyword.get("find flights") is None
+
+
+def _skill(skill_id: str, description: str) -> SkillMetadata:
+    return SkillMetadata(
+        id=skill_id,
+        name=skill_id.split("/", 1)[1].replace("_", " ").title(),
+        description=description,
+        version="1.0.0",
+        entrypoint=f"implementations.{skill_id.replace('/', '.')}:run",
+    )
+
+
+def test_keyword_routing_drops_only_local_routes_using_changed_tokens() -> None:
+    config = RoutingConfig(mode="keyword")
+    router = SkillRouter(
+        [
+            _skill("travel/search_flights", "Find flights"),
+            _skill("finance/convert_currency", "Convert money"),
+            _skill("docs/summarize", "Summarize documents"),
+        ],
+        routing_config=config,
+    )
+    backend = _CountingBackend()
+    cache = RoutingCache(
+        backend, tenant_id="acme", ttl_seconds=60, prefix="skillos", routing_config=config
+    )
+    queries = ["find flights", "convert money", "summarize documents", "book hotels"]
+    cache.observe_version(((3, 1.0), None))
+    for query in queries:
+        cache.set(query, None, router.route(query))
+
+    changed = router.update(
+        [
+            _skill("travel/search_flights", "Find cheap airfare"),
+            _skill("travel/search_hotels", "Book hotels"),
+        ],
+        removed=["finance/convert_currency"],
+    )
+    cache.observe_version(((4, 2.0), None), changed_tokens=changed)
+
+    assert cache.get_local("summarize documents") is not None
+    for query in queries:
+        cached = cache.get_local(query)
+        if cached is not None:
+            assert cached == router.route(query)
+    assert cache.get_local("find flights") is None
+    assert cache.get_local("convert money") is None
+    assert cache.get_local("book hotels") is None
+    assert cache.get_remote("summarize documents") is None
+
+
+def test_hybrid_routing_clears_local_routes_on_any_registry_change() -> None:
+    cache = RoutingCache(_CountingBackend(), tenant_id="acme", ttl_seconds=60, prefix="skillos")
+    cache.observe_version(((3, 1.0), None))
+    cache.set("summarize documents", None, _result("docs.summarize"))
+
+    cache.observe_version(((4, 2.0), None), changed_tokens={"flights"})
+
+    assert cache.get_local("summarize documents") is None
+
+
+def test_replay_reports_hit_rate_for_both_key_schemes() -> None:
+    queries = ["Find flights", "find flights!", "Find flights", "convert money"]
+    events = [
+        {
+            "event": "request_received",
+            "query_hash": hash_query(query),
+            "normalized_query_hash": normalized_query_hash(query),
+        }
+        for query in queries
+    ]
+    events.append({"event": "routing_decision", "skill_id": "travel.search_flights"})
+
+    report = replay_routing_cache(events)
+
+    assert report.requests == 4
+    assert report.raw_hits == 1
+    assert report.normalized_hits == 2
+    assert report.normalized_hit_rate == 0.5
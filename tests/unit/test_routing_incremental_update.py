@@ -0,0 +1,182 @@
+import time
+
+import skillos.routing as routing
+from skillos.routing import RoutingConfig, SkillRouter
+from skillos.skills.models import SkillMetadata
+from skillos.vector_search import VectorMatch, VectorSearchError
+
+
+class _RecordingVectorSearch:
+    def __init__(self) -> None:
+        self.indexed: list[list[str]] = []
+        self.deleted: list[list[str]] = []
+        self.synced: list[list[str]] = []
+        self.ready = True
+        self.fail = False
+
+    def index(self, documents) -> None:
+        self._check()
+        self.indexed.append([doc.doc_id for doc in documents])
+
+    def sync(self, documents) -> None:
+        self._check()
+        self.synced.append(sorted(doc.doc_id for doc in documents))
+        self.indexed.append([doc.doc_id for doc in documents])
+
+    def _check(self) -> None:
+        if self.fail:
+            raise VectorSearchError("qdrant unavailable")
+
+    def delete(self, doc_ids) -> None:
+        self.deleted.append(list(doc_ids))
+
+    def search_many(self, queries, *, limit: int, min_score: float | None = None):
+        return [[] for _ in queries]
+
+
+def _skill(skill_id: str, description: str, tags: list[str]) -> SkillMetadata:
+    return SkillMetadata(
+        id=skill_id,
+        name=skill_id.split("/", 1)[1].replace("_", " ").title(),
+        description=description,
+        version="1.0.0",
+        entrypoint=f"implementations.{skill_id.replace('/', '.')}:run",
+        tags=tags,
+    )
+
+
+def test_update_patches_keyword_index_in_place() -> None:
+    router = SkillRouter(
+        [
+            _skill("travel/search_flights", "Find flights", ["travel"]),
+            _skill("finance/convert_currency", "Convert money", ["finance"]),
+        ],
+        routing_config=RoutingConfig(mode="keyword"),
+    )
+    assert router.route("convert money").skill_id == "finance.convert_currency"
+
+    router.update(
+        [
+            _skill("travel/search_flights", "Find cheap airfare", ["travel"]),
+            _skill("travel/search_hotels", "Book hotels", ["travel"]),
+        ],
+        removed=["finance/convert_currency"],
+    )
+
+    assert router.route("convert money").status == "no_skill_found"
+    assert router.route("cheap airfare").skill_id == "travel.search_flights"
+    assert router.route("book hotels", tags=["travel"]).skill_id == "travel.search_hotels"
+    assert router.route("book hotels", tags=["finance"]).status == "no_skill_found"
+
+
+def test_keyword_top_matches_follow_full_ranking() -> None:
+    skills = [
+        _skill(
+            f"finance/skill_{index:02d}",
+            "Convert money" if index % 3 else "Convert units",
+            ["finance" if index % 2 else "travel"],
+        )
+        for index in range(30)
+    ]
+    config = RoutingConfig(mode="keyword")
+    limited = SkillRouter(skills, routing_config=config)
+    # A neutral confidence provider sends every match through _rank.
+    ranked = SkillRouter(
+        skills, routing_config=config, confidence_provider=lambda _: 0.5
+    )
+
+    for tags in (None, ["finance"]):
+        for limit in (1, 3, 5):
+            expected = ranked.route("convert money", limit=limit, tags=tags)
+            assert limited.route("convert money", limit=limit, tags=tags) == expected
+
+    snapshot = limited._snapshot
+    limited.update(removed=["finance/skill_01"])
+    assert "finance.skill_01" in {
+        profile.public_id
+        for profile, _ in snapshot.keyword_index.match({"money"}, {"finance"}, False)
+    }
+    assert "finance.skill_01" not in {
+        candidate.skill_id
+        for candidate in limited.route("money", limit=30, tags=["finance"]).candidates
+    }
+
+
+def test_update_sends_only_changed_points_to_vector_backend() -> None:
+    vector_search = _RecordingVectorSearch()
+    router = SkillRouter(
+        [
+            _skill("travel/search_flights", "Find flights", ["travel"]),
+            _skill("finance/convert_currency", "Convert money", ["finance"]),
+            _skill("travel/search_hotels", "Book hotels", ["travel"]),
+        ],
+        vector_search=vector_search,
+    )
+    assert len(vector_search.indexed[0]) == 3
+
+    router.update(
+        [_skill("travel/search_flights", "Find cheap flights", ["travel"])],
+        removed=["finance/convert_currency"],
+    )
+
+    assert vector_search.indexed[1] == ["travel.search_flights"]
+    assert vector_search.deleted == [["finance.convert_currency"]]
+
+
+def test_query_in_flight_keeps_the_catalog_it_started_with() -> None:
+    class _UpdatingVectorSearch(_RecordingVectorSearch):
+        router: SkillRouter
+
+        def search_many(self, queries, *, limit: int, min_score: float | None = None):
+            # A registry reload lands between keyword and vector scoring.
+            self.router.update(removed=["finance/convert_currency"])
+            return [[VectorMatch("finance.convert_currency", 0.9)] for _ in queries]
+
+    vector_search = _UpdatingVectorSearch()
+    router = SkillRouter(
+        [
+            _skill("travel/search_flights", "Find flights", ["travel"]),
+            _skill("finance/convert_currency", "Convert money", ["finance"]),
+        ],
+        vector_search=vector_search,
+    )
+    vector_search.router = router
+
+    result = router.route("find flights")
+
+    assert {candidate.skill_id for candidate in result.candidates} == {
+        "travel.search_flights",
+        "finance.convert_currency",
+    }
+    assert router.route("convert money").skill_id != "finance.convert_currency"
+
+
+def test_vector_failure_marks_index_stale_and_resyncs(monkeypatch) -> None:
+    monkeypatch.setattr(routing, "_VECTOR_RETRY_SECONDS", 0.0)
+    vector_search = _RecordingVectorSearch()
+    router = SkillRouter(
+        [_skill("travel/search_flights", "Find flights", ["travel"])],
+        vector_search=vector_search,
+    )
+
+    vector_search.fail = True
+    router.update([_skill("travel/search_hotels", "Book hotels", ["travel"])])
+    vector_search.fail = False
+    router.update([_skill("finance/convert_currency", "Convert money", ["finance"])])
+
+    assert vector_search.synced[-1] == [
+        "finance.convert_currency",
+        "travel.search_flights",
+        "travel.search_hotels",
+    ]
+
+    vector_search.fail = True
+    router.update(removed=["finance/convert_currency"])
+    vector_search.fail = False
+    router.route("book hotels")
+    deadline = time.monotonic() + 2
+    while len(vector_search.synced) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert vector_search.synced[-1] == ["travel.search_flights", "travel.search_hotels"]
+    assert router._vector_search is vector_search
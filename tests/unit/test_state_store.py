@@ -0,0 +1,145 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import json
+from pathlib import Path
+
+from skillos.budget import (
+    BudgetConfig,
+    BudgetManager,
+    BudgetUsageStoreSqlite,
+    budget_usage_store_from_env,
+)
+from skillos.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerStoreSqlite,
+    circuit_breaker_store_from_env,
+)
+from skillos.experimentation import ExperimentState, ExperimentStoreSqlite
+from skillos.feedback import FeedbackOutcome, FeedbackStoreSqlite, FeedbackTracker
+from skillos.idempotency import IdempotencyStoreSqlite
+from skillos.schedules import ScheduleStoreSqlite, build_schedule
+from skillos.state_store import state_database
+
+
+def test_state_database_uses_wal(tmp_path: Path) -> None:
+    database = state_database(tmp_path / "state.db")
+
+    mode = database.execute("PRAGMA journal_mode").fetchone()[0]
+
+    assert mode == "wal"
+    assert state_database(tmp_path / "state.db") is database
+
+
+def test_sqlite_circuit_breaker_opens_and_resets(tmp_path: Path) -> None:
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    store = CircuitBreakerStoreSqlite(tmp_path / "state.db", now_provider=lambda: now)
+    breaker = CircuitBreaker(store, CircuitBreakerConfig(failure_threshold=2))
+
+    breaker.record_failure("travel/search")
+    breaker.record_failure("travel/search")
+
+    assert breaker.allow("travel/search").reason == "circuit_open"
+    breaker.record_success("travel/search")
+    breaker.flush()
+    assert store.get("travel/search").state == "closed"
+    assert breaker.allow("travel/search").allowed is True
+
+
+def test_sqlite_budget_counts_concurrent_charges(tmp_path: Path) -> None:
+    store = BudgetUsageStoreSqlite(tmp_path / "state.db")
+    config = BudgetConfig(
+        per_request_limit=5.0,
+        daily_limit=20.0,
+        monthly_limit=100.0,
+        low_remaining_threshold=0.0,
+        standard_cost=1.0,
+    )
+    now = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    manager = BudgetManager(store, config, now_provider=lambda: now)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: manager.authorize(), range(30)))
+
+    assert sum(result.allowed for result in results) == 20
+    usage = store.load()
+    assert usage.daily == {"2026-01-02": 20.0}
+    assert usage.monthly == {"2026-01": 20.0}
+
+
+def test_sqlite_idempotency_blocks_until_expiry(tmp_path: Path) -> None:
+    current = {"now": datetime(2026, 1, 1, tzinfo=timezone.utc)}
+    store = IdempotencyStoreSqlite(
+        tmp_path / "state.db", now_provider=lambda: current["now"]
+    )
+
+    first = store.check_and_record("webhook", "travel/search", "abc", ttl_seconds=60)
+    second = store.check_and_record("webhook", "travel/search", "abc", ttl_seconds=60)
+    current["now"] += timedelta(seconds=61)
+    third = store.check_and_record("webhook", "travel/search", "abc", ttl_seconds=60)
+
+    assert first.allowed is True
+    assert second.allowed is False
+    assert second.expires_at == first.expires_at
+    assert third.allowed is True
+
+
+def test_sqlite_feedback_version_changes_on_write(tmp_path: Path) -> None:
+    tracker = FeedbackTracker(FeedbackStoreSqlite(tmp_path / "state.db"))
+    before = tracker.version()
+
+    tracker.record_feedback("travel/search", FeedbackOutcome.POSITIVE)
+
+    assert tracker.version() != before
+    assert tracker.get_confidence("travel/search") > 0.5
+
+
+def test_sqlite_experiments_and_schedules_round_trip(tmp_path: Path) -> None:
+    experiments = ExperimentStoreSqlite(tmp_path / "state.db")
+    experiments.upsert("exp", ExperimentState(baseline_variant="a", active_variant="b"))
+    schedules = ScheduleStoreSqlite(tmp_path / "state.db")
+    later = build_schedule("travel/search", datetime(2026, 2, 1, tzinfo=timezone.utc))
+    sooner = build_schedule("travel/search", datetime(2026, 1, 1, tzinfo=timezone.utc))
+
+    schedules.save([later, sooner])
+    schedules.save([later])
+
+    assert experiments.get("exp").active_variant == "b"
+    assert [record.schedule_id for record in schedules.load()] == [later.schedule_id]
+
+
+def test_sqlite_stores_import_legacy_json_once(tmp_path: Path) -> None:
+    circuit_path = tmp_path / "runtime" / "circuit_breaker.json"
+    circuit_path.parent.mkdir(parents=True)
+    circuit_path.write_text(
+        json.dumps({"states": {"travel/search": {"state": "open", "failure_count": 5}}}),
+        encoding="utf-8",
+    )
+    budget_path = tmp_path / "budget" / "usage.json"
+    budget_path.parent.mkdir(parents=True)
+    budget_path.write_text(
+        json.dumps({"daily": {"2026-01-01": 3.0}, "monthly": {"2026-01": 7.5}}),
+        encoding="utf-8",
+    )
+
+    first = CircuitBreakerStoreSqlite(tmp_path / "state.db", legacy_path=circuit_path)
+    budget = BudgetUsageStoreSqlite(tmp_path / "state.db", legacy_path=budget_path)
+    first.put("travel/search", first.get("travel/search"))
+    first.put("other/skill", first.get("travel/search"))
+    CircuitBreakerStoreSqlite(tmp_path / "state.db", legacy_path=circuit_path)
+
+    assert first.get("travel/search").state == "open"
+    assert sorted(first.load()) == ["other/skill", "travel/search"]
+    assert budget.load().monthly == {"2026-01": 7.5}
+
+
+def test_store_factories_select_sqlite_backend(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("SKILLOS_STORAGE_BACKEND", "sqlite")
+
+    circuit_store = circuit_breaker_store_from_env(tmp_path)
+    budget_store = budget_usage_store_from_env(tmp_path)
+
+    assert isinstance(circuit_store, CircuitBreakerStoreSqlite)
+    assert isinstance(budget_store, BudgetUsageStoreSqlite)
+    assert circuit_store.path == budget_store.path
+    assert circuit_store.path.name == "state.db"
@@ -0,0 +1,143 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from skillos.log_segments import LogRotationConfig, rotate_log
+from skillos.telemetry_archive import (
+    TelemetryQuery,
+    TelemetryQueryError,
+    compact_segments,
+    default_archive_path,
+    parse_time_bound,
+    query_archive,
+)
+
+DAY = datetime(2026, 3, 2, 12, 0, tzinfo=timezone.utc)
+
+
+def _seal(log_path, events) -> None:
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    with log_path.open("a", encoding="utf-8") as handle:
+        for event in events:
+            handle.write(json.dumps(event) + "\n")
+    rotate_log(log_path, LogRotationConfig())
+
+
+def _result(moment: datetime, skill_id: str | None, duration_ms: float, **extra) -> dict:
+    event = {
+        "timestamp": moment.isoformat(),
+        "event": "execution_result",
+        "request_id": "req",
+        "status": "success" if skill_id else "error",
+        "duration_ms": duration_ms,
+        "payload": {"nested": True},
+        **extra,
+    }
+    if skill_id:
+        event["skill_id"] = skill_id
+    return event
+
+
+def test_compaction_partitions_by_day_and_event_and_is_idempotent(tmp_path) -> None:
+    log_path = tmp_path / "logs" / "execution.log"
+    _seal(
+        log_path,
+        [
+            _result(DAY, "travel.search_flights", 10),
+            _result(DAY + timedelta(days=1), "travel.search_flights", 20),
+            {"timestamp": DAY.isoformat(), "event": "request_received"},
+        ],
+    )
+
+    written = compact_segments(log_path)
+    archive = default_archive_path(log_path)
+
+    assert sorted(path.relative_to(archive).parts[:2] for path in written) == [
+        ("date=2026-03-02", "event=execution_result"),
+        ("date=2026-03-02", "event=request_received"),
+        ("date=2026-03-03", "event=execution_result"),
+    ]
+    with np.load(written[0]) as part:
+        assert "payload" not in part.files
+        assert part["duration_ms"].dtype == np.float64
+    assert compact_segments(log_path) == []
+
+
+def test_query_groups_and_computes_percentiles(tmp_path) -> None:
+    log_path = tmp_path / "execution.log"
+    _seal(log_path, [_result(DAY, "docs.summarize", float(value)) for value in range(1, 101)])
+    _seal(
+        log_path,
+        [
+            _result(DAY, "travel.search_flights", 5),
+            _result(DAY, None, 7, error_class="Timeout"),
+        ],
+    )
+    compact_segments(log_path)
+
+    rows = query_archive(
+        default_archive_path(log_path),
+        TelemetryQuery(
+            event="execution_result",
+            metric="duration_ms",
+            group_by=("skill_id",),
+            aggregates=("count", "p95", "max", "mean"),
+        ),
+    )
+
+    assert rows == [
+        {"skill_id": "", "count": 1, "p95": 7.0, "max": 7.0, "mean": 7.0},
+        {
+            "skill_id": "docs.summarize",
+            "count": 100,
+            "p95": pytest.approx(95.05),
+            "max": 100.0,
+            "mean": 50.5,
+        },
+        {"skill_id": "travel.search_flights", "count": 1, "p95": 5.0, "max": 5.0, "mean": 5.0},
+    ]
+
+
+def test_query_prunes_partitions_outside_window(tmp_path, monkeypatch) -> None:
+    log_path = tmp_path / "execution.log"
+    _seal(log_path, [_result(DAY - timedelta(days=1), "a.b", 1)])
+    _seal(log_path, [_result(DAY, "a.b", 2), _result(DAY, "a.b", 4)])
+    compact_segments(log_path)
+    opened = []
+    original = np.load
+
+    def tracking_load(path, *args, **kwargs):
+        opened.append(path)
+        return original(path, *args, **kwargs)
+
+    monkeypatch.setattr(np, "load", tracking_load)
+    rows = query_archive(
+        default_archive_path(log_path),
+        TelemetryQuery(
+            event="execution_result",
+            metric="duration_ms",
+            aggregates=("sum",),
+            since=parse_time_bound("2026-03-02"),
+            until=parse_time_bound("2026-03-02", end=True),
+        ),
+    )
+
+    assert rows == [{"sum": 6.0}]
+    assert len(opened) == 1
+
+
+def test_query_rejects_metric_aggregate_without_metric(tmp_path) -> None:
+    with pytest.raises(TelemetryQueryError):
+        query_archive(tmp_path, TelemetryQuery(event="execution_result", aggregates=("p95",)))
+
+
+def test_parse_time_bound_resolves_day_keywords() -> None:
+    now = datetime(2026, 3, 3, 8, 30, tzinfo=timezone.utc)
+
+    assert parse_time_bound("yesterday", now=now) == datetime(2026, 3, 2, tzinfo=timezone.utc)
+    assert parse_time_bound("yesterday", end=True, now=now).date().isoformat() == "2026-03-02"
+    assert parse_time_bound("2026-03-02T10:00:00") == datetime(
+        2026, 3, 2, 10, tzinfo=timezone.utc
+    )
@@ -2,7 +2,7 @@ import json
 
 import pytest
 
-from skillos.telemetry import EventLogger, LogSchemaError, hash_query
+from skillos.telemetry import EventLogger, LogSchemaError, event_schema, hash_query
 
 
 def test_log_schema_requires_fields(tmp_path):
@@ -35,3 +35,47 @@ def test_log_redacts_pii(tmp_path):
     entry = json.loads(log_path.read_text(encoding="utf-8").splitlines()[0])
     assert "test@example.com" not in entry["query"]
     assert "[REDACTED]" in entry["query"]
+
+
+def test_log_redacts_fields_outside_the_event_schema(tmp_path):
+    log_path = tmp_path / "events.log"
+    logger = EventLogger(log_path, request_id="req-003")
+
+    logger.log(
+        "execution_result",
+        status="error",
+        duration_ms=12.5,
+        error="Failed to email jane@example.com",
+    )
+
+    entry = json.loads(log_path.read_text(encoding="utf-8").splitlines()[0])
+    assert entry["error"] == "Failed to email [REDACTED]"
+    assert entry["duration_ms"] == 12.5
+
+
+def test_log_redacts_free_text_reasons_and_corrections(tmp_path):
+    log_path = tmp_path / "events.log"
+    logger = EventLogger(log_path, request_id="req-004")
+
+    logger.log(
+        "webhook_received",
+        trigger_id="t1",
+        skill_id="billing/refund",
+        status="error",
+        status_code=401,
+        reason="Invalid signature from jane@example.com",
+        correction="route jane@example.com to billing",
+    )
+
+    entry = json.loads(log_path.read_text(encoding="utf-8").splitlines()[0])
+    assert entry["reason"] == "Invalid signature from [REDACTED]"
+    assert "jane@example.com" not in entry["correction"]
+
+
+def test_event_schemas_are_compiled_once():
+    assert event_schema("routing_candidates") is event_schema("routing_candidates")
+    schema = event_schema("routing_candidates")
+    assert {"request_id", "candidates", "routing_latency_ms"} <= schema.required
+    assert "candidates" in schema.verbatim
+    assert "query" not in schema.verbatim
+    assert "reason" not in schema.verbatim
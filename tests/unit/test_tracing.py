@@ -0,0 +1,113 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+
+from skillos.tracing import Tracer, TracingConfig, submit_in_context
+
+
+def test_spans_nest_across_threads_and_to_thread() -> None:
+    tracer = Tracer(TracingConfig(sample_rate=1.0))
+
+    def step(name: str) -> None:
+        with tracer.span(name):
+            pass
+
+    async def handler() -> None:
+        with tracer.span("async_root"):
+            await asyncio.to_thread(step, "to_thread")
+
+    with tracer.span("root", route="a") as root:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for future in [submit_in_context(executor, step, f"pooled{index}") for index in range(2)]:
+                future.result()
+    asyncio.run(handler())
+
+    spans = {span.name: span for span in tracer.spans()}
+    assert spans["pooled0"].parent_id == root.span_id
+    assert spans["pooled1"].trace_id == root.trace_id
+    assert spans["root"].parent_id is None
+    assert spans["root"].attributes == {"route": "a"}
+    assert spans["to_thread"].parent_id == spans["async_root"].span_id
+    assert spans["async_root"].trace_id != root.trace_id
+    assert all(span.end_ns >= span.start_ns for span in spans.values())
+
+
+def test_unsampled_requests_record_nothing() -> None:
+    tracer = Tracer(TracingConfig(sample_rate=0.0))
+
+    with tracer.span("root") as root:
+        root.set_attribute("ignored", True)
+        with tracer.span("child"):
+            pass
+
+    assert tracer.spans() == []
+
+
+def test_ring_buffer_keeps_latest_spans_and_marks_errors() -> None:
+    tracer = Tracer(TracingConfig(sample_rate=1.0, buffer_size=2))
+
+    for index in range(3):
+        with tracer.span(f"span{index}"):
+            pass
+    try:
+        with tracer.span("failing"):
+            raise KeyError("boom")
+    except KeyError:
+        pass
+
+    assert [span.name for span in tracer.spans()] == ["span2", "failing"]
+    assert tracer.spans()[-1].error == "KeyError"
+
+
+def test_export_writes_otlp_json_lines(tmp_path) -> None:
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(
+        TracingConfig(sample_rate=1.0, export_path=path, export_interval_ms=0)
+    )
+
+    with tracer.span("root", skill_id="travel.search_flights", attempt=2):
+        with tracer.span("child"):
+            pass
+
+    assert tracer.flush(timeout=5)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    resource = json.loads(lines[0])["resourceSpans"][0]
+    assert resource["resource"]["attributes"] == [
+        {"key": "service.name", "value": {"stringValue": "skillos"}}
+    ]
+    child, root = resource["scopeSpans"][0]["spans"]
+    assert child["parentSpanId"] == root["spanId"]
+    assert "parentSpanId" not in root
+    assert root["attributes"] == [
+        {"key": "skill_id", "value": {"stringValue": "travel.search_flights"}},
+        {"key": "attempt", "value": {"intValue": "2"}},
+    ]
+    assert int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+    assert root["status"] == {"code": 1}
+    assert tracer.spans() == []
+
+
+def test_root_span_hands_export_to_background_thread(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "traces.jsonl"
+    tracer = Tracer(
+        TracingConfig(sample_rate=1.0, export_path=path, export_interval_ms=0)
+    )
+    caller = threading.get_ident()
+    writers = []
+    original_write = tracer._write
+
+    def recording_write(target, spans):
+        writers.append(threading.get_ident())
+        original_write(target, spans)
+
+    monkeypatch.setattr(tracer, "_write", recording_write)
+
+    with tracer.span("root"):
+        pass
+
+    assert tracer.spans() == []
+    assert tracer.flush(timeout=5)
+    assert writers and caller not in writers
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from skillos.vector_search import QdrantVectorSearch, VectorSearchConfig
+
+
+class _QdrantStub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set[int] = set()
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        type(self).connections.add(id(self.connection))
+        searches = payload.get("searches", [payload])
+        result = [
+            [{"score": 0.9, "payload": {"skill_id": "travel.search_flights"}}]
+            for _ in searches
+        ]
+        if "searches" not in payload:
+            result = result[0]
+        body = json.dumps({"result": result}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        return None
+
+
+@pytest.fixture()
+def qdrant_url():
+    _QdrantStub.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _QdrantStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_sync_searches_reuse_one_connection(qdrant_url: str) -> None:
+    search = QdrantVectorSearch(
+        VectorSearchConfig(base_url=qdrant_url, collection="skills")
+    )
+    try:
+        for _ in range(3):
+            matches = search.search("find flights", limit=1)
+            assert matches[0].doc_id == "travel.search_flights"
+    finally:
+        search.close()
+
+    assert search.connection_stats() == {
+        "requests": 3,
+        "pool_hits": 2,
+        "new_connections": 1,
+    }
+    assert len(_QdrantStub.connections) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_searches_reuse_one_connection(qdrant_url: str) -> None:
+    search = QdrantVectorSearch(
+        VectorSearchConfig(base_url=qdrant_url, collection="skills")
+    )
+    try:
+        for _ in range(3):
+            batches = await search.search_many_async(
+                ["find flights", "book flights"], limit=1
+            )
+            assert [len(matches) for matches in batches] == [1, 1]
+    finally:
+        await search.aclose()
+
+    stats = search.connection_stats()
+    assert stats["requests"] == 3
+    assert stats["new_connections"] == 1
+
+
+def test_new_loop_client_closes_the_previous_one(qdrant_url: str) -> None:
+    search = QdrantVectorSearch(
+        VectorSearchConfig(base_url=qdrant_url, collection="skills")
+    )
+
+    async def one_search():
+        await search.search_many_async(["find flights"], limit=1)
+        return search._async_client
+
+    first = asyncio.run(one_search())
+    second = asyncio.run(one_search())
+    search.close()
+
+    assert first is not second
+    assert first.is_closed
+    assert second.is_closed
@@ -0,0 +1,103 @@
+import json
+
+import httpx
+
+from skillos.vector_search import (
+    LocalVectorSearch,
+    LocalVectorSearchConfig,
+    QdrantVectorSearch,
+    VectorDocument,
+    VectorSearchConfig,
+)
+
+
+class _QdrantCollection:
+    """Minimal stateful Qdrant stand-in for upsert/scroll/delete."""
+
+    def __init__(self) -> None:
+        self.points: dict[str, dict[str, object]] = {}
+        self.upserted: list[str] = []
+        self.deleted: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        body = json.loads(request.content) if request.content else {}
+        if request.method == "PUT" and path.endswith("/points"):
+            for point in body["points"]:
+                self.points[point["id"]] = point["payload"]
+                self.upserted.append(point["id"])
+            return httpx.Response(200, json={"result": {}})
+        if path.endswith("/points/scroll"):
+            ids = sorted(self.points)
+            start = ids.index(body["offset"]) if "offset" in body else 0
+            page = ids[start : start + body["limit"]]
+            rest = ids[start + body["limit"] :]
+            return httpx.Response(
+                200,
+                json={
+                    "result": {
+                        "points": [
+                            {"id": point_id, "payload": self.points[point_id]}
+                            for point_id in page
+                        ],
+                        "next_page_offset": rest[0] if rest else None,
+                    }
+                },
+            )
+        if path.endswith("/points/delete"):
+            for point_id in body["points"]:
+                self.points.pop(point_id, None)
+                self.deleted.append(point_id)
+            return httpx.Response(200, json={"result": {}})
+        return httpx.Response(200, json={"result": {}})
+
+
+def _documents(texts: dict[str, str]) -> list[VectorDocument]:
+    return [VectorDocument(doc_id=doc_id, text=text) for doc_id, text in texts.items()]
+
+
+def _qdrant(collection: _QdrantCollection) -> QdrantVectorSearch:
+    return QdrantVectorSearch(
+        VectorSearchConfig(
+            base_url="http://qdrant:6333", collection="skills", upsert_batch_size=2
+        ),
+        transport=httpx.MockTransport(collection),
+    )
+
+
+def test_qdrant_sync_skips_unchanged_points_on_restart() -> None:
+    collection = _QdrantCollection()
+    catalog = {"a": "find flights", "b": "convert money", "c": "book hotels"}
+    _qdrant(collection).sync(_documents(catalog))
+    assert sorted(collection.upserted) == ["a", "b", "c"]
+
+    collection.upserted.clear()
+    _qdrant(collection).sync(_documents(catalog))
+
+    assert collection.upserted == []
+    assert collection.deleted == []
+
+
+def test_qdrant_sync_upserts_changes_and_deletes_stale_points() -> None:
+    collection = _QdrantCollection()
+    _qdrant(collection).sync(
+        _documents({"a": "find flights", "b": "convert money", "c": "book hotels"})
+    )
+    collection.upserted.clear()
+
+    _qdrant(collection).sync(
+        _documents({"a": "find cheap flights", "c": "book hotels", "d": "rent cars"})
+    )
+
+    assert sorted(collection.upserted) == ["a", "d"]
+    assert collection.deleted == ["b"]
+    assert sorted(collection.points) == ["a", "c", "d"]
+
+
+def test_local_sync_drops_documents_missing_from_catalog(tmp_path) -> None:
+    search = LocalVectorSearch(LocalVectorSearchConfig(path=tmp_path / "skills.npy"))
+    search.sync(_documents({"a": "find flights", "b": "convert money"}))
+
+    search.sync(_documents({"a": "find flights"}))
+
+    assert search.doc_ids == ["a"]
@@ -0,0 +1,108 @@
+import json
+import threading
+
+import httpx
+
+from skillos.routing import RoutingConfig, SkillRouter
+from skillos.skills.models import SkillMetadata
+from skillos.vector_search import QdrantVectorSearch, VectorDocument, VectorSearchConfig
+
+
+def _documents(count: int) -> list[VectorDocument]:
+    return [
+        VectorDocument(doc_id=f"skill_{index}", text=f"skill number {index}")
+        for index in range(count)
+    ]
+
+
+class _Qdrant:
+    def __init__(self, release: threading.Event | None = None) -> None:
+        self.upserts: list[tuple[str, int]] = []
+        self.release = release
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.method == "PUT" and request.url.path.endswith("/points"):
+            if self.release is not None:
+                self.release.wait(timeout=5)
+            points = json.loads(request.content)["points"]
+            with self._lock:
+                self.upserts.append((request.url.params["wait"], len(points)))
+            return httpx.Response(200, json={"result": {}})
+        if request.url.path.endswith("/points/search/batch"):
+            searches = json.loads(request.content)["searches"]
+            return httpx.Response(
+                200,
+                json={
+                    "result": [
+                        [{"score": 0.9, "payload": {"skill_id": "travel.search_flights"}}]
+                        for _ in searches
+                    ]
+                },
+            )
+        return httpx.Response(200, json={"result": {}})
+
+
+def _config(**overrides) -> VectorSearchConfig:
+    return VectorSearchConfig(
+        base_url="http://qdrant:6333", collection="skills", **overrides
+    )
+
+
+def test_index_uploads_documents_in_bounded_chunks() -> None:
+    qdrant = _Qdrant()
+    search = QdrantVectorSearch(
+        _config(upsert_batch_size=4, upsert_parallelism=3),
+        transport=httpx.MockTransport(qdrant),
+    )
+
+    search.index(_documents(10))
+
+    assert sorted(size for _, size in qdrant.upserts) == [2, 4, 4]
+    assert {wait for wait, _ in qdrant.upserts} == {"true"}
+    assert search.ready
+
+
+def test_background_index_ends_with_waiting_upsert() -> None:
+    qdrant = _Qdrant()
+    search = QdrantVectorSearch(
+        _config(upsert_batch_size=3, background_index=True),
+        transport=httpx.MockTransport(qdrant),
+    )
+
+    search.index(_documents(7))
+    search.close()
+
+    assert [wait for wait, _ in qdrant.upserts] == ["false", "false", "true"]
+    assert qdrant.upserts[-1][1] == 1
+    assert search.ready
+
+
+def test_router_serves_keyword_results_until_background_index_is_ready() -> None:
+    release = threading.Event()
+    qdrant = _Qdrant(release)
+    search = QdrantVectorSearch(
+        _config(background_index=True),
+        transport=httpx.MockTransport(qdrant),
+    )
+    skill = SkillMetadata(
+        id="travel/search_flights",
+        name="Search Flights",
+        description="Find flights",
+        version="1.0.0",
+        entrypoint="implementations.travel.search_flights:run",
+        tags=["travel"],
+    )
+    router = SkillRouter(
+        [skill], vector_search=search, routing_config=RoutingConfig(mode="hybrid")
+    )
+
+    assert not search.ready
+    pending = router.route("find flights")
+    release.set()
+    search.close()
+    indexed = router.route("find flights")
+
+    assert pending.skill_id == indexed.skill_id == "travel.search_flights"
+    assert pending.candidates[0].semantic_score == 0.0
+    assert indexed.candidates[0].semantic_score == 0.9